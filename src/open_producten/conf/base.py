@@ -11,6 +11,7 @@ INSTALLED_APPS += [
     # 'django.contrib.admindocs',
     # 'django.contrib.humanize',
     # 'django.contrib.sitemaps',
+    "django.contrib.postgres",
     # External applications.
     # Project applications.
     "rest_framework.authtoken",
@@ -36,6 +37,11 @@ ENABLE_ADMIN_NAV_SIDEBAR = config("ENABLE_ADMIN_NAV_SIDEBAR", default=False)
 # multiple login urls defined.
 LOGIN_URLS = [reverse_lazy("admin:login")]
 
+# Cache used for API responses and the number of seconds they are kept. Cached
+# responses are invalidated by signals when the underlying data changes.
+API_CACHE = "default"
+API_CACHE_TIMEOUT = config("API_CACHE_TIMEOUT", default=60 * 60 * 24)
+
 # Default (connection timeout, read timeout) for the requests library (in seconds)
 REQUESTS_DEFAULT_TIMEOUT = (10, 30)
 
@@ -89,4 +95,5 @@ SPECTACULAR_SETTINGS = {  # TODO: may need to be expanded.
     "DESCRIPTION": _DESCRIPTION,
     "TOS": None,
     "VERSION": API_VERSION,
+    "GET_LIB_DOC_EXCLUDES": "open_producten.utils.schema.get_lib_doc_excludes",
 }
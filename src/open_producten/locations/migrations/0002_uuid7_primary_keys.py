@@ -0,0 +1,64 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:30
+
+from django.db import migrations, models
+import open_producten.utils.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("locations", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contact",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="location",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="neighbourhood",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="organisation",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="organisationtype",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
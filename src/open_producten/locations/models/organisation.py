@@ -2,6 +2,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from ...utils.models import BaseModel
+from ...utils.search import trigram_index
 from .location import BaseLocation
 
 
@@ -66,6 +67,7 @@ class Organisation(BaseLocation):
     class Meta:
         verbose_name = _("Organisation")
         verbose_name_plural = _("Organisations")
+        indexes = [trigram_index("name", name="organisation_name_trgm_idx")]
 
     def __str__(self):
         return f"{self.name}"
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProductenConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "open_producten.products"
+
+    def ready(self):
+        from . import signals  # noqa
@@ -0,0 +1,116 @@
+"""
+Streaming export of the products of a product type, with the value of every field
+of the product type as a column.
+
+The products and their data are read with two server side cursors ordered by
+product id and merged while streaming, so only the current product is held in
+memory.
+"""
+
+import csv
+from collections.abc import Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from open_producten.producttypes.models import ProductType
+
+from .models import Data, Product
+
+PRODUCT_COLUMNS = (
+    "id",
+    "bsn",
+    "kvk",
+    "start_date",
+    "end_date",
+    "published",
+    "created_on",
+    "updated_on",
+)
+
+EXPORT_FORMATS = ("csv", "ndjson")
+
+CONTENT_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def get_field_columns(product_type: ProductType) -> dict:
+    """
+    Returns the column name of every field of the product type by field id, the id
+    is added to names that are used by more than one column.
+    """
+    fields = list(product_type.fields.order_by("name", "id").values_list("id", "name"))
+    names = [*PRODUCT_COLUMNS, *(name for _id, name in fields)]
+    return {
+        field_id: name if names.count(name) == 1 else f"{name} ({field_id})"
+        for field_id, name in fields
+    }
+
+
+def iter_product_rows(
+    product_type: ProductType, field_columns: dict, chunk_size: int = 2000
+) -> Iterator[dict]:
+    products = (
+        Product.objects.filter(product_type=product_type)
+        .order_by("id")
+        .values_list(*PRODUCT_COLUMNS)
+        .iterator(chunk_size=chunk_size)
+    )
+    data = (
+        Data.objects.filter(product__product_type=product_type)
+        .order_by("product_id")
+        .values_list("product_id", "field_id", "value")
+        .iterator(chunk_size=chunk_size)
+    )
+
+    data_entry = next(data, None)
+    for product in products:
+        row = dict(zip(PRODUCT_COLUMNS, product))
+        row.update(dict.fromkeys(field_columns.values()))
+
+        # data of products of which the product type changed are skipped.
+        while data_entry is not None and data_entry[0] <= row["id"]:
+            product_id, field_id, value = data_entry
+            if product_id == row["id"] and field_id in field_columns:
+                row[field_columns[field_id]] = value
+            data_entry = next(data, None)
+
+        yield row
+
+
+class _Echo:
+    """
+    A file like object of which ``write`` returns the value, so the csv writer
+    can be used to format single rows.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows: Iterable[dict], columns: list[str]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(row.values())
+
+
+def iter_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        yield encoder.encode(row) + "\n"
+
+
+def export_products(
+    product_type: ProductType, export_format: str, chunk_size: int = 2000
+) -> Iterator[str]:
+    """
+    Returns the export of the products of the product type as an iterator of lines.
+    """
+    field_columns = get_field_columns(product_type)
+    rows = iter_product_rows(product_type, field_columns, chunk_size=chunk_size)
+
+    if export_format == "csv":
+        return iter_csv(rows, [*PRODUCT_COLUMNS, *field_columns.values()])
+    return iter_ndjson(rows)
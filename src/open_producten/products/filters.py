@@ -0,0 +1,106 @@
+import re
+import uuid
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+
+from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
+
+from open_producten.producttypes.models import Field
+
+from .models import Data, Product
+from .models.validators import get_compiled_field
+
+DATA_FILTER_PATTERN = re.compile(r"^data\[(?P<field_id>[^\]]+)\]\[(?P<lookup>\w+)\]$")
+
+ORDERED_LOOKUPS = ("exact", "gt", "gte", "lt", "lte")
+
+# the lookups that can be used on the typed column of a field type.
+COLUMN_LOOKUPS = {
+    "value_number": ORDERED_LOOKUPS,
+    "value_date": ORDERED_LOOKUPS,
+    "value_datetime": ORDERED_LOOKUPS,
+    "value_boolean": ("exact",),
+    "value_json": ("contains",),
+}
+
+
+class ProductFilterSet(filters.FilterSet):
+    """
+    Besides the declared filters, products can be filtered on the typed value of
+    their data with ``data[<field_id>][<lookup>]=<value>``, which is answered from the
+    partial index of the typed column of the field.
+    """
+
+    class Meta:
+        model = Product
+        fields = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        for field_id, conditions in self.get_data_conditions().items():
+            queryset = queryset.filter(
+                pk__in=Data.objects.filter(field_id=field_id, **conditions).values(
+                    "product_id"
+                )
+            )
+        return queryset
+
+    def get_data_conditions(self) -> dict[uuid.UUID, dict]:
+        """
+        Parses the data filters of the query into the lookups on the typed column
+        per field, the fields are fetched with a single query.
+        """
+        filters_by_field = defaultdict(list)
+        errors = {}
+        for key in self.data:
+            match = DATA_FILTER_PATTERN.match(key)
+            if not match:
+                continue
+
+            try:
+                field_id = uuid.UUID(match["field_id"])
+            except ValueError:
+                errors[key] = [f"{match['field_id']} is not a valid field id"]
+                continue
+            filters_by_field[field_id].append(
+                (key, match["lookup"], self.data.get(key))
+            )
+
+        fields = Field.objects.in_bulk(filters_by_field.keys())
+
+        conditions = defaultdict(dict)
+        for field_id, field_filters in filters_by_field.items():
+            field = fields.get(field_id)
+            if field is None:
+                for key, _lookup, _value in field_filters:
+                    errors[key] = [f"Field id {field_id} does not exist"]
+                continue
+
+            compiled = get_compiled_field(field)
+            lookups = COLUMN_LOOKUPS.get(compiled.column, ())
+            for key, lookup, value in field_filters:
+                if lookup not in lookups:
+                    errors[key] = [
+                        f"lookup {lookup} is not supported for field type {field.type}"
+                    ]
+                    continue
+
+                if compiled.column == "value_json":
+                    conditions[field_id][f"{compiled.column}__{lookup}"] = [value]
+                    continue
+
+                try:
+                    compiled.validate(value)
+                except DjangoValidationError as e:
+                    errors[key] = e.messages
+                    continue
+                conditions[field_id][f"{compiled.column}__{lookup}"] = compiled.parse(
+                    value
+                )
+
+        if errors:
+            raise ValidationError(errors)
+        return conditions
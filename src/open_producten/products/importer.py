@@ -0,0 +1,193 @@
+"""
+Import of products with their data from NDJSON, one product per line in the format
+of the product api.
+
+The lines are read incrementally and imported in chunks. Every chunk is validated
+in memory against the product types and fields, which are fetched once, and the
+valid products and data are written with ``COPY`` in a single transaction together
+with the progress of the import. An import that stopped can therefore be resumed
+after its last committed chunk.
+"""
+
+import json
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import NamedTuple
+
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from open_producten.producttypes.models import Field, ProductType
+from open_producten.utils.models import copy_insert
+
+from .models import Data, Product, ProductImport
+from .models.data import TYPED_VALUE_FIELDS, build_product_data
+
+PRODUCT_ATTRIBUTES = ("bsn", "kvk", "start_date", "end_date", "published")
+
+PRODUCT_COPY_FIELDS = (
+    "id",
+    "product_type",
+    *PRODUCT_ATTRIBUTES,
+    "created_on",
+    "updated_on",
+)
+DATA_COPY_FIELDS = ("id", "product", "field", "value", *TYPED_VALUE_FIELDS)
+
+
+class Reject(NamedTuple):
+    line: int
+    errors: dict
+    input: str
+
+
+def _to_uuid(value) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+class ProductImporter:
+    def __init__(self, product_import: ProductImport, chunk_size: int = 5000):
+        self.product_import = product_import
+        self.chunk_size = chunk_size
+
+        self.product_types = dict(ProductType.objects.values_list("id", "name"))
+        self.fields = Field.objects.in_bulk()
+        self.required_fields = defaultdict(list)
+        for field in self.fields.values():
+            if field.is_required:
+                self.required_fields[field.product_type_id].append(field)
+
+    def run(self, lines: Iterable[str | bytes]) -> Iterator[list[Reject]]:
+        """
+        Imports the lines after the committed lines of the import, the rejects of
+        every chunk are returned after the chunk is committed.
+        """
+        numbered_lines = islice(
+            enumerate(lines, start=1), self.product_import.committed_lines, None
+        )
+        while chunk := list(islice(numbered_lines, self.chunk_size)):
+            yield self.import_chunk(chunk)
+
+        self.product_import.finished = True
+        self.product_import.save(update_fields=("finished", "updated_on"))
+
+    def import_chunk(self, chunk: list[tuple[int, str | bytes]]) -> list[Reject]:
+        products, data, rejects = [], [], []
+        for line_number, line in chunk:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            if not line.strip():
+                continue
+
+            try:
+                product, entries = self.build_product(line)
+            except ValidationError as e:
+                rejects.append(Reject(line_number, e.message_dict, line.rstrip("\n")))
+                continue
+            products.append(product)
+            data.extend(entries)
+
+        product_import = self.product_import
+        with transaction.atomic():
+            copy_insert(Product, products, PRODUCT_COPY_FIELDS)
+            copy_insert(Data, data, DATA_COPY_FIELDS)
+            ProductImport.objects.filter(pk=product_import.pk).update(
+                committed_lines=chunk[-1][0],
+                imported_count=F("imported_count") + len(products),
+                rejected_count=F("rejected_count") + len(rejects),
+                updated_on=timezone.now(),
+            )
+
+        # the progress is only changed in memory once the chunk is committed.
+        product_import.committed_lines = chunk[-1][0]
+        product_import.imported_count += len(products)
+        product_import.rejected_count += len(rejects)
+        return rejects
+
+    def build_product(self, line: str) -> tuple[Product, list[Data]]:
+        """
+        Validates a line in memory, returns the unsaved product and its data.
+        """
+        try:
+            attrs = json.loads(line)
+        except ValueError:
+            raise ValidationError({"non_field_errors": ["invalid json"]})
+        if not isinstance(attrs, dict):
+            raise ValidationError(
+                {"non_field_errors": ["a line should contain a json object"]}
+            )
+
+        now = timezone.now()
+        product = Product(
+            **{key: attrs[key] for key in PRODUCT_ATTRIBUTES if key in attrs},
+            created_on=now,
+            updated_on=now,
+        )
+
+        errors = {}
+        try:
+            product.full_clean(
+                exclude=["product_type"],
+                validate_unique=False,
+                validate_constraints=False,
+            )
+        except ValidationError as e:
+            errors.update(e.message_dict)
+
+        product_type_id = _to_uuid(attrs.get("product_type_id"))
+        if product_type_id not in self.product_types:
+            errors["product_type_id"] = [
+                f"Product type {attrs.get('product_type_id')} does not exist"
+            ]
+            raise ValidationError(errors)
+        product.product_type_id = product_type_id
+
+        data = attrs.get("data") or []
+        if not isinstance(data, list):
+            errors["data"] = ["data should be a list"]
+            raise ValidationError(errors)
+
+        entries, data_errors = self.build_data(product, data)
+        if data_errors:
+            errors["data"] = data_errors
+        if errors:
+            if NON_FIELD_ERRORS in errors:
+                errors["non_field_errors"] = errors.pop(NON_FIELD_ERRORS)
+            raise ValidationError(errors)
+
+        return product, entries
+
+    def build_data(self, product: Product, data: list) -> tuple[list[Data], list]:
+        """
+        Resolves the fields of the data entries, the entries are validated like the
+        data of the product api.
+        """
+        entries, data_errors = [], []
+        for idx, entry in enumerate(data):
+            if not isinstance(entry, dict) or "value" not in entry:
+                data_errors.append(f"Data at index {idx}: requires a field_id & value")
+                continue
+
+            field = self.fields.get(_to_uuid(entry.get("field_id")))
+            if field is None:
+                data_errors.append(
+                    f"Data at index {idx}: field {entry.get('field_id')} does not exist"
+                )
+                continue
+            entries.append((idx, field, str(entry["value"])))
+
+        product_type_id = product.product_type_id
+        data, errors = build_product_data(
+            product,
+            self.product_types[product_type_id],
+            entries,
+            self.required_fields[product_type_id],
+        )
+        return data, data_errors + errors
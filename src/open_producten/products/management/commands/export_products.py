@@ -0,0 +1,52 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from open_producten.producttypes.models import ProductType
+
+from ...export import EXPORT_FORMATS, export_products
+
+
+class Command(BaseCommand):
+    help = "Export the products of a product type with their data as CSV/NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "product_type_id",
+            help="The id of the product type of which the products are exported.",
+        )
+        parser.add_argument(
+            "--format",
+            dest="export_format",
+            choices=EXPORT_FORMATS,
+            default="ndjson",
+            help="The format of the export.",
+        )
+        parser.add_argument(
+            "--output",
+            help="The file to write the export to, defaults to stdout.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="The number of rows fetched from the database at once.",
+        )
+
+    def handle(self, **options):
+        try:
+            product_type = ProductType.objects.get(pk=options["product_type_id"])
+        except (ProductType.DoesNotExist, ValidationError):
+            raise CommandError(
+                f"Product type {options['product_type_id']} does not exist."
+            )
+
+        lines = export_products(
+            product_type, options["export_format"], chunk_size=options["chunk_size"]
+        )
+
+        if options["output"]:
+            with open(options["output"], "w", newline="") as f:
+                f.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
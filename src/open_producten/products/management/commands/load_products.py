@@ -0,0 +1,72 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from ...importer import ProductImporter
+from ...models import ProductImport
+
+
+class Command(BaseCommand):
+    help = "Load products with their data to the database from a NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "filename",
+            help="The name of the file to be imported.",
+        )
+        parser.add_argument(
+            "--rejects",
+            help="The file to write the rejected lines to, defaults to "
+            "<filename>.rejects.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="The number of lines that are imported in a single transaction.",
+        )
+        parser.add_argument(
+            "--resume",
+            metavar="IMPORT_ID",
+            help="Resume a stopped import after its last committed line.",
+        )
+
+    def handle(self, **options):
+        filename = options["filename"]
+        rejects_filename = options["rejects"] or f"{filename}.rejects"
+
+        if options["resume"]:
+            try:
+                product_import = ProductImport.objects.get(pk=options["resume"])
+            except (ProductImport.DoesNotExist, ValidationError):
+                raise CommandError(f"Import {options['resume']} does not exist.")
+            if product_import.finished:
+                raise CommandError(f"Import {product_import.id} is already finished.")
+        else:
+            product_import = ProductImport.objects.create(source=filename)
+
+        self.stdout.write(
+            f"Importing products from {filename} (import {product_import.id})..."
+        )
+
+        importer = ProductImporter(product_import, chunk_size=options["chunk_size"])
+        try:
+            with (
+                open(filename, encoding="utf-8") as f,
+                open(rejects_filename, "a" if options["resume"] else "w") as rejects,
+            ):
+                for chunk_rejects in importer.run(f):
+                    for reject in chunk_rejects:
+                        rejects.write(json.dumps(reject._asdict()) + "\n")
+                    rejects.flush()
+        except Exception as e:
+            raise CommandError(
+                f"{e}\nImport stopped after line {product_import.committed_lines}, "
+                f"resume with --resume {product_import.id}."
+            ) from e
+
+        self.stdout.write(
+            f"Done ({product_import.imported_count} products, "
+            f"{product_import.rejected_count} rejected)."
+        )
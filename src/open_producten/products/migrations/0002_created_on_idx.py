@@ -0,0 +1,19 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["created_on", "id"], name="product_created_on_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:30
+
+from django.db import migrations, models
+import open_producten.utils.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0002_created_on_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="data",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="product",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,130 @@
+# Generated by Django 4.2.13 on 2026-10-18 21:17
+
+from datetime import datetime
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# a copy of the typed columns & parsers of the field types at the time of this
+# migration, so later changes to the app code do not change the migration.
+TYPED_VALUE_PARSERS = {
+    "number": ("value_number", float),
+    "checkbox": ("value_boolean", lambda value: value.lower() == "true"),
+    "date": (
+        "value_date",
+        lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+    ),
+    "datetime": (
+        "value_datetime",
+        lambda value: datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z"),
+    ),
+    "map": ("value_json", lambda value: value.split(",")),
+    "select": ("value_json", lambda value: value.split(",")),
+}
+
+
+def fill_typed_values(apps, schema_editor):
+    Field = apps.get_model("producttypes", "Field")
+    Data = apps.get_model("products", "Data")
+
+    for field in Field.objects.filter(type__in=TYPED_VALUE_PARSERS):
+        column, parse = TYPED_VALUE_PARSERS[field.type]
+
+        batch = []
+        for data in Data.objects.filter(field=field).only("value").iterator(2000):
+            try:
+                setattr(data, column, parse(data.value))
+            except (TypeError, ValueError):
+                continue
+            batch.append(data)
+
+            if len(batch) == 2000:
+                Data.objects.bulk_update(batch, fields=(column,))
+                batch = []
+        Data.objects.bulk_update(batch, fields=(column,))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0003_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="data",
+            name="value_boolean",
+            field=models.BooleanField(
+                editable=False, null=True, verbose_name="Boolean value"
+            ),
+        ),
+        migrations.AddField(
+            model_name="data",
+            name="value_date",
+            field=models.DateField(
+                editable=False, null=True, verbose_name="Date value"
+            ),
+        ),
+        migrations.AddField(
+            model_name="data",
+            name="value_datetime",
+            field=models.DateTimeField(
+                editable=False, null=True, verbose_name="Datetime value"
+            ),
+        ),
+        migrations.AddField(
+            model_name="data",
+            name="value_json",
+            field=models.JSONField(
+                editable=False, null=True, verbose_name="JSON value"
+            ),
+        ),
+        migrations.AddField(
+            model_name="data",
+            name="value_number",
+            field=models.FloatField(
+                editable=False, null=True, verbose_name="Number value"
+            ),
+        ),
+        migrations.RunPython(fill_typed_values, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="data",
+            index=models.Index(
+                condition=models.Q(("value_number__isnull", False)),
+                fields=["field", "value_number"],
+                name="data_value_number_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="data",
+            index=models.Index(
+                condition=models.Q(("value_boolean__isnull", False)),
+                fields=["field", "value_boolean"],
+                name="data_value_boolean_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="data",
+            index=models.Index(
+                condition=models.Q(("value_date__isnull", False)),
+                fields=["field", "value_date"],
+                name="data_value_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="data",
+            index=models.Index(
+                condition=models.Q(("value_datetime__isnull", False)),
+                fields=["field", "value_datetime"],
+                name="data_value_datetime_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="data",
+            index=django.contrib.postgres.indexes.GinIndex(
+                condition=models.Q(("value_json__isnull", False)),
+                fields=["value_json"],
+                name="data_value_json_idx",
+            ),
+        ),
+    ]
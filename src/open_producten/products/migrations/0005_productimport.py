@@ -0,0 +1,80 @@
+# Generated by Django 4.2.13 on 2026-10-18 21:21
+
+from django.db import migrations, models
+import open_producten.utils.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0004_data_typed_values"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductImport",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=open_producten.utils.models.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "source",
+                    models.CharField(
+                        help_text="The file that is imported",
+                        max_length=255,
+                        verbose_name="Source",
+                    ),
+                ),
+                (
+                    "committed_lines",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of lines of the file that are processed",
+                        verbose_name="Committed lines",
+                    ),
+                ),
+                (
+                    "imported_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of products that are imported",
+                        verbose_name="Imported count",
+                    ),
+                ),
+                (
+                    "rejected_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of lines that are rejected",
+                        verbose_name="Rejected count",
+                    ),
+                ),
+                (
+                    "finished",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Whether the whole file is imported",
+                        verbose_name="Finished",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created on"),
+                ),
+                (
+                    "updated_on",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated on"),
+                ),
+            ],
+            options={
+                "verbose_name": "Product import",
+                "verbose_name_plural": "Product imports",
+            },
+        ),
+    ]
@@ -1,4 +1,5 @@
 from .data import Data
 from .product import Product
+from .product_import import ProductImport
 
-__all__ = ["Product", "Data"]
+__all__ = ["Product", "Data", "ProductImport"]
@@ -1,24 +1,23 @@
-from datetime import datetime
+from collections.abc import Iterable
 
+from django.contrib.postgres.indexes import GinIndex
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
-from localflavor.generic.validators import IBANValidator
-from localflavor.nl.validators import NLLicensePlateFieldValidator
-
-from open_producten.producttypes.models import Field, FieldTypes
+from open_producten.producttypes.models import Field
 from open_producten.utils.models import BaseModel
-from open_producten.utils.validators import validate_postal_code
 
 from .product import Product
-from .validators import (
-    validate_bsn,
-    validate_checkbox,
-    validate_datetime_format,
-    validate_radio,
-    validate_regex,
-    validate_select,
-    validate_select_boxes,
+from .validators import get_compiled_field
+
+TYPED_VALUE_FIELDS = (
+    "value_number",
+    "value_boolean",
+    "value_date",
+    "value_datetime",
+    "value_json",
 )
 
 
@@ -32,6 +31,15 @@ class Data(BaseModel):
     )
     value = models.CharField(_("Value"), help_text=_("The value of the field"))
 
+    # the parsed value is stored in the column of its type so it can be indexed.
+    value_number = models.FloatField(_("Number value"), null=True, editable=False)
+    value_boolean = models.BooleanField(_("Boolean value"), null=True, editable=False)
+    value_date = models.DateField(_("Date value"), null=True, editable=False)
+    value_datetime = models.DateTimeField(
+        _("Datetime value"), null=True, editable=False
+    )
+    value_json = models.JSONField(_("JSON value"), null=True, editable=False)
+
     product = models.ForeignKey(
         Product,
         verbose_name=_("Product"),
@@ -43,6 +51,34 @@ class Data(BaseModel):
     class Meta:
         verbose_name = _("Data")
         verbose_name_plural = _("Data")
+        # partial indexes, as only the column of the field type is filled.
+        indexes = [
+            models.Index(
+                fields=["field", "value_number"],
+                condition=Q(value_number__isnull=False),
+                name="data_value_number_idx",
+            ),
+            models.Index(
+                fields=["field", "value_boolean"],
+                condition=Q(value_boolean__isnull=False),
+                name="data_value_boolean_idx",
+            ),
+            models.Index(
+                fields=["field", "value_date"],
+                condition=Q(value_date__isnull=False),
+                name="data_value_date_idx",
+            ),
+            models.Index(
+                fields=["field", "value_datetime"],
+                condition=Q(value_datetime__isnull=False),
+                name="data_value_datetime_idx",
+            ),
+            GinIndex(
+                fields=["value_json"],
+                condition=Q(value_json__isnull=False),
+                name="data_value_json_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.field.name} {self.product_type.name}"
@@ -51,69 +87,65 @@ class Data(BaseModel):
     def product_type(self):
         return self.field.product_type
 
-    PARSERS = {
-        FieldTypes.NUMBER: float,
-        FieldTypes.CHECKBOX: lambda value: value.lower() == "true",
-        FieldTypes.DATE: lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
-        FieldTypes.DATETIME: lambda value: datetime.strptime(
-            value, "%Y-%m-%dT%H:%M:%S%z"
-        ),
-        FieldTypes.TIME: lambda value: datetime.strptime(value, "%H:%M:%S").time(),
-        FieldTypes.MAP: lambda value: value.split(","),
-        FieldTypes.SELECT: lambda value: value.split(","),
-    }
-
-    CLEANERS = {
-        FieldTypes.BSN: validate_bsn,
-        FieldTypes.CHECKBOX: validate_checkbox,
-        FieldTypes.COSIGN: lambda value: validate_regex(
-            value, r"^.+@.+\..+$", FieldTypes.EMAIL
-        ),
-        FieldTypes.CURRENCY: lambda value: validate_regex(
-            value, r"^\d+,?\d{0,2}$", FieldTypes.CURRENCY
-        ),
-        FieldTypes.DATE: lambda value: validate_datetime_format(
-            value, "%Y-%m-%d", FieldTypes.DATE
-        ),
-        FieldTypes.DATETIME: lambda value: validate_datetime_format(
-            value, "%Y-%m-%dT%H:%M:%S%z", FieldTypes.DATETIME
-        ),
-        FieldTypes.EMAIL: lambda value: validate_regex(
-            value, r"^.+@.+\..+$", FieldTypes.EMAIL
-        ),
-        FieldTypes.IBAN: IBANValidator(),
-        FieldTypes.LICENSE_PLATE: NLLicensePlateFieldValidator(),
-        FieldTypes.MAP: lambda value: validate_regex(
-            value, r"^\d+\.?\d*,\d+\.?\d*$", FieldTypes.MAP
-        ),
-        FieldTypes.NUMBER: lambda value: validate_regex(
-            value, r"^\d+\.?\d*$", FieldTypes.NUMBER
-        ),
-        FieldTypes.PHONE_NUMBER: lambda value: validate_regex(
-            value, r"^[+0-9][- 0-9]+$", FieldTypes.PHONE_NUMBER
-        ),
-        FieldTypes.POSTCODE: validate_postal_code,
-        FieldTypes.SIGNATURE: lambda value: validate_regex(
-            value, r"^data:image/png;base64,.*$", FieldTypes.SIGNATURE
-        ),
-        FieldTypes.TIME: lambda value: validate_datetime_format(
-            value, "%H:%M:%S", FieldTypes.TIME
-        ),
-    }
-
-    CHOICE_CLEANERS = {
-        FieldTypes.RADIO: validate_radio,
-        FieldTypes.SELECT: validate_select,
-        FieldTypes.SELECT_BOXES: validate_select_boxes,
-    }
-
     def parse(self):
-        if self.field.type in self.PARSERS:
-            return self.PARSERS[self.field.type](self.value)
+        return get_compiled_field(self.field).parse(self.value)
 
     def clean(self):
-        if self.field.type in self.CLEANERS:
-            self.CLEANERS[self.field.type](self.value)
-
-        elif self.field.type in self.CHOICE_CLEANERS:
-            self.CHOICE_CLEANERS[self.field.type](self.value, self.field.choices)
+        get_compiled_field(self.field).validate(self.value)
+
+    def set_typed_value(self):
+        """
+        Stores the parsed value in the typed column of the field type, values that
+        cannot be parsed are not stored.
+        """
+        compiled = get_compiled_field(self.field)
+        for name in TYPED_VALUE_FIELDS:
+            setattr(self, name, None)
+
+        if compiled.column:
+            try:
+                setattr(self, compiled.column, compiled.parse(self.value))
+            except (TypeError, ValueError):
+                pass
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "value" in update_fields:
+            self.set_typed_value()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *TYPED_VALUE_FIELDS}
+        super().save(*args, **kwargs)
+
+
+def build_product_data(
+    product: Product,
+    product_type_name: str,
+    entries: Iterable[tuple[int, Field, str]],
+    required_fields: Iterable[Field],
+) -> tuple[list[Data], list[str]]:
+    """
+    Validates the data of a product in memory against its product type, used by
+    the api and the import so both report the same errors. ``entries`` holds the
+    index, field and value of every data entry. Returns the unsaved data and the
+    errors.
+    """
+    missing_fields = {field.id: field for field in required_fields}
+
+    data, errors = [], []
+    for idx, field, value in entries:
+        if field.product_type_id != product.product_type_id:
+            errors.append(f"field {field.name} is not part of {product_type_name}")
+        missing_fields.pop(field.id, None)
+
+        data_entry = Data(product=product, field=field, value=value)
+        try:
+            data_entry.clean()
+            data_entry.set_typed_value()
+        except ValidationError as e:
+            errors.append(f"Data at index {idx}: {e}")
+        data.append(data_entry)
+
+    if missing_fields:
+        names = sorted(field.name for field in missing_fields.values())
+        errors.append(f"Missing required fields: {', '.join(names)}")
+    return data, errors
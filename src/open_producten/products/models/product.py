@@ -46,6 +46,9 @@ class Product(BasePublishableModel):
     class Meta:
         verbose_name = _("Product")
         verbose_name_plural = _("Products")
+        indexes = [
+            models.Index(fields=["created_on", "id"], name="product_created_on_idx"),
+        ]
 
     def clean(self):
         if not self.bsn and not self.kvk:
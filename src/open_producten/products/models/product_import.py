@@ -0,0 +1,37 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from open_producten.utils.models import BaseModel
+
+
+class ProductImport(BaseModel):
+    source = models.CharField(
+        _("Source"), max_length=255, help_text=_("The file that is imported")
+    )
+    committed_lines = models.PositiveIntegerField(
+        _("Committed lines"),
+        default=0,
+        help_text=_("The number of lines of the file that are processed"),
+    )
+    imported_count = models.PositiveIntegerField(
+        _("Imported count"),
+        default=0,
+        help_text=_("The number of products that are imported"),
+    )
+    rejected_count = models.PositiveIntegerField(
+        _("Rejected count"),
+        default=0,
+        help_text=_("The number of lines that are rejected"),
+    )
+    finished = models.BooleanField(
+        _("Finished"), default=False, help_text=_("Whether the whole file is imported")
+    )
+    created_on = models.DateTimeField(_("Created on"), auto_now_add=True)
+    updated_on = models.DateTimeField(_("Updated on"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Product import")
+        verbose_name_plural = _("Product imports")
+
+    def __str__(self):
+        return f"{self.source} ({self.committed_lines} lines)"
@@ -2,10 +2,16 @@ import json
 import re
 from datetime import datetime
 from json.decoder import JSONDecodeError
+from typing import Any, Callable, NamedTuple
+from uuid import UUID
 
 from django.core.exceptions import ValidationError
 
-from open_producten.producttypes.models import FieldTypes
+from localflavor.generic.validators import IBANValidator
+from localflavor.nl.validators import NLLicensePlateFieldValidator
+
+from open_producten.producttypes.models import Field, FieldTypes
+from open_producten.utils.validators import validate_postal_code
 
 
 def validate_bsn(bsn: str):
@@ -28,16 +34,29 @@ def validate_checkbox(value: str):
         raise ValidationError("Checkbox must be true or false")
 
 
-def validate_datetime_format(value: str, _format: str, field_type: FieldTypes):
-    try:
-        datetime.strptime(value, _format)
-    except ValueError:
-        raise ValidationError(f"{field_type} should use {_format} format")
+def datetime_format_validator(
+    _format: str, field_type: FieldTypes
+) -> Callable[[str], None]:
+    message = f"{field_type} should use {_format} format"
+
+    def validate(value: str):
+        try:
+            datetime.strptime(value, _format)
+        except ValueError:
+            raise ValidationError(message)
+
+    return validate
+
 
+def regex_validator(pattern: str, field_type: FieldTypes) -> Callable[[str], None]:
+    match = re.compile(pattern).match
+    message = f"invalid {field_type}"
 
-def validate_regex(value: str, pattern: str, field_type: FieldTypes):
-    if not re.match(pattern, value):
-        raise ValidationError(f"invalid {field_type}")
+    def validate(value: str):
+        if not match(value):
+            raise ValidationError(message)
+
+    return validate
 
 
 def _load_json(value: str):
@@ -48,32 +67,150 @@ def _load_json(value: str):
     return value
 
 
-def validate_select_boxes(value: str, choices: list[str]):
-    value = _load_json(value)
-    for v in set(value.values()):
-        if not isinstance(v, bool):
-            raise ValidationError("select box values should be boolean")
+def select_boxes_validator(choices: frozenset[str]) -> Callable[[str], None]:
+    def validate(value: str):
+        value = _load_json(value)
+        for v in set(value.values()):
+            if not isinstance(v, bool):
+                raise ValidationError("select box values should be boolean")
+
+        if unknown_keys := set(value.keys()) - choices:
+            raise ValidationError(
+                f"keys {', '.join(unknown_keys)} are not in the field choices"
+            )
 
-    if unknown_keys := set(value.keys()) - set(choices):
-        raise ValidationError(
-            f"keys {', '.join(unknown_keys)} are not in the field choices"
-        )
+        if missing_keys := choices - set(value.keys()):
+            raise ValidationError(f"keys {', '.join(missing_keys)} are missing in data")
 
-    if missing_keys := set(choices) - set(value.keys()):
-        raise ValidationError(f"keys {', '.join(missing_keys)} are missing in data")
+    return validate
 
 
-def choice_exists(value: str, choices: list[str]):
+def _choice_exists(value: str, choices: frozenset[str]):
     if value not in choices:
         raise ValidationError("value does not exist in the field choices")
 
 
-def validate_radio(value: str, choices: list[str]):
-    choice_exists(value, choices)
+def radio_validator(choices: frozenset[str]) -> Callable[[str], None]:
+    def validate(value: str):
+        _choice_exists(value, choices)
+
+    return validate
+
+
+def select_validator(choices: frozenset[str]) -> Callable[[str], None]:
+    validate_format = regex_validator("^(.*,?)+$", FieldTypes.SELECT)
+
+    def validate(value: str):
+        validate_format(value)
+
+        for d in value.split(","):
+            _choice_exists(d, choices)
+
+    return validate
+
+
+VALIDATORS = {
+    FieldTypes.BSN: validate_bsn,
+    FieldTypes.CHECKBOX: validate_checkbox,
+    FieldTypes.COSIGN: regex_validator(r"^.+@.+\..+$", FieldTypes.EMAIL),
+    FieldTypes.CURRENCY: regex_validator(r"^\d+,?\d{0,2}$", FieldTypes.CURRENCY),
+    FieldTypes.DATE: datetime_format_validator("%Y-%m-%d", FieldTypes.DATE),
+    FieldTypes.DATETIME: datetime_format_validator(
+        "%Y-%m-%dT%H:%M:%S%z", FieldTypes.DATETIME
+    ),
+    FieldTypes.EMAIL: regex_validator(r"^.+@.+\..+$", FieldTypes.EMAIL),
+    FieldTypes.IBAN: IBANValidator(),
+    FieldTypes.LICENSE_PLATE: NLLicensePlateFieldValidator(),
+    FieldTypes.MAP: regex_validator(r"^\d+\.?\d*,\d+\.?\d*$", FieldTypes.MAP),
+    FieldTypes.NUMBER: regex_validator(r"^\d+\.?\d*$", FieldTypes.NUMBER),
+    FieldTypes.PHONE_NUMBER: regex_validator(
+        r"^[+0-9][- 0-9]+$", FieldTypes.PHONE_NUMBER
+    ),
+    FieldTypes.POSTCODE: validate_postal_code,
+    FieldTypes.SIGNATURE: regex_validator(
+        r"^data:image/png;base64,.*$", FieldTypes.SIGNATURE
+    ),
+    FieldTypes.TIME: datetime_format_validator("%H:%M:%S", FieldTypes.TIME),
+}
+
+# validators that depend on the choices of the field, built once per field.
+CHOICE_VALIDATORS = {
+    FieldTypes.RADIO: radio_validator,
+    FieldTypes.SELECT: select_validator,
+    FieldTypes.SELECT_BOXES: select_boxes_validator,
+}
+
+PARSERS = {
+    FieldTypes.NUMBER: float,
+    FieldTypes.CHECKBOX: lambda value: value.lower() == "true",
+    FieldTypes.DATE: lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+    FieldTypes.DATETIME: lambda value: datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z"),
+    FieldTypes.TIME: lambda value: datetime.strptime(value, "%H:%M:%S").time(),
+    FieldTypes.MAP: lambda value: value.split(","),
+    FieldTypes.SELECT: lambda value: value.split(","),
+}
+
+
+# the typed column of data in which the parsed value of a field type is stored.
+TYPED_VALUE_COLUMNS = {
+    FieldTypes.NUMBER: "value_number",
+    FieldTypes.CHECKBOX: "value_boolean",
+    FieldTypes.DATE: "value_date",
+    FieldTypes.DATETIME: "value_datetime",
+    FieldTypes.MAP: "value_json",
+    FieldTypes.SELECT: "value_json",
+}
 
 
-def validate_select(value: str, choices: list[str]):
-    validate_regex(value, "^(.*,?)+$", FieldTypes.SELECT)
+def _validate_any(value: str):
+    pass
+
+
+def _parse_none(value: str):
+    return None
+
+
+class CompiledField(NamedTuple):
+    version: tuple
+    validate: Callable[[str], None]
+    parse: Callable[[str], Any]
+    column: str | None
+
+
+_compiled_fields: dict[UUID, CompiledField] = {}
+
+
+def get_field_version(field: Field) -> tuple:
+    """
+    The attributes of a field that its validator and parser depend on.
+    """
+    return field.type, tuple(field.choices or ())
+
+
+def compile_field(field: Field) -> CompiledField:
+    if field.type in CHOICE_VALIDATORS:
+        validate = CHOICE_VALIDATORS[field.type](frozenset(field.choices or ()))
+    else:
+        validate = VALIDATORS.get(field.type, _validate_any)
+
+    return CompiledField(
+        version=get_field_version(field),
+        validate=validate,
+        parse=PARSERS.get(field.type, _parse_none),
+        column=TYPED_VALUE_COLUMNS.get(field.type),
+    )
+
+
+def get_compiled_field(field: Field) -> CompiledField:
+    """
+    Returns the validator & parser of a field, which are compiled once per field id
+    and rebuilt when the type or choices of the field change.
+    """
+    compiled = _compiled_fields.get(field.id)
+    if compiled is None or compiled.version != get_field_version(field):
+        compiled = _compiled_fields[field.id] = compile_field(field)
+    return compiled
+
 
-    for d in value.split(","):
-        choice_exists(d, choices)
+def invalidate_compiled_field(field_id: UUID):
+    _compiled_fields.pop(field_id, None)
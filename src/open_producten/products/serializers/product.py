@@ -1,24 +1,35 @@
+from collections import defaultdict
+
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 
 from rest_framework import serializers
 
-from open_producten.products.models import Data, Product
+from open_producten.products.export import EXPORT_FORMATS
+from open_producten.products.models import Data, Product, ProductImport
+from open_producten.products.models.data import TYPED_VALUE_FIELDS, build_product_data
 from open_producten.producttypes.models import Field, ProductType
 from open_producten.producttypes.serializers.category import SimpleProductTypeSerializer
 from open_producten.producttypes.serializers.children import FieldSerializer
-from open_producten.utils.serializers import model_to_dict_with_related_ids
+from open_producten.utils.serializers import (
+    BulkPrimaryKeyRelatedField,
+    DynamicFieldsSerializerMixin,
+    PrefetchRelatedListSerializer,
+    model_to_dict_with_related_ids,
+)
 
 
 class DataSerializer(serializers.ModelSerializer):
     field = FieldSerializer(read_only=True)
-    field_id = serializers.PrimaryKeyRelatedField(
+    field_id = BulkPrimaryKeyRelatedField(
         write_only=True, queryset=Field.objects.all(), source="field"
     )
 
     class Meta:
         model = Data
-        exclude = ("product",)
+        exclude = ("product", *TYPED_VALUE_FIELDS)
+        list_serializer_class = PrefetchRelatedListSerializer
 
 
 class BaseProductSerializer(serializers.ModelSerializer):
@@ -36,9 +47,45 @@ class BaseProductSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class ProductSerializer(BaseProductSerializer):
+class ProductBulkSerializer(PrefetchRelatedListSerializer):
+    """
+    Creates a list of products, the data of all products is validated in memory and
+    inserted with a single bulk create. Errors are reported per product.
+    """
+
+    @transaction.atomic()
+    def create(self, validated_data):
+        product_type_ids = {attrs["product_type"].pk for attrs in validated_data}
+        required_fields = defaultdict(list)
+        for field in Field.objects.filter(
+            product_type__in=product_type_ids, is_required=True
+        ):
+            required_fields[field.product_type_id].append(field)
+
+        products, data_entries, errors = [], [], []
+        for attrs in validated_data:
+            attrs = attrs.copy()
+            data = attrs.pop("data")
+
+            product = Product(**attrs)
+            entries, data_errors = self.child.build_data(
+                product, data, required_fields[product.product_type_id]
+            )
+            products.append(product)
+            data_entries.extend(entries)
+            errors.append({"data": data_errors} if data_errors else {})
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        Product.objects.bulk_create(products)
+        Data.objects.bulk_create(data_entries)
+        return products
+
+
+class ProductSerializer(DynamicFieldsSerializerMixin, BaseProductSerializer):
     product_type = SimpleProductTypeSerializer(read_only=True)
-    product_type_id = serializers.PrimaryKeyRelatedField(
+    product_type_id = BulkPrimaryKeyRelatedField(
         write_only=True, queryset=ProductType.objects.all(), source="product_type"
     )
     data = DataSerializer(many=True)
@@ -46,39 +93,39 @@ class ProductSerializer(BaseProductSerializer):
     class Meta:
         model = Product
         fields = "__all__"
+        list_serializer_class = ProductBulkSerializer
+
+    def build_data(self, product, data, required_fields):
+        """
+        Validates the data entries of a product in memory, returns the unsaved
+        entries and the errors.
+        """
+        return build_product_data(
+            product,
+            product.product_type.name,
+            ((idx, entry["field"], entry["value"]) for idx, entry in enumerate(data)),
+            required_fields,
+        )
 
     @transaction.atomic()
     def create(self, validated_data):
         data = validated_data.pop("data")
+        product = Product(**validated_data)
 
-        product = Product.objects.create(**validated_data)
-        product_type = product.product_type
-
-        required_fields = list(product_type.fields.filter(is_required=True))
-        data_errors = []
-        for idx, entry in enumerate(data):
-            field = entry["field"]
-            if field.product_type != product.product_type:
-                data_errors.append(
-                    f"field {field.name} is not part of {product_type.name}"
-                )
-            elif field in required_fields:
-                required_fields.remove(field)
-
-            data_entry = Data(product=product, **entry)
-            try:
-                data_entry.clean()
-                data_entry.save()
-            except ValidationError as e:
-                data_errors.append(f"Data at index {idx}: {e}")
-
-        if required_fields:
-            data_errors.append(
-                f"Missing required fields: {', '.join([str(field) for field in required_fields])}"
-            )
-
+        entries, data_errors = self.build_data(
+            product,
+            data,
+            product.product_type.fields.filter(is_required=True),
+        )
         if data_errors:
             raise serializers.ValidationError({"data": data_errors})
+
+        product.save()
+        Data.objects.bulk_create(entries)
+
+        prefetch_related_objects(
+            [product], Prefetch("data", queryset=Data.objects.select_related("field"))
+        )
         return product
 
 
@@ -87,7 +134,7 @@ class DataUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Data
-        exclude = ("field", "product")
+        exclude = ("field", "product", *TYPED_VALUE_FIELDS)
 
 
 class ProductUpdateSerializer(BaseProductSerializer):
@@ -103,41 +150,96 @@ class ProductUpdateSerializer(BaseProductSerializer):
         product = super().update(instance, validated_data)
 
         if data is not None:
-            data_errors = []
-
-            current_data_ids = instance.data.values_list("id", flat=True).distinct()
-
-            seen_data_ids = set()
-            for idx, data_entry in enumerate(data):
-                data_id = data_entry.pop("id", None)
-
-                if data_id in seen_data_ids:
-                    data_errors.append(f"Duplicate data id: {data_id} at index {idx}")
-                seen_data_ids.add(data_id)
-
-                if data_id in current_data_ids:
-                    data = Data.objects.get(pk=data_id)
-                    data.value = data_entry["value"]
-                    try:
-                        data.clean()
-                        data.save()
-                    except ValidationError as e:
-                        data_errors.append(f"Data at index {idx}: {e}")
-
-                else:
-                    try:
-                        Data.objects.get(id=data_id)
-                        data_errors.append(
-                            f"Data id {data_id} at index {idx} is not part of product object"
-                        )
-                    except Data.DoesNotExist:
-                        data_errors.append(
-                            f"Data id {data_id} at index {idx} does not exist"
-                        )
-
-            if data_errors:
-                raise serializers.ValidationError({"data": data_errors})
+            self._update_data(product, data)
 
         product.refresh_from_db()
 
         return product
+
+    def _update_data(self, product, data):
+        """
+        Validates the data entries in memory against one fetch of the data of the
+        product, the changed values are written with a single bulk update.
+        """
+        current_data = {
+            data_entry.id: data_entry
+            for data_entry in product.data.select_related("field")
+        }
+
+        # only needed to tell data of other products apart from unknown ids.
+        other_data_ids = [
+            data_entry.get("id")
+            for data_entry in data
+            if data_entry.get("id") not in current_data
+        ]
+        if other_data_ids:
+            other_data_ids = set(
+                Data.objects.filter(id__in=other_data_ids).values_list("id", flat=True)
+            )
+
+        data_errors = []
+        updated_data = []
+        seen_data_ids = set()
+        for idx, data_entry in enumerate(data):
+            data_id = data_entry.pop("id", None)
+
+            if data_id in seen_data_ids:
+                data_errors.append(f"Duplicate data id: {data_id} at index {idx}")
+            seen_data_ids.add(data_id)
+
+            if data_id in current_data:
+                existing_data = current_data[data_id]
+                existing_data.value = data_entry["value"]
+                try:
+                    existing_data.clean()
+                    existing_data.set_typed_value()
+                    updated_data.append(existing_data)
+                except ValidationError as e:
+                    data_errors.append(f"Data at index {idx}: {e}")
+
+            elif data_id in other_data_ids:
+                data_errors.append(
+                    f"Data id {data_id} at index {idx} is not part of product object"
+                )
+            else:
+                data_errors.append(f"Data id {data_id} at index {idx} does not exist")
+
+        if data_errors:
+            raise serializers.ValidationError({"data": data_errors})
+
+        Data.objects.bulk_update(updated_data, fields=("value", *TYPED_VALUE_FIELDS))
+
+
+class ExportParameterSerializer(serializers.Serializer):
+    product_type_id = serializers.PrimaryKeyRelatedField(
+        queryset=ProductType.objects.all(), source="product_type"
+    )
+    export_format = serializers.ChoiceField(choices=EXPORT_FORMATS, default="ndjson")
+
+
+class ProductImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ProductImport
+        fields = "__all__"
+
+
+class ProductImportRejectSerializer(serializers.Serializer):
+    line = serializers.IntegerField()
+    errors = serializers.DictField()
+    input = serializers.CharField()
+
+
+class ProductImportResultSerializer(ProductImportSerializer):
+    rejects = ProductImportRejectSerializer(many=True)
+
+    class Meta(ProductImportSerializer.Meta):
+        pass
+
+
+class ProductImportParameterSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    import_id = serializers.PrimaryKeyRelatedField(
+        queryset=ProductImport.objects.filter(finished=False),
+        source="product_import",
+        required=False,
+    )
@@ -0,0 +1,52 @@
+"""
+Keeps ``updated_on`` of products in sync with their data, so it can be used as the
+version for conditional requests, drops the compiled validator of a field when it
+changes and refills the typed values of its data when its type changes.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from open_producten.producttypes.models import Field
+from open_producten.producttypes.signals import touch
+
+from .models import Data, Product
+from .models.data import TYPED_VALUE_FIELDS
+from .models.validators import invalidate_compiled_field
+
+
+@receiver(post_save, sender=Data)
+@receiver(post_delete, sender=Data)
+def touch_product(sender, instance, **kwargs):
+    touch(Product.objects.filter(pk=instance.product_id))
+
+
+@receiver(post_save, sender=Field)
+@receiver(post_delete, sender=Field)
+def invalidate_field_validator(sender, instance, **kwargs):
+    invalidate_compiled_field(instance.id)
+
+
+@receiver(pre_save, sender=Field)
+def remember_field_type(sender, instance, **kwargs):
+    if not instance._state.adding:
+        instance._previous_type = (
+            Field.objects.filter(pk=instance.pk).values_list("type", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Field)
+def refill_typed_values(sender, instance, created, **kwargs):
+    if created or getattr(instance, "_previous_type", instance.type) == instance.type:
+        return
+
+    batch = []
+    for data in instance.data.iterator(2000):
+        data.field = instance
+        data.set_typed_value()
+        batch.append(data)
+
+        if len(batch) == 2000:
+            Data.objects.bulk_update(batch, fields=TYPED_VALUE_FIELDS)
+            batch = []
+    Data.objects.bulk_update(batch, fields=TYPED_VALUE_FIELDS)
@@ -1,12 +1,19 @@
 import datetime
+import json
 import uuid
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from freezegun import freeze_time
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIClient
 
-from open_producten.products.models import Data, Product
+from open_producten.products.models import Data, Product, ProductImport
 from open_producten.products.tests.factories import DataFactory, ProductFactory
+from open_producten.products.views import ProductViewSet
 from open_producten.producttypes.models import Field, FieldTypes
 from open_producten.producttypes.tests.factories import FieldFactory, ProductTypeFactory
 from open_producten.utils.tests.cases import BaseApiTestCase
@@ -217,6 +224,122 @@ class TestProduct(BaseApiTestCase):
         self.assertEqual(Data.objects.count(), 0)
         self.assertEqual(Field.objects.count(), 1)
 
+    def test_create_product_uses_fixed_number_of_queries(self):
+        fields = FieldFactory.create_batch(
+            30, product_type=self.product_type, type=FieldTypes.TEXTFIELD
+        )
+        self.post(self.data)
+
+        data = self.data | {"data": [{"field_id": fields[0].id, "value": "abc"}]}
+        with CaptureQueriesContext(connection) as single_context:
+            self.post(data)
+
+        data = self.data | {
+            "data": [{"field_id": field.id, "value": "abc"} for field in fields]
+        }
+        with CaptureQueriesContext(connection) as multiple_context:
+            response = self.post(data)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data["data"]), 30)
+        self.assertEqual(len(single_context), len(multiple_context))
+
+    def bulk(self, data):
+        return self.client.post(self.path + "bulk/", data, format="json")
+
+    def test_bulk_create_products(self):
+        field = FieldFactory.create(
+            product_type=self.product_type, type=FieldTypes.NUMBER, is_required=True
+        )
+        other_product_type = ProductTypeFactory.create()
+
+        response = self.bulk(
+            [
+                self.data | {"data": [{"field_id": field.id, "value": "1"}]},
+                self.data
+                | {"product_type_id": other_product_type.id, "kvk": "11122233"},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Product.objects.count(), 2)
+        product = Product.objects.get(product_type=self.product_type)
+        self.assertEqual(response.data[0], product_to_dict(product))
+        self.assertEqual(product.data.get().value, "1")
+        self.assertEqual(response.data[1]["kvk"], "11122233")
+
+    def test_bulk_create_products_returns_errors_per_product(self):
+        field = FieldFactory.create(
+            product_type=self.product_type, type=FieldTypes.NUMBER, is_required=True
+        )
+
+        response = self.bulk(
+            [
+                self.data | {"data": [{"field_id": field.id, "value": "1"}]},
+                self.data | {"data": [{"field_id": field.id, "value": "abc"}]},
+                self.data,
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            [
+                {},
+                {
+                    "data": [
+                        ErrorDetail(
+                            string="Data at index 0: ['invalid number']",
+                            code="invalid",
+                        )
+                    ]
+                },
+                {
+                    "data": [
+                        ErrorDetail(
+                            string=f"Missing required fields: {field.name}",
+                            code="invalid",
+                        )
+                    ]
+                },
+            ],
+        )
+        self.assertEqual(Product.objects.count(), 0)
+        self.assertEqual(Data.objects.count(), 0)
+
+    def test_bulk_create_products_uses_fixed_number_of_queries(self):
+        def create_items(count):
+            items = []
+            for _ in range(count):
+                product_type = ProductTypeFactory.create()
+                fields = FieldFactory.create_batch(
+                    3, product_type=product_type, type=FieldTypes.TEXTFIELD
+                )
+                items.append(
+                    self.data
+                    | {
+                        "product_type_id": product_type.id,
+                        "data": [
+                            {"field_id": field.id, "value": "abc"} for field in fields
+                        ],
+                    }
+                )
+            return items
+
+        self.bulk(create_items(1))
+
+        items = create_items(1)
+        with CaptureQueriesContext(connection) as single_context:
+            self.bulk(items)
+
+        items = create_items(10)
+        with CaptureQueriesContext(connection) as multiple_context:
+            response = self.bulk(items)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Data.objects.count(), 36)
+        self.assertEqual(len(single_context), len(multiple_context))
+
     def test_update_product(self):
         product = self._create_product()
 
@@ -263,6 +386,37 @@ class TestProduct(BaseApiTestCase):
         self.assertEqual(Data.objects.count(), 1)
         self.assertEqual(data_instance.value, "123")
 
+    def test_partial_update_product_data_uses_fixed_number_of_queries(self):
+        product = self._create_product()
+        data_instances = [
+            DataFactory.create(
+                product=product,
+                field=FieldFactory.create(
+                    product_type=product.product_type, type=FieldTypes.NUMBER
+                ),
+                value="1",
+            )
+            for _ in range(30)
+        ]
+        self.patch(product.id, {"data": []})
+
+        data = {"data": [{"id": data_instances[0].id, "value": "2"}]}
+        with CaptureQueriesContext(connection) as single_context:
+            self.patch(product.id, data)
+
+        data = {
+            "data": [
+                {"id": data_instance.id, "value": "3"}
+                for data_instance in data_instances
+            ]
+        }
+        with CaptureQueriesContext(connection) as multiple_context:
+            response = self.patch(product.id, data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(product.data.filter(value="3").count(), 30)
+        self.assertEqual(len(single_context), len(multiple_context))
+
     def test_update_product_with_duplicate_data_ids_returns_error(self):
         field = FieldFactory.create(
             product_type=self.product_type, type=FieldTypes.TEXTFIELD, is_required=True
@@ -433,6 +587,239 @@ class TestProduct(BaseApiTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, product_to_dict(product))
 
+    def test_read_products_uses_fixed_number_of_queries(self):
+        field = FieldFactory.create(product_type=self.product_type, type="textfield")
+        DataFactory.create(product=self._create_product(), field=field, value="abc")
+        self.get()
+
+        with self.assertNumQueries(9):
+            self.get()
+
+        for _ in range(5):
+            DataFactory.create(product=self._create_product(), field=field, value="abc")
+
+        with self.assertNumQueries(9):
+            response = self.get()
+
+        self.assertEqual(response.data["count"], 6)
+
+    def test_read_product_with_expand(self):
+        product = self._create_product()
+
+        response = self.client.get(
+            f"{self.path}{product.id}/", {"fields": "id,bsn", "expand": "data"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data, {"id": str(product.id), "bsn": product.bsn, "data": []}
+        )
+
+    def test_read_product_etag_changes_when_product_type_changes(self):
+        product = self._create_product()
+        etag = self.get(product.id)["ETag"]
+
+        response = self.client.get(f"{self.path}{product.id}/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with freeze_time("2024-01-02"):
+            product.product_type.name = "updated"
+            product.product_type.save()
+
+        response = self.client.get(f"{self.path}{product.id}/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def _create_product_with_data(self, field, value):
+        product = self._create_product()
+        DataFactory.create(product=product, field=field, value=value)
+        return product
+
+    def test_filter_products_on_number_data(self):
+        field = FieldFactory.create(type=FieldTypes.NUMBER)
+        self._create_product_with_data(field, "5")
+        product = self._create_product_with_data(field, "10.5")
+        other_product = self._create_product_with_data(field, "20")
+
+        response = self.client.get(
+            self.path, {f"data[{field.id}][gte]": "10", f"data[{field.id}][lt]": "20"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [str(product.id)]
+        )
+
+        response = self.client.get(self.path, {f"data[{field.id}][gte]": "10"})
+        self.assertCountEqual(
+            [item["id"] for item in response.data["results"]],
+            [str(product.id), str(other_product.id)],
+        )
+
+    def test_filter_products_on_data_of_multiple_fields(self):
+        date_field = FieldFactory.create(type=FieldTypes.DATE)
+        checkbox_field = FieldFactory.create(type=FieldTypes.CHECKBOX)
+        product = self._create_product_with_data(date_field, "2024-01-01")
+        DataFactory.create(product=product, field=checkbox_field, value="true")
+        other_product = self._create_product_with_data(date_field, "2024-01-01")
+        DataFactory.create(product=other_product, field=checkbox_field, value="false")
+
+        response = self.client.get(
+            self.path,
+            {
+                f"data[{date_field.id}][lt]": "2024-02-01",
+                f"data[{checkbox_field.id}][exact]": "true",
+            },
+        )
+
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [str(product.id)]
+        )
+
+    def test_filter_products_on_select_data(self):
+        field = FieldFactory.create(type=FieldTypes.SELECT, choices=["a", "b", "c"])
+        product = self._create_product_with_data(field, "a,b")
+        self._create_product_with_data(field, "c")
+
+        response = self.client.get(self.path, {f"data[{field.id}][contains]": "b"})
+
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]], [str(product.id)]
+        )
+
+    def test_filter_products_on_data_uses_typed_column(self):
+        field = FieldFactory.create(type=FieldTypes.NUMBER)
+        self._create_product_with_data(field, "9")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.path, {f"data[{field.id}][gt]": "10"})
+
+        self.assertTrue(any('"value_number" > 10' in query["sql"] for query in queries))
+
+    def test_filter_products_on_data_with_invalid_filter_returns_error(self):
+        field = FieldFactory.create(type=FieldTypes.NUMBER)
+        text_field = FieldFactory.create(type=FieldTypes.TEXTFIELD)
+        unknown_id = uuid.uuid4()
+
+        response = self.client.get(
+            self.path,
+            {
+                f"data[{field.id}][gte]": "abc",
+                f"data[{text_field.id}][gte]": "abc",
+                f"data[{unknown_id}][gte]": "1",
+                "data[abc][gte]": "1",
+            },
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            {
+                f"data[{field.id}][gte]": [
+                    ErrorDetail(string="invalid number", code="invalid")
+                ],
+                f"data[{text_field.id}][gte]": [
+                    ErrorDetail(
+                        string="lookup gte is not supported for field type textfield",
+                        code="invalid",
+                    )
+                ],
+                f"data[{unknown_id}][gte]": [
+                    ErrorDetail(
+                        string=f"Field id {unknown_id} does not exist", code="invalid"
+                    )
+                ],
+                "data[abc][gte]": [
+                    ErrorDetail(string="abc is not a valid field id", code="invalid")
+                ],
+            },
+        )
+
+    def test_export_products(self):
+        product = self._create_product()
+        field = FieldFactory.create(product_type=product.product_type, name="field")
+        DataFactory.create(product=product, field=field, value="abc")
+
+        response = self.client.get(
+            self.path + "export/",
+            {"product_type_id": product.product_type.id, "export_format": "csv"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith(",field"))
+        self.assertTrue(lines[1].startswith(str(product.id)))
+        self.assertTrue(lines[1].endswith(",abc"))
+
+    def test_export_products_without_product_type_returns_error(self):
+        response = self.client.get(self.path + "export/")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["product_type_id"][0].code, "required")
+
+    def test_import_products(self):
+        line = json.dumps(
+            {
+                "product_type_id": str(self.product_type.id),
+                "bsn": "111222333",
+                "start_date": "2024-01-02",
+                "end_date": "2024-12-31",
+            }
+        )
+        upload = SimpleUploadedFile("products.ndjson", f"{line}\nnot json\n".encode())
+
+        response = self.client.post(
+            self.path + "import/", {"file": upload}, format="multipart"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["imported_count"], 1)
+        self.assertEqual(response.data["committed_lines"], 2)
+        self.assertTrue(response.data["finished"])
+        self.assertEqual(
+            response.data["rejects"],
+            [
+                {
+                    "line": 2,
+                    "errors": {"non_field_errors": ["invalid json"]},
+                    "input": "not json",
+                }
+            ],
+        )
+        self.assertEqual(Product.objects.get().product_type, self.product_type)
+
+    @patch.object(ProductViewSet, "max_import_rejects", 2)
+    def test_import_products_limits_returned_rejects(self):
+        upload = SimpleUploadedFile("products.ndjson", b"not json\n" * 3)
+
+        response = self.client.post(
+            self.path + "import/", {"file": upload}, format="multipart"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["rejected_count"], 3)
+        self.assertEqual(
+            [reject["line"] for reject in response.data["rejects"]], [1, 2]
+        )
+
+    def test_import_products_resumes_import(self):
+        product_import = ProductImport.objects.create(
+            source="products.ndjson", committed_lines=1
+        )
+        upload = SimpleUploadedFile("products.ndjson", b"not json\nnot json\n")
+
+        response = self.client.post(
+            self.path + "import/",
+            {"file": upload, "import_id": product_import.id},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["id"], str(product_import.id))
+        self.assertEqual([reject["line"] for reject in response.data["rejects"]], [2])
+
     def test_delete_product(self):
         product = self._create_product()
         response = self.delete(product.id)
@@ -64,6 +64,35 @@ class TestData(TestCase):
         data = DataFactory.create(field=field, value="abc,def")
         self.assertEqual(data.parse(), ["abc", "def"])
 
+    def test_save_fills_typed_value(self):
+        field = FieldFactory.create(type=FieldTypes.NUMBER)
+        data = DataFactory.create(field=field, value="5.5")
+
+        self.assertEqual(data.value_number, 5.5)
+        self.assertIsNone(data.value_json)
+
+        data.value = "6"
+        data.save(update_fields=["value"])
+        data.refresh_from_db()
+        self.assertEqual(data.value_number, 6)
+
+    def test_save_skips_typed_value_that_cannot_be_parsed(self):
+        field = FieldFactory.create(type=FieldTypes.NUMBER)
+        data = DataFactory.create(field=field, value="abc")
+
+        self.assertIsNone(data.value_number)
+
+    def test_typed_values_are_refilled_when_field_type_changes(self):
+        field = FieldFactory.create(type=FieldTypes.TEXTFIELD)
+        data = DataFactory.create(field=field, value="2024-07-16")
+        self.assertIsNone(data.value_date)
+
+        field.type = FieldTypes.DATE
+        field.save()
+
+        data.refresh_from_db()
+        self.assertEqual(data.value_date, datetime.date(2024, 7, 16))
+
     def _subtest_invalid_data_values(self, field: Field, *invalid_values):
         for invalid_value in invalid_values:
             with self.subTest(f"{invalid_value} should raise an error"):
@@ -0,0 +1,106 @@
+import csv
+import json
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from open_producten.producttypes.models import FieldTypes
+from open_producten.producttypes.tests.factories import FieldFactory, ProductTypeFactory
+
+from ..export import export_products
+from .factories import DataFactory, ProductFactory
+
+
+class TestExportProducts(TestCase):
+    def setUp(self):
+        self.product_type = ProductTypeFactory.create()
+        self.number_field = FieldFactory.create(
+            product_type=self.product_type, name="number", type=FieldTypes.NUMBER
+        )
+        self.text_field = FieldFactory.create(
+            product_type=self.product_type, name="text"
+        )
+
+        self.products = [
+            ProductFactory.create(product_type=self.product_type, bsn="111222333")
+            for _ in range(3)
+        ]
+        DataFactory.create(product=self.products[0], field=self.number_field, value="1")
+        DataFactory.create(product=self.products[0], field=self.text_field, value="a")
+        DataFactory.create(product=self.products[2], field=self.number_field, value="3")
+
+        # products of other product types are not exported.
+        DataFactory.create(field=FieldFactory.create(), value="other")
+
+    def test_export_ndjson(self):
+        rows = [
+            json.loads(line) for line in export_products(self.product_type, "ndjson")
+        ]
+
+        self.assertEqual(
+            [row["id"] for row in rows],
+            sorted(str(product.id) for product in self.products),
+        )
+        rows = {row["id"]: row for row in rows}
+        self.assertEqual(
+            {
+                key: rows[str(self.products[0].id)][key]
+                for key in ("bsn", "number", "text")
+            },
+            {"bsn": "111222333", "number": "1", "text": "a"},
+        )
+        self.assertEqual(rows[str(self.products[1].id)]["number"], None)
+        self.assertEqual(rows[str(self.products[2].id)]["number"], "3")
+
+    def test_export_csv(self):
+        rows = list(csv.reader(export_products(self.product_type, "csv")))
+
+        self.assertEqual(
+            rows[0],
+            [
+                "id",
+                "bsn",
+                "kvk",
+                "start_date",
+                "end_date",
+                "published",
+                "created_on",
+                "updated_on",
+                "number",
+                "text",
+            ],
+        )
+        self.assertEqual(len(rows), 4)
+        rows = {row[0]: row for row in rows[1:]}
+        self.assertEqual(rows[str(self.products[0].id)][8:], ["1", "a"])
+        self.assertEqual(rows[str(self.products[1].id)][8:], ["", ""])
+
+    def test_export_with_duplicate_field_names(self):
+        field = FieldFactory.create(product_type=self.product_type, name="text")
+
+        header = next(iter(export_products(self.product_type, "csv")))
+
+        self.assertIn(f"text ({field.id})", header)
+        self.assertIn(f"text ({self.text_field.id})", header)
+
+    def test_export_uses_fixed_number_of_queries(self):
+        with self.assertNumQueries(3):
+            list(export_products(self.product_type, "ndjson", chunk_size=1))
+
+
+class TestExportProductsCommand(TestCase):
+    def test_export_products(self):
+        product = ProductFactory.create(bsn="111222333")
+
+        out = StringIO()
+        call_command("export_products", str(product.product_type.id), stdout=out)
+
+        self.assertEqual(
+            [json.loads(line)["id"] for line in out.getvalue().splitlines()],
+            [str(product.id)],
+        )
+
+    def test_export_products_with_unknown_product_type(self):
+        with self.assertRaisesMessage(CommandError, "Product type abc does not exist."):
+            call_command("export_products", "abc", stdout=StringIO())
@@ -0,0 +1,193 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from open_producten.producttypes.models import FieldTypes
+from open_producten.producttypes.tests.factories import FieldFactory, ProductTypeFactory
+
+from ..importer import ProductImporter
+from ..models import Data, Product, ProductImport
+
+
+class TestProductImporter(TestCase):
+    def setUp(self):
+        self.product_type = ProductTypeFactory.create()
+        self.field = FieldFactory.create(
+            product_type=self.product_type,
+            name="number",
+            type=FieldTypes.NUMBER,
+            is_required=True,
+        )
+        self.text_field = FieldFactory.create(
+            product_type=self.product_type, name="text"
+        )
+
+    def _line(self, **kwargs):
+        return json.dumps(
+            {
+                "product_type_id": str(self.product_type.id),
+                "bsn": "111222333",
+                "start_date": "2024-01-02",
+                "end_date": "2024-12-31",
+                "data": [{"field_id": str(self.field.id), "value": "5"}],
+            }
+            | kwargs
+        )
+
+    def _run(self, lines, product_import=None, chunk_size=2):
+        product_import = product_import or ProductImport.objects.create(source="test")
+        importer = ProductImporter(product_import, chunk_size=chunk_size)
+        return product_import, [
+            reject for rejects in importer.run(lines) for reject in rejects
+        ]
+
+    def test_import_products(self):
+        value = 'tab\there\\N "quoted"\nnew line'
+        lines = [
+            self._line(),
+            self._line(
+                data=[
+                    {"field_id": str(self.field.id), "value": "1.5"},
+                    {"field_id": str(self.text_field.id), "value": value},
+                ],
+                published=True,
+            ),
+            "",
+            self._line(kvk="12345678", bsn=None),
+        ]
+
+        product_import = ProductImport.objects.create(source="test")
+        # the product types & fields, a transaction with two copies & the progress
+        # per chunk and the end of the import.
+        with self.assertNumQueries(2 + 2 * 5 + 1):
+            product_import, rejects = self._run(lines, product_import=product_import)
+
+        self.assertEqual(rejects, [])
+        self.assertEqual(Product.objects.count(), 3)
+        self.assertEqual(Product.objects.filter(published=True).count(), 1)
+        self.assertEqual(Data.objects.count(), 4)
+        self.assertEqual(Data.objects.get(field=self.text_field).value, value)
+        self.assertEqual(Data.objects.get(value="1.5").value_number, 1.5)
+        self.assertEqual(
+            (
+                product_import.committed_lines,
+                product_import.imported_count,
+                product_import.rejected_count,
+                product_import.finished,
+            ),
+            (4, 3, 0, True),
+        )
+
+    def test_import_products_rejects_invalid_lines(self):
+        lines = [
+            "not json",
+            self._line(bsn=None),
+            self._line(product_type_id="abc"),
+            self._line(data=[{"field_id": str(self.field.id), "value": "abc"}]),
+            self._line(data=[]),
+            self._line(),
+        ]
+
+        product_import, rejects = self._run(lines)
+
+        self.assertEqual(
+            [(reject.line, reject.errors) for reject in rejects],
+            [
+                (1, {"non_field_errors": ["invalid json"]}),
+                (
+                    2,
+                    {
+                        "non_field_errors": [
+                            "A product must be linked to a bsn or kvk number (or both)"
+                        ]
+                    },
+                ),
+                (3, {"product_type_id": ["Product type abc does not exist"]}),
+                (4, {"data": ["Data at index 0: ['invalid number']"]}),
+                (5, {"data": ["Missing required fields: number"]}),
+            ],
+        )
+        self.assertEqual(rejects[0].input, "not json")
+        self.assertEqual(Product.objects.count(), 1)
+        self.assertEqual(product_import.rejected_count, 5)
+
+    def test_import_products_resumes_after_last_committed_chunk(self):
+        lines = [self._line() for _ in range(5)]
+
+        def failing_lines():
+            yield from lines[:3]
+            raise OSError("read error")
+
+        product_import = ProductImport.objects.create(source="test")
+        with self.assertRaises(OSError):
+            self._run(failing_lines(), product_import=product_import)
+
+        product_import.refresh_from_db()
+        self.assertEqual(product_import.committed_lines, 2)
+        self.assertEqual(Product.objects.count(), 2)
+
+        product_import, _rejects = self._run(lines, product_import=product_import)
+
+        self.assertEqual(Product.objects.count(), 5)
+        self.assertEqual(product_import.imported_count, 5)
+        self.assertTrue(product_import.finished)
+
+
+class TestLoadProductsCommand(TestCase):
+    def setUp(self):
+        self.product_type = ProductTypeFactory.create()
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "products.ndjson")
+        self.addCleanup(self.directory.cleanup)
+
+    def call_command(self, *args, **kwargs):
+        out = StringIO()
+        call_command(
+            "load_products", self.filename, *args, stdout=out, stderr=StringIO()
+        )
+        return out.getvalue()
+
+    def test_load_products(self):
+        valid_line = json.dumps(
+            {
+                "product_type_id": str(self.product_type.id),
+                "bsn": "111222333",
+                "start_date": "2024-01-02",
+                "end_date": "2024-12-31",
+            }
+        )
+        with open(self.filename, "w") as f:
+            f.write(f"{valid_line}\nnot json\n{valid_line}\n")
+
+        result = self.call_command("--chunk-size", "1")
+
+        product_import = ProductImport.objects.get()
+        self.assertEqual(
+            result,
+            f"Importing products from {self.filename} (import {product_import.id})...\n"
+            "Done (2 products, 1 rejected).\n",
+        )
+        self.assertEqual(Product.objects.count(), 2)
+        with open(f"{self.filename}.rejects") as f:
+            self.assertEqual(
+                [json.loads(line) for line in f],
+                [
+                    {
+                        "line": 2,
+                        "errors": {"non_field_errors": ["invalid json"]},
+                        "input": "not json",
+                    }
+                ],
+            )
+
+    def test_resume_finished_import_raises_error(self):
+        product_import = ProductImport.objects.create(source="test", finished=True)
+
+        with self.assertRaisesMessage(
+            CommandError, f"Import {product_import.id} is already finished."
+        ):
+            self.call_command("--resume", str(product_import.id))
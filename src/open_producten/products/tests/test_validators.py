@@ -0,0 +1,62 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from open_producten.producttypes.models import FieldTypes
+from open_producten.producttypes.tests.factories import FieldFactory
+
+from ..models.validators import get_compiled_field, invalidate_compiled_field
+
+
+class TestCompiledField(TestCase):
+    def test_compiled_field_is_cached(self):
+        field = FieldFactory.create(type=FieldTypes.NUMBER)
+
+        self.assertIs(get_compiled_field(field), get_compiled_field(field))
+
+    def test_compiled_field_is_rebuilt_when_field_changes(self):
+        field = FieldFactory.create(type=FieldTypes.RADIO, choices=["a", "b"])
+        compiled = get_compiled_field(field)
+        compiled.validate("a")
+
+        field.choices = ["b", "c"]
+
+        self.assertIsNot(get_compiled_field(field), compiled)
+        with self.assertRaisesMessage(
+            ValidationError, "value does not exist in the field choices"
+        ):
+            get_compiled_field(field).validate("a")
+
+    def test_compiled_field_is_invalidated_on_save(self):
+        field = FieldFactory.create(type=FieldTypes.NUMBER)
+        compiled = get_compiled_field(field)
+
+        field.save()
+
+        self.assertIsNot(get_compiled_field(field), compiled)
+
+    def test_invalidate_compiled_field(self):
+        field = FieldFactory.create(type=FieldTypes.NUMBER)
+        compiled = get_compiled_field(field)
+
+        invalidate_compiled_field(field.id)
+
+        self.assertIsNot(get_compiled_field(field), compiled)
+
+    def test_validate_batch_of_values(self):
+        field = FieldFactory.create(type=FieldTypes.SELECT, choices=["a", "b", "c"])
+        validate = get_compiled_field(field).validate
+
+        for value in ["a", "a,b", "c,b,a"] * 100:
+            validate(value)
+
+        with self.assertRaisesMessage(
+            ValidationError, "value does not exist in the field choices"
+        ):
+            validate("a,d")
+
+    def test_fields_without_validator_or_parser(self):
+        field = FieldFactory.create(type=FieldTypes.TEXTFIELD)
+        compiled = get_compiled_field(field)
+
+        compiled.validate("anything")
+        self.assertIsNone(compiled.parse("anything"))
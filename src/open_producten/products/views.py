@@ -1,16 +1,120 @@
-from open_producten.products.models import Product
+from django.db.models.functions import Greatest
+from django.http import StreamingHttpResponse
+
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+
+from open_producten.products.export import CONTENT_TYPES, export_products
+from open_producten.products.filters import ProductFilterSet
+from open_producten.products.importer import ProductImporter
+from open_producten.products.models import Product, ProductImport
 from open_producten.products.serializers.product import (
+    ExportParameterSerializer,
+    ProductImportParameterSerializer,
+    ProductImportResultSerializer,
+    ProductImportSerializer,
     ProductSerializer,
     ProductUpdateSerializer,
 )
-from open_producten.utils.views import OrderedModelViewSet
+from open_producten.utils.prefetch import eager_load
+from open_producten.utils.views import ConditionalGetMixin, OrderedModelViewSet
 
 
-class ProductViewSet(OrderedModelViewSet):
+class ProductViewSet(ConditionalGetMixin, OrderedModelViewSet):
     queryset = Product.objects.all()
     lookup_url_field = "id"
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = ProductFilterSet
+    # the product type is part of the product representation.
+    last_modified_expression = Greatest("updated_on", "product_type__updated_on")
+    max_import_rejects = 100
 
     def get_serializer_class(self):
         if self.action in ("update", "partial_update"):
             return ProductUpdateSerializer
         return ProductSerializer
+
+    @extend_schema(
+        request=ProductSerializer(many=True),
+        responses={201: ProductSerializer(many=True)},
+    )
+    @action(detail=False, methods=["post"], pagination_class=None, filter_backends=())
+    def bulk(self, request):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        products = serializer.save()
+
+        # the created products are fetched again to load their relations in bulk.
+        fetched = eager_load(self.queryset, serializer.child).in_bulk(
+            [product.pk for product in products]
+        )
+        serializer = self.get_serializer(
+            [fetched[product.pk] for product in products], many=True
+        )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        parameters=[ExportParameterSerializer],
+        responses={
+            (200, content_type): OpenApiTypes.STR
+            for content_type in CONTENT_TYPES.values()
+        },
+    )
+    @action(detail=False)
+    def export(self, request):
+        """
+        Streams all products of a product type with their data as csv or ndjson.
+        """
+        parameters = ExportParameterSerializer(data=request.query_params)
+        parameters.is_valid(raise_exception=True)
+        product_type = parameters.validated_data["product_type"]
+        export_format = parameters.validated_data["export_format"]
+
+        response = StreamingHttpResponse(
+            export_products(product_type, export_format),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="products-{product_type.id}.{export_format}"'
+        )
+        return response
+
+    @extend_schema(
+        request={"multipart/form-data": ProductImportParameterSerializer},
+        responses=ProductImportResultSerializer,
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=(MultiPartParser,),
+    )
+    def import_products(self, request):
+        """
+        Imports the products of an uploaded NDJSON file, a stopped import is resumed
+        by uploading the file again with its ``import_id``.
+
+        Only the first ``max_import_rejects`` rejects are returned, all rejects are
+        counted in ``rejected_count``.
+        """
+        parameters = ProductImportParameterSerializer(data=request.data)
+        parameters.is_valid(raise_exception=True)
+        upload = parameters.validated_data["file"]
+        product_import = parameters.validated_data.get(
+            "product_import"
+        ) or ProductImport.objects.create(source=upload.name)
+
+        rejects = []
+        for chunk_rejects in ProductImporter(product_import).run(upload):
+            rejects.extend(
+                reject._asdict()
+                for reject in chunk_rejects[: self.max_import_rejects - len(rejects)]
+            )
+        return Response(
+            ProductImportSerializer(product_import).data | {"rejects": rejects}
+        )
@@ -1,7 +1,8 @@
 from django import forms
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
 from django.forms import BaseModelFormSet
-from django.utils.translation import gettext as _
+from django.utils.translation import gettext as _, ngettext
 
 from treebeard.admin import TreeAdmin
 from treebeard.forms import movenodeform_factory
@@ -23,20 +24,23 @@ class CategoryAdminForm(movenodeform_factory(Category)):
 
 
 class CategoryAdminFormSet(BaseModelFormSet):
+    def _construct_form(self, i, **kwargs):
+        form = super()._construct_form(i, **kwargs)
+        # the published states of all rows are validated at once in clean()
+        form.instance.validate_published = False
+        return form
+
     def clean(self):
         super().clean()
 
-        data = {
+        published = {
             form.cleaned_data["id"]: form.cleaned_data["published"]
             for form in self.forms
+            if form.cleaned_data.get("id")
         }
 
-        for category, published in data.items():
-            if children := category.get_children():
-                if not published and any([data[child] for child in children]):
-                    raise forms.ValidationError(
-                        _("Parent nodes cannot be unpublished with published children.")
-                    )
+        if errors := Category.get_published_errors(published):
+            raise forms.ValidationError(errors)
 
 
 @admin.register(Category)
@@ -79,6 +83,41 @@ class CategoryAdmin(TreeAdmin):
         "published",
     ]
 
+    actions = ("publish_subtree", "unpublish_subtree")
+
+    def _set_subtree_published(self, request, queryset, published: bool):
+        count = 0
+        updated_paths = []
+        # parents first, so their subtrees can be published.
+        for category in queryset.order_by("path"):
+            if category.path.startswith(tuple(updated_paths)):
+                continue
+            try:
+                count += category.set_subtree_published(published)
+                updated_paths.append(category.path)
+            except ValidationError as err:
+                self.message_user(
+                    request, f"{category}: {err.message}", level=messages.ERROR
+                )
+
+        self.message_user(
+            request,
+            ngettext(
+                "%(count)d category was updated.",
+                "%(count)d categories were updated.",
+                count,
+            )
+            % {"count": count},
+        )
+
+    @admin.action(description=_("Publish the selected categories and subcategories"))
+    def publish_subtree(self, request, queryset):
+        self._set_subtree_published(request, queryset, True)
+
+    @admin.action(description=_("Unpublish the selected categories and subcategories"))
+    def unpublish_subtree(self, request, queryset):
+        self._set_subtree_published(request, queryset, False)
+
     def get_changelist_formset(self, request, **kwargs):
         kwargs["formset"] = CategoryAdminFormSet
         return super().get_changelist_formset(request, **kwargs)
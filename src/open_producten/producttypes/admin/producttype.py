@@ -42,6 +42,7 @@ class ProductTypeAdmin(admin.ModelAdmin):
         "organisations",
         "contacts",
         "locations",
+        "uniform_product_name",
     )
     search_fields = ("name",)
     ordering = ("name",)
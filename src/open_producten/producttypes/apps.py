@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProducttypesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "open_producten.producttypes"
+
+    def ready(self):
+        from . import signals  # noqa
@@ -0,0 +1,114 @@
+"""
+Process local cache of the category tree.
+
+The tree rarely changes but is read for every parent, ancestor and subtree lookup.
+It is kept in memory by every worker and validated against a token in the shared
+cache, which is reset by the signals whenever a category is saved, moved or
+deleted.
+
+The cached tree is meant for reads: validation of writes should query the
+database, as changes in a transaction that is rolled back would otherwise remain
+in the cache of the worker.
+"""
+
+import uuid
+
+from open_producten.utils.cache import get_cache_token, reset_cache_token
+
+from .models import Category
+
+CATEGORY_TREE_NAMESPACE = "category_tree"
+
+
+class CategoryTree:
+    """
+    The categories in path order, with the parent and children of every category
+    stored as positions in that list. As the categories are in depth first order
+    the descendants of a category follow it up to the end of its subtree.
+    """
+
+    def __init__(self, categories: list[Category]):
+        self.categories = categories
+        self.positions = {category.id: i for i, category in enumerate(categories)}
+        self.parents: list[int | None] = []
+        self.children: list[list[int]] = [[] for _ in categories]
+        self.subtree_ends = [len(categories)] * len(categories)
+
+        paths = {}
+        open_subtrees = []
+        for i, category in enumerate(categories):
+            paths[category.path] = i
+
+            parent = paths.get(category.path[: -Category.steplen])
+            self.parents.append(parent)
+            if parent is not None:
+                self.children[parent].append(i)
+
+            while open_subtrees and not category.path.startswith(
+                categories[open_subtrees[-1]].path
+            ):
+                self.subtree_ends[open_subtrees.pop()] = i
+            open_subtrees.append(i)
+
+    def __contains__(self, category_id: uuid.UUID) -> bool:
+        return category_id in self.positions
+
+    def get(self, category_id: uuid.UUID) -> Category | None:
+        position = self.positions.get(category_id)
+        return None if position is None else self.categories[position]
+
+    def get_parent(self, category_id: uuid.UUID) -> Category | None:
+        position = self.positions.get(category_id)
+        if position is None or self.parents[position] is None:
+            return None
+        return self.categories[self.parents[position]]
+
+    def get_children(self, category_id: uuid.UUID) -> list[Category]:
+        position = self.positions.get(category_id)
+        if position is None:
+            return []
+        return [self.categories[child] for child in self.children[position]]
+
+    def get_ancestors(self, category_id: uuid.UUID) -> list[Category]:
+        """
+        Returns the ancestors of a category, starting at the root.
+        """
+        ancestors = []
+        position = self.positions.get(category_id)
+        while position is not None and self.parents[position] is not None:
+            position = self.parents[position]
+            ancestors.append(self.categories[position])
+        return ancestors[::-1]
+
+    def get_descendants(
+        self, category_id: uuid.UUID, include_self: bool = False
+    ) -> list[Category]:
+        position = self.positions.get(category_id)
+        if position is None:
+            return []
+        start = position if include_self else position + 1
+        end = self.subtree_ends[position]
+        return self.categories[start:end]
+
+
+_cached_tree: tuple[str | None, CategoryTree | None] = (None, None)
+
+
+def get_category_tree() -> CategoryTree:
+    global _cached_tree
+
+    token = get_cache_token(CATEGORY_TREE_NAMESPACE)
+    cached_token, tree = _cached_tree
+    if tree is not None and token is not None and token == cached_token:
+        return tree
+
+    tree = CategoryTree(list(Category.objects.order_by("path")))
+    _cached_tree = (token, tree)
+    return tree
+
+
+def invalidate_category_tree():
+    """
+    Invalidates the cached tree in all workers.
+    """
+    reset_cache_token(CATEGORY_TREE_NAMESPACE)
@@ -0,0 +1,43 @@
+from django.utils.translation import gettext_lazy as _
+
+from django_filters import rest_framework as filters
+
+from open_producten.utils.filters import CharInFilter, ManyToManyFilter
+
+from .category_tree import get_category_tree
+from .models import ProductType
+from .models.producttype import CategoryProductType
+
+
+class ProductTypeFilterSet(filters.FilterSet):
+    tags = ManyToManyFilter(help_text=_("Comma separated tag ids"))
+    tag_types = ManyToManyFilter(
+        field_name="tags",
+        related_lookup="type",
+        help_text=_("Comma separated tag type ids"),
+    )
+    category = filters.UUIDFilter(
+        method="filter_category",
+        help_text=_("Category id, the product types of its subcategories are included"),
+    )
+    uniform_product_name = filters.CharFilter(
+        field_name="uniform_product_name__uri",
+        help_text=_("Uri of the uniform product name"),
+    )
+    organisations = ManyToManyFilter(help_text=_("Comma separated organisation ids"))
+    locations = ManyToManyFilter(help_text=_("Comma separated location ids"))
+    keywords = CharInFilter(
+        lookup_expr="contains",
+        help_text=_("Comma separated keywords which the product type all has"),
+    )
+
+    class Meta:
+        model = ProductType
+        fields = ("published",)
+
+    def filter_category(self, queryset, name, value):
+        categories = get_category_tree().get_descendants(value, include_self=True)
+        relations = CategoryProductType.objects.filter(
+            category__in=[category.id for category in categories]
+        )
+        return queryset.filter(pk__in=relations.values("product_type"))
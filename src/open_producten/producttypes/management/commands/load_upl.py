@@ -1,13 +1,21 @@
+from contextlib import closing
 from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable
 
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
 
 from open_producten.producttypes.models import (
+    UniformProductListImport,
     UniformProductName as UniformProductNameModel,
 )
+from open_producten.producttypes.models.upn import upns_bulk_saved
 
 from ..parsers import CsvParser
 
+SEEN_URIS_TABLE = "load_upl_seen_uris"
+
 
 @dataclass
 class UniformProductName:
@@ -15,11 +23,19 @@ class UniformProductName:
     uri: str
 
 
+@dataclass
+class LoadCounts:
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
 class Command(BaseCommand):
 
     def __init__(self):
         self.help = "Load upn to the database from a given XML/CSV file."
         self.parser = CsvParser()
+        self.batch_size = 1000
         super().__init__()
 
     def add_arguments(self, parser):
@@ -27,42 +43,144 @@ class Command(BaseCommand):
             "filename",
             help="The name of the file to be imported.",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Import the file even if it is unchanged since the last import.",
+        )
 
     def handle(self, **options):
         filename = options.pop("filename")
 
         self.stdout.write(f"Importing upn from {filename}...")
 
+        last_import = None
+        if not options["force"]:
+            last_import = UniformProductListImport.objects.filter(
+                source=filename
+            ).first()
+
         try:
-            data = self.parser.parse(filename)
-            upn_objects = [
-                UniformProductName(name=entry["UniformeProductnaam"], uri=entry["URI"])
-                for entry in data
-            ]
-            created_count = self.load_upl(upn_objects)
+            with self.parser.open_csv(
+                filename,
+                etag=last_import.etag if last_import else "",
+                last_modified=last_import.last_modified if last_import else "",
+            ) as csv_file:
+                if csv_file is None:
+                    self.stdout.write("Unchanged since the last import.")
+                    return
+
+                if last_import and csv_file.content_hash == last_import.content_hash:
+                    # keep the headers of the url for the next conditional request.
+                    UniformProductListImport.objects.filter(pk=last_import.pk).update(
+                        etag=csv_file.etag, last_modified=csv_file.last_modified
+                    )
+                    self.stdout.write("Unchanged since the last import.")
+                    return
+
+                # the rows are closed before the file, also when a row fails.
+                with closing(csv_file.rows()) as rows:
+                    data = (
+                        UniformProductName(
+                            name=entry["UniformeProductnaam"], uri=entry["URI"]
+                        )
+                        for entry in rows
+                    )
+                    counts = self.load_upl(data)
 
         except KeyError as e:
             raise CommandError(f"{str(e)} does not exist in csv.")
         except Exception as e:
             raise CommandError(str(e))
 
-        self.stdout.write(f"Done ({created_count} objects).")
+        UniformProductListImport.objects.update_or_create(
+            source=filename,
+            defaults={
+                "content_hash": csv_file.content_hash,
+                "etag": csv_file.etag,
+                "last_modified": csv_file.last_modified,
+            },
+        )
 
-    def load_upl(self, data: list[UniformProductName]) -> int:
-        count = 0
-        upn_updated_list = []
+        self.stdout.write(
+            f"Done ({counts.created} created, {counts.updated} updated, "
+            f"{counts.deleted} deleted)."
+        )
+
+    @transaction.atomic()
+    def load_upl(self, data: Iterable[UniformProductName]) -> LoadCounts:
+        """
+        Upserts the upns in batches and marks the upns that are not in the data as
+        deleted with a single update against a temporary table of the seen uris.
+        """
+        counts = LoadCounts()
+        changed_ids = []
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {SEEN_URIS_TABLE} "
+                "(uri varchar PRIMARY KEY) ON COMMIT DROP"
+            )
 
-        for obj in data:
-            upn, created = UniformProductNameModel.objects.update_or_create(
-                uri=obj.uri,
-                defaults={"name": obj.name, "is_deleted": False},
+            data = iter(data)
+            while batch := list(islice(data, self.batch_size)):
+                # the last row of a uri wins, as a row can only be upserted once.
+                batch = {obj.uri: obj for obj in batch}
+                cursor.execute(
+                    f"INSERT INTO {SEEN_URIS_TABLE} (uri) "
+                    "SELECT unnest(%s::varchar[]) ON CONFLICT DO NOTHING",
+                    [list(batch)],
+                )
+                changed_ids += self.upsert_batch(list(batch.values()), counts)
+
+            cursor.execute(
+                f"UPDATE {UniformProductNameModel._meta.db_table} upn "
+                "SET is_deleted = true WHERE NOT upn.is_deleted AND NOT EXISTS "
+                f"(SELECT 1 FROM {SEEN_URIS_TABLE} seen WHERE seen.uri = upn.uri) "
+                "RETURNING upn.id"
             )
-            upn_updated_list.append(upn.id)
+            deleted_ids = [row[0] for row in cursor.fetchall()]
+            counts.deleted = len(deleted_ids)
+
+            # the table is dropped on commit, unless the command runs in a
+            # transaction of the caller.
+            cursor.execute(f"DROP TABLE {SEEN_URIS_TABLE}")
 
-            if created:
-                count += 1
+        if changed_ids or deleted_ids:
+            upns_bulk_saved.send(
+                sender=UniformProductNameModel, upn_ids=changed_ids + deleted_ids
+            )
+        return counts
+
+    def upsert_batch(self, batch: list[UniformProductName], counts: LoadCounts):
+        """
+        Writes the new and changed upns of a batch with a single upsert, returns the
+        ids of the existing upns that are changed.
+        """
+        existing = {
+            upn.uri: upn
+            for upn in UniformProductNameModel.objects.filter(
+                uri__in=[obj.uri for obj in batch]
+            )
+        }
+
+        changed = []
+        for obj in batch:
+            upn = existing.get(obj.uri)
+            if upn is None:
+                counts.created += 1
+            elif upn.name != obj.name or upn.is_deleted:
+                counts.updated += 1
+            else:
+                continue
+            changed.append(
+                UniformProductNameModel(name=obj.name, uri=obj.uri, is_deleted=False)
+            )
 
-        UniformProductNameModel.objects.exclude(id__in=upn_updated_list).update(
-            is_deleted=True,
+        UniformProductNameModel.objects.bulk_create(
+            changed,
+            update_conflicts=True,
+            unique_fields=["uri"],
+            update_fields=["name", "is_deleted"],
         )
-        return count
+        return [existing[obj.uri].id for obj in changed if obj.uri in existing]
@@ -1,29 +1,83 @@
 import csv
+import hashlib
+import io
 import os
-from tempfile import NamedTemporaryFile
-from typing import List
+from contextlib import contextmanager
+from dataclasses import dataclass
+from tempfile import TemporaryFile
+from typing import IO, Iterator
 
 import requests
 
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class CsvFile:
+    file: IO[bytes]
+    content_hash: str
+    etag: str = ""
+    last_modified: str = ""
+
+    def rows(self) -> Iterator[dict]:
+        self.file.seek(0)
+        wrapper = io.TextIOWrapper(self.file, encoding="utf-8-sig", newline="")
+        try:
+            yield from csv.DictReader(wrapper)
+        finally:
+            # the file is closed by the owner and not by the wrapper.
+            wrapper.detach()
+
 
 class CsvParser:
 
-    def parse(self, filename: str):
+    def check_format(self, filename: str):
         _, extension = os.path.splitext(filename)
         file_format = extension[1:]
 
         if file_format != "csv":
             raise Exception("File format is not csv")
 
+    @contextmanager
+    def open_csv(
+        self, filename: str, etag: str = "", last_modified: str = ""
+    ) -> Iterator[CsvFile | None]:
+        """
+        Opens a local or remote csv file and computes its content hash, a remote
+        file is downloaded with a conditional request and ``None`` is returned
+        when it is not modified.
+        """
+        self.check_format(filename)
+
         if not filename.startswith("http"):
-            return self.process_csv(filename)
+            with open(filename, "rb") as f:
+                content_hash = hashlib.sha256()
+                while chunk := f.read(CHUNK_SIZE):
+                    content_hash.update(chunk)
+                yield CsvFile(f, content_hash.hexdigest())
+            return
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        with requests.get(filename, headers=headers, stream=True) as response:
+            if response.status_code == 304:
+                yield None
+                return
+            response.raise_for_status()
 
-        with NamedTemporaryFile() as f:
-            f.write(requests.get(filename).content)
-            f.seek(0)
-            return self.process_csv(f.name)
+            with TemporaryFile() as f:
+                content_hash = hashlib.sha256()
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    content_hash.update(chunk)
+                    f.write(chunk)
 
-    def process_csv(self, filename: str) -> List[dict]:
-        with open(filename, encoding="utf-8-sig") as f:
-            data = csv.DictReader(f)
-            return list(data)
+                yield CsvFile(
+                    f,
+                    content_hash.hexdigest(),
+                    etag=response.headers.get("ETag", ""),
+                    last_modified=response.headers.get("Last-Modified", ""),
+                )
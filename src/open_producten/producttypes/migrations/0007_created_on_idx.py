@@ -0,0 +1,25 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypes", "0006_remove_uniformproductname_url_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["created_on", "id"], name="category_created_on_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="producttype",
+            index=models.Index(
+                fields=["created_on", "id"], name="producttype_created_on_idx"
+            ),
+        ),
+    ]
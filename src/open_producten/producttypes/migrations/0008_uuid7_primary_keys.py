@@ -0,0 +1,134 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:30
+
+from django.db import migrations, models
+import open_producten.utils.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypes", "0007_created_on_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="category",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="condition",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="field",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="file",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="link",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="price",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="priceoption",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="producttype",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="question",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tag",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tagtype",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="uniformproductname",
+            name="id",
+            field=models.UUIDField(
+                default=open_producten.utils.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
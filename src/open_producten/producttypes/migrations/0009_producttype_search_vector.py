@@ -0,0 +1,45 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:39
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypes", "0008_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="producttype",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="producttype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="producttype_search_idx"
+            ),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE producttypes_producttype SET search_vector =
+                setweight(to_tsvector('dutch', coalesce(name, '')), 'A')
+                || setweight(to_tsvector('dutch', coalesce(summary, '')), 'B')
+                || setweight(
+                    to_tsvector('dutch', array_to_string(keywords, ' ')), 'B'
+                )
+                || setweight(
+                    to_tsvector(
+                        'dutch', regexp_replace(content, '<[^>]*>', ' ', 'g')
+                    ),
+                    'D'
+                );
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
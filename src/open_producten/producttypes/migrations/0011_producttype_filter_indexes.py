@@ -0,0 +1,26 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:46
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypes", "0010_name_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="producttype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["keywords"], name="producttype_keywords_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="producttype",
+            index=models.Index(
+                fields=["published", "id"], name="producttype_published_idx"
+            ),
+        ),
+    ]
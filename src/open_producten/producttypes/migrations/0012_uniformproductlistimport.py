@@ -0,0 +1,75 @@
+# Generated by Django 4.2.13 on 2026-10-18 21:26
+
+from django.db import migrations, models
+import open_producten.utils.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypes", "0011_producttype_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UniformProductListImport",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=open_producten.utils.models.uuid7,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "source",
+                    models.CharField(
+                        help_text="The file or url of the uniform product list.",
+                        max_length=1000,
+                        unique=True,
+                        verbose_name="Source",
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(
+                        help_text="The sha256 hash of the imported file.",
+                        max_length=64,
+                        verbose_name="Content hash",
+                    ),
+                ),
+                (
+                    "etag",
+                    models.CharField(
+                        blank=True,
+                        help_text="The ETag header of the imported url.",
+                        max_length=255,
+                        verbose_name="ETag",
+                    ),
+                ),
+                (
+                    "last_modified",
+                    models.CharField(
+                        blank=True,
+                        help_text="The Last-Modified header of the imported url.",
+                        max_length=255,
+                        verbose_name="Last modified",
+                    ),
+                ),
+                (
+                    "imported_on",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="The datetime of the last import.",
+                        verbose_name="Imported on",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Uniform product list import",
+                "verbose_name_plural": "Uniform product list imports",
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.13 on 2026-10-18 21:44
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("producttypes", "0012_uniformproductlistimport"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="uniformproductname",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("uri"), name="gin_trgm_ops"
+                ),
+                name="upn_uri_trgm_idx",
+            ),
+        ),
+    ]
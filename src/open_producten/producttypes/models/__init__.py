@@ -7,10 +7,11 @@ from .price import Price, PriceOption
 from .producttype import CategoryProductType, ProductType
 from .question import Question
 from .tag import Tag, TagType
-from .upn import UniformProductName
+from .upn import UniformProductListImport, UniformProductName
 
 __all__ = [
     "UniformProductName",
+    "UniformProductListImport",
     "Question",
     "Category",
     "Condition",
@@ -1,5 +1,9 @@
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.functions import Left, Length
+from django.dispatch import Signal
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from treebeard.exceptions import InvalidMoveToDescendant
@@ -7,6 +11,18 @@ from treebeard.mp_tree import MP_MoveHandler, MP_Node
 
 from open_producten.utils.models import BasePublishableModel
 
+# treebeard moves nodes with queryset updates, which do not send post_save.
+category_moved = Signal()
+# sent when the published state of a subtree is updated with a queryset update.
+category_subtree_published = Signal()
+
+PARENT_UNPUBLISHED_ERROR = _(
+    "Parent nodes have to be published in order to publish a child."
+)
+CHILDREN_PUBLISHED_ERROR = _(
+    "Parent nodes cannot be unpublished if they have published children."
+)
+
 
 class PublishedMoveHandler(MP_MoveHandler):
     def process(self):
@@ -14,7 +30,9 @@ class PublishedMoveHandler(MP_MoveHandler):
             raise InvalidMoveToDescendant(
                 _("Published nodes cannot be nested under unpublished ones.")
             )
-        return super().process()
+        result = super().process()
+        category_moved.send(sender=type(self.node), instance=self.node)
+        return result
 
 
 class Category(MP_Node, BasePublishableModel):
@@ -41,10 +59,17 @@ class Category(MP_Node, BasePublishableModel):
         help_text=_("Image of the category"),
     )
 
+    # disabled when the published states of several categories are validated at
+    # once, see CategoryAdminFormSet.
+    validate_published = True
+
     class Meta:
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
         ordering = ("path",)
+        indexes = [
+            models.Index(fields=["created_on", "id"], name="category_created_on_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -53,17 +78,93 @@ class Category(MP_Node, BasePublishableModel):
     def parent_category(self):
         return self.get_parent()
 
+    def get_ancestor_paths(self, include_self: bool = False) -> list[str]:
+        """
+        Decodes the paths of the ancestors from the materialized path, starting at
+        the root.
+        """
+        end = len(self.path) + (self.steplen if include_self else 0)
+        return [self.path[:i] for i in range(self.steplen, end, self.steplen)]
+
+    @classmethod
+    def build_tree(cls, categories) -> list["Category"]:
+        """
+        Nests path-ordered categories in the ``tree_children`` of their parent and
+        returns the categories whose parent is not included.
+        """
+        nodes = {}
+        roots = []
+        for category in categories:
+            category.tree_children = []
+            nodes[category.path] = category
+
+            parent = nodes.get(category.path[: -cls.steplen])
+            if parent is None:
+                roots.append(category)
+            else:
+                parent.tree_children.append(category)
+        return roots
+
     def move(self, target, pos=None):
         return PublishedMoveHandler(self, target, pos).process()
 
+    @classmethod
+    def get_published_errors(cls, published: dict["Category", bool]) -> list[str]:
+        """
+        Checks that the given published states leave no published category with an
+        unpublished parent. The stored state is used for the other categories.
+
+        The parents and children of all categories are fetched with one query on
+        their paths.
+        """
+        states = {category.path: state for category, state in published.items()}
+        parent_paths = {
+            path[: -cls.steplen]
+            for path, state in states.items()
+            if state and len(path) > cls.steplen
+        }
+        unpublished_paths = {
+            path for path, state in states.items() if path and not state
+        }
+
+        related = (
+            cls.objects.alias(parent_path=Left("path", Length("path") - cls.steplen))
+            .filter(Q(path__in=parent_paths) | Q(parent_path__in=unpublished_paths))
+            .values_list("path", "published")
+        )
+        for path, state in related:
+            states.setdefault(path, state)
+
+        errors = []
+        if any(states.get(path) is False for path in parent_paths):
+            errors.append(PARENT_UNPUBLISHED_ERROR)
+        if any(
+            state and not states.get(path[: -cls.steplen], True)
+            for path, state in states.items()
+            if path[: -cls.steplen] in unpublished_paths
+        ):
+            errors.append(CHILDREN_PUBLISHED_ERROR)
+        return errors
+
     def clean(self):
-        if self.published and self.parent_category:
-            if not self.parent_category.published:
-                raise ValidationError(
-                    _("Parent nodes have to be published in order to publish a child.")
-                )
-
-        if not self.published and self.get_children().filter(published=True).exists():
-            raise ValidationError(
-                _("Parent nodes cannot be unpublished if they have published children.")
-            )
+        if not self.validate_published:
+            return
+
+        if errors := self.get_published_errors({self: self.published}):
+            raise ValidationError(errors[0])
+
+    @transaction.atomic()
+    def set_subtree_published(self, published: bool) -> int:
+        """
+        Publishes or unpublishes the category and all of its descendants with a
+        single update, returns the number of updated categories.
+        """
+        if published and (errors := self.get_published_errors({self: True})):
+            raise ValidationError(errors[0])
+
+        count = Category.objects.filter(path__startswith=self.path).update(
+            published=published, updated_on=timezone.now()
+        )
+        self.refresh_from_db(fields=("published", "updated_on"))
+        category_subtree_published.send(sender=type(self), instance=self)
+        return count
@@ -3,12 +3,17 @@ from decimal import Decimal
 
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.dispatch import Signal
 from django.utils.translation import gettext_lazy as _
 
 from open_producten.utils.models import BaseModel
 
 from .producttype import ProductType
 
+# sent with the price of which the options are written with bulk creates and
+# updates, which do not send post_save.
+price_options_bulk_saved = Signal()
+
 
 class Price(BaseModel):
     product_type = models.ForeignKey(
@@ -1,17 +1,62 @@
 from datetime import date
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import F, Func, Value
+from django.dispatch import Signal
 from django.utils.translation import gettext_lazy as _
 
 from open_producten.locations.models import Contact, Location, Organisation
 from open_producten.utils.models import BasePublishableModel
+from open_producten.utils.search import trigram_index
 
 from .category import Category
 from .condition import Condition
 from .tag import Tag
 from .upn import UniformProductName
 
+# bulk creates and updates do not send post_save & m2m_changed, the changed
+# relations are sent as the pks of the related objects by field name.
+product_types_bulk_saved = Signal()
+
+SEARCH_CONFIG = "dutch"
+SEARCH_FIELDS = {"name", "summary", "keywords", "content"}
+
+
+def get_search_vector():
+    """
+    Weighted search document of a product type, the html tags are stripped from the
+    content.
+    """
+    return (
+        SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("summary", weight="B", config=SEARCH_CONFIG)
+        + SearchVector(
+            Func(
+                F("keywords"),
+                Value(" "),
+                function="array_to_string",
+                output_field=models.TextField(),
+            ),
+            weight="B",
+            config=SEARCH_CONFIG,
+        )
+        + SearchVector(
+            Func(
+                F("content"),
+                Value("<[^>]*>"),
+                Value(" "),
+                Value("g"),
+                function="regexp_replace",
+                output_field=models.TextField(),
+            ),
+            weight="D",
+            config=SEARCH_CONFIG,
+        )
+    )
+
 
 class CategoryProductType(models.Model):
     """
@@ -134,14 +179,38 @@ class ProductType(BasePublishableModel):
         help_text=_("Locations where the product is available at."),
     )
 
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         verbose_name = _("Product type")
         verbose_name_plural = _("Product types")
+        indexes = [
+            models.Index(
+                fields=["created_on", "id"], name="producttype_created_on_idx"
+            ),
+            GinIndex(fields=["search_vector"], name="producttype_search_idx"),
+            trigram_index("name", name="producttype_name_trgm_idx"),
+            GinIndex(fields=["keywords"], name="producttype_keywords_idx"),
+            models.Index(fields=["published", "id"], name="producttype_published_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or SEARCH_FIELDS.intersection(update_fields):
+            ProductType.objects.filter(pk=self.pk).update(
+                search_vector=get_search_vector()
+            )
+
     @property
     def current_price(self):
+        # set by the current-prices endpoint to resolve the prices in bulk.
+        if hasattr(self, "prefetched_current_prices"):
+            return next(iter(self.prefetched_current_prices), None)
+
         now = date.today()
         return self.prices.filter(valid_from__lte=now).order_by("valid_from").last()
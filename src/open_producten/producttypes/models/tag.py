@@ -2,6 +2,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from open_producten.utils.models import BaseModel
+from open_producten.utils.search import trigram_index
 
 
 class TagType(BaseModel):
@@ -41,6 +42,7 @@ class Tag(BaseModel):
     class Meta:
         verbose_name = _("Tag")
         verbose_name_plural = _("Tags")
+        indexes = [trigram_index("name", name="tag_name_trgm_idx")]
 
     def __str__(self):
         return self.name
@@ -1,7 +1,12 @@
 from django.db import models
+from django.dispatch import Signal
 from django.utils.translation import gettext_lazy as _
 
 from open_producten.utils.models import BaseModel
+from open_producten.utils.search import trigram_index
+
+# sent with the pks of the upns that are changed by a bulk upsert or update.
+upns_bulk_saved = Signal()
 
 
 class UniformProductName(BaseModel):
@@ -26,6 +31,53 @@ class UniformProductName(BaseModel):
     class Meta:
         verbose_name = _("Uniform product name")
         verbose_name_plural = _("Uniform product names")
+        indexes = [
+            trigram_index("name", name="upn_name_trgm_idx"),
+            trigram_index("uri", name="upn_uri_trgm_idx"),
+        ]
 
     def __str__(self):
         return self.name
+
+
+class UniformProductListImport(BaseModel):
+    """
+    The version of the last imported uniform product list of a source, to skip
+    imports of an unchanged list.
+    """
+
+    source = models.CharField(
+        verbose_name=_("Source"),
+        max_length=1000,
+        help_text=_("The file or url of the uniform product list."),
+        unique=True,
+    )
+    content_hash = models.CharField(
+        verbose_name=_("Content hash"),
+        max_length=64,
+        help_text=_("The sha256 hash of the imported file."),
+    )
+    etag = models.CharField(
+        verbose_name=_("ETag"),
+        max_length=255,
+        blank=True,
+        help_text=_("The ETag header of the imported url."),
+    )
+    last_modified = models.CharField(
+        verbose_name=_("Last modified"),
+        max_length=255,
+        blank=True,
+        help_text=_("The Last-Modified header of the imported url."),
+    )
+    imported_on = models.DateTimeField(
+        verbose_name=_("Imported on"),
+        auto_now=True,
+        help_text=_("The datetime of the last import."),
+    )
+
+    class Meta:
+        verbose_name = _("Uniform product list import")
+        verbose_name_plural = _("Uniform product list imports")
+
+    def __str__(self):
+        return self.source
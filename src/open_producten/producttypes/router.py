@@ -3,6 +3,7 @@ from django.urls import include, path
 from rest_framework_nested.routers import DefaultRouter, NestedSimpleRouter
 
 from open_producten.producttypes.views import (
+    AutocompleteView,
     CategoryQuestionViewSet,
     CategoryViewSet,
     ConditionViewSet,
@@ -60,6 +61,7 @@ ProductTypesRouter.register("tags", TagViewSet, basename="tag")
 ProductTypesRouter.register("tagtypes", TagTypeViewSet, basename="tagtype")
 
 product_type_urlpatterns = [
+    path("autocomplete/", AutocompleteView.as_view(), name="autocomplete"),
     path("", include(ProductTypesRouter.urls)),
     path("", include(ProductTypesLinkRouter.urls)),
     path("", include(ProductTypesPriceRouter.urls)),
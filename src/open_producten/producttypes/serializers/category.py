@@ -4,8 +4,13 @@ from django.db import transaction
 from rest_framework import serializers
 
 from open_producten.producttypes.models import Category, ProductType, UniformProductName
-from open_producten.utils.serializers import build_array_duplicates_error_message
+from open_producten.utils.serializers import (
+    BulkPrimaryKeyRelatedField,
+    DynamicFieldsSerializerMixin,
+    build_array_duplicates_error_message,
+)
 
+from ..category_tree import get_category_tree
 from .children import QuestionSerializer
 
 
@@ -16,18 +21,86 @@ class SimpleProductTypeSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ProductType
-        exclude = ("categories", "conditions", "tags", "related_product_types")
+        exclude = (
+            "categories",
+            "conditions",
+            "tags",
+            "related_product_types",
+            "search_vector",
+        )
 
 
-class CategorySerializer(serializers.ModelSerializer):
-    parent_category = serializers.PrimaryKeyRelatedField(
+class CategoryReferenceSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Category
+        fields = ("id", "name")
+
+
+class CategoryLineageMixin:
+    """
+    Loads the ancestors of the categories of all serialized instances at once, with
+    a single query on the ancestor paths decoded from their materialized paths.
+    """
+
+    def get_lineage_categories(self, instances) -> list[Category]:
+        """
+        Returns the categories of which the lineage is loaded, the serialized
+        instances themselves by default.
+        """
+        return instances
+
+    def get_lineage(self) -> dict[str, Category]:
+        root = self.root
+        if not hasattr(root, "_lineage"):
+            instances = root.instance
+            if not isinstance(root, serializers.ListSerializer):
+                instances = [instances]
+
+            paths = {
+                path
+                for category in self.get_lineage_categories(instances)
+                for path in category.get_ancestor_paths(include_self=True)
+            }
+            categories = Category.objects.filter(path__in=paths)
+            if "inherited_questions" in self.fields:
+                categories = categories.prefetch_related("questions")
+            root._lineage = {category.path: category for category in categories}
+        return root._lineage
+
+    def get_lineage_questions(self, paths: list[str]) -> list:
+        lineage = self.get_lineage()
+        questions = [
+            question
+            for path in paths
+            if path in lineage
+            for question in lineage[path].questions.all()
+        ]
+        return QuestionSerializer(questions, many=True).data
+
+
+class ParentCategoryField(serializers.PrimaryKeyRelatedField):
+    def get_attribute(self, instance):
+        # read from the cached tree instead of a query per category, the tree is
+        # resolved once for all serialized categories.
+        root = self.root
+        if not hasattr(root, "_category_tree"):
+            root._category_tree = get_category_tree()
+        return root._category_tree.get_parent(instance.id)
+
+
+class CategorySerializer(
+    CategoryLineageMixin, DynamicFieldsSerializerMixin, serializers.ModelSerializer
+):
+    parent_category = ParentCategoryField(
         queryset=Category.objects.all(),
         allow_null=True,
     )
     product_types = SimpleProductTypeSerializer(many=True, read_only=True)
     questions = QuestionSerializer(many=True, read_only=True)
+    ancestors = serializers.SerializerMethodField()
+    inherited_questions = serializers.SerializerMethodField()
 
-    product_type_ids = serializers.PrimaryKeyRelatedField(
+    product_type_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=ProductType.objects.all(),
         default=[],
@@ -35,10 +108,22 @@ class CategorySerializer(serializers.ModelSerializer):
         source="product_types",
     )
 
+    optional_fields = ("ancestors", "inherited_questions")
+
     class Meta:
         model = Category
         exclude = ("path", "depth", "numchild")
 
+    def get_ancestors(self, obj):
+        lineage = self.get_lineage()
+        ancestors = [
+            lineage[path] for path in obj.get_ancestor_paths() if path in lineage
+        ]
+        return CategoryReferenceSerializer(ancestors, many=True).data
+
+    def get_inherited_questions(self, obj):
+        return self.get_lineage_questions(obj.get_ancestor_paths())
+
     def _handle_relations(self, instance, product_types):
         errors = dict()
         if product_types is not None:
@@ -95,3 +180,26 @@ class CategorySerializer(serializers.ModelSerializer):
         self._handle_relations(instance, product_types)
         instance.save()
         return instance
+
+
+class CategoryTreeSerializer(serializers.ModelSerializer):
+    product_types = SimpleProductTypeSerializer(many=True, read_only=True)
+    questions = QuestionSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Category
+        exclude = ("path", "depth", "numchild")
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields["children"] = CategoryTreeSerializer(
+            many=True, read_only=True, source="tree_children"
+        )
+        return fields
+
+
+class CategoryTreeParameterSerializer(serializers.Serializer):
+    root = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.all(), required=False
+    )
+    depth = serializers.IntegerField(min_value=1, required=False)
@@ -15,6 +15,7 @@ from ..models import (
     Tag,
     TagType,
 )
+from ..models.price import price_options_bulk_saved
 
 
 class PriceOptionSerializer(serializers.ModelSerializer):
@@ -43,9 +44,10 @@ class PriceSerializer(serializers.ModelSerializer):
         product_type = validated_data.pop("product_type")
 
         price = Price.objects.create(**validated_data, product_type=product_type)
-
-        for option in options:
-            PriceOption.objects.create(price=price, **option)
+        PriceOption.objects.bulk_create(
+            [PriceOption(price=price, **option) for option in options]
+        )
+        price_options_bulk_saved.send(sender=PriceOption, price=price)
 
         return price
 
@@ -53,51 +55,74 @@ class PriceSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         options = validated_data.pop("options", None)
         price = super().update(instance, validated_data)
-        option_errors = []
 
         if options is not None:
-            current_option_ids = set(
-                price.options.values_list("id", flat=True).distinct()
-            )
-            seen_option_ids = set()
-            for idx, option in enumerate(options):
-                option_id = option.pop("id", None)
-                if option_id is None:
-                    PriceOption.objects.create(price=price, **option)
-
-                elif option_id in current_option_ids:
-
-                    if option_id in seen_option_ids:
-                        option_errors.append(
-                            f"Duplicate option id {option_id} at index {idx}"
-                        )
-                    seen_option_ids.add(option_id)
-
-                    existing_option = PriceOption.objects.get(id=option_id)
-                    existing_option.amount = option["amount"]
-                    existing_option.description = option["description"]
-                    existing_option.save()
-
-                else:
-                    try:
-                        PriceOption.objects.get(id=option_id)
-                        option_errors.append(
-                            f"Price option id {option_id} at index {idx} is not part of price object"
-                        )
-                    except PriceOption.DoesNotExist:
-                        option_errors.append(
-                            f"Price option id {option_id} at index {idx} does not exist"
-                        )
-
-            if option_errors:
-                raise serializers.ValidationError({"options": option_errors})
-
-            PriceOption.objects.filter(
-                id__in=(current_option_ids - seen_option_ids)
-            ).delete()
+            self._update_options(price, options)
 
         return price
 
+    def _update_options(self, price, options):
+        """
+        Diffs the options with the current options of the price in memory, the
+        changes are written with a bulk create, a bulk update and a single delete.
+        """
+        current_options = {option.id: option for option in price.options.all()}
+
+        # only needed to tell options of other prices apart from unknown ids.
+        other_option_ids = [
+            option["id"]
+            for option in options
+            if option.get("id") is not None and option["id"] not in current_options
+        ]
+        if other_option_ids:
+            other_option_ids = set(
+                PriceOption.objects.filter(id__in=other_option_ids).values_list(
+                    "id", flat=True
+                )
+            )
+
+        new_options, updated_options = [], []
+        option_errors = []
+        seen_option_ids = set()
+        for idx, option in enumerate(options):
+            option_id = option.pop("id", None)
+            if option_id is None:
+                new_options.append(PriceOption(price=price, **option))
+
+            elif option_id in current_options:
+                if option_id in seen_option_ids:
+                    option_errors.append(
+                        f"Duplicate option id {option_id} at index {idx}"
+                    )
+                seen_option_ids.add(option_id)
+
+                existing_option = current_options[option_id]
+                existing_option.amount = option["amount"]
+                existing_option.description = option["description"]
+                updated_options.append(existing_option)
+
+            elif option_id in other_option_ids:
+                option_errors.append(
+                    f"Price option id {option_id} at index {idx} is not part of price object"
+                )
+            else:
+                option_errors.append(
+                    f"Price option id {option_id} at index {idx} does not exist"
+                )
+
+        if option_errors:
+            raise serializers.ValidationError({"options": option_errors})
+
+        PriceOption.objects.bulk_create(new_options)
+        PriceOption.objects.bulk_update(
+            updated_options, fields=("amount", "description")
+        )
+        PriceOption.objects.filter(
+            id__in=(current_options.keys() - seen_option_ids)
+        ).delete()
+
+        price_options_bulk_saved.send(sender=PriceOption, price=price)
+
 
 class FieldSerializer(serializers.ModelSerializer):
     class Meta:
@@ -1,10 +1,21 @@
 from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
 
 from rest_framework import serializers
 
-from open_producten.utils.serializers import build_array_duplicates_error_message
+from open_producten.utils.models import bulk_set_many_to_many
+from open_producten.utils.serializers import (
+    BulkListSerializer,
+    BulkPrimaryKeyRelatedField,
+    BulkSlugRelatedField,
+    DynamicFieldsSerializerMixin,
+    build_array_duplicates_error_message,
+)
 
 from ..models import Category, Condition, ProductType, Tag, UniformProductName
+from ..models.producttype import get_search_vector, product_types_bulk_saved
+from .category import CategoryLineageMixin, CategoryReferenceSerializer
 from .children import (
     ConditionSerializer,
     FieldSerializer,
@@ -22,9 +33,85 @@ class SimpleCategorySerializer(serializers.ModelSerializer):
         exclude = ("path", "depth", "numchild")
 
 
-class ProductTypeSerializer(serializers.ModelSerializer):
+# the many-to-many fields that are written through the serializer, by the name of
+# their serializer field.
+RELATION_FIELDS = {
+    "related_product_types": "related_product_types",
+    "categories": "category_ids",
+    "tags": "tag_ids",
+    "conditions": "condition_ids",
+    "organisations": "organisations",
+    "contacts": "contacts",
+    "locations": "locations",
+}
+
+
+class ProductTypeBulkSerializer(BulkListSerializer):
+    """
+    Creates and updates a list of product types with bulk inserts and updates, the
+    relations of all product types are written with one diff per through table.
+    """
+
+    @transaction.atomic()
+    def create(self, validated_data):
+        now = timezone.now()
+        product_types, created, updated = [], [], []
+        update_fields = {"updated_on"}
+        relations = {field_name: {} for field_name in RELATION_FIELDS}
+
+        for attrs in validated_data:
+            attrs = attrs.copy()
+            instance = attrs.pop("instance")
+            # relations without a default are left unchanged when they are omitted.
+            related = {
+                field_name: attrs.pop(field_name)
+                for field_name in RELATION_FIELDS
+                if field_name in attrs
+            }
+
+            if instance is None:
+                instance = ProductType(**attrs)
+                created.append(instance)
+            else:
+                for attr, value in attrs.items():
+                    setattr(instance, attr, value)
+                instance.updated_on = now
+                update_fields.update(attrs)
+                updated.append(instance)
+
+            product_types.append(instance)
+            for field_name, objects in related.items():
+                relations[field_name][instance.pk] = [obj.pk for obj in objects]
+
+        ProductType.objects.bulk_create(created)
+        if updated:
+            ProductType.objects.bulk_update(updated, fields=sorted(update_fields))
+
+        product_type_ids = [product_type.pk for product_type in product_types]
+        ProductType.objects.filter(pk__in=product_type_ids).update(
+            search_vector=get_search_vector()
+        )
+
+        changed_relations = {}
+        for field_name, values in relations.items():
+            added, removed = bulk_set_many_to_many(
+                ProductType._meta.get_field(field_name), values
+            )
+            changed_relations[field_name] = added | removed
+
+        product_types_bulk_saved.send(
+            sender=ProductType,
+            product_type_ids=product_type_ids,
+            changed_relations=changed_relations,
+        )
+        return product_types
+
+
+class ProductTypeSerializer(
+    CategoryLineageMixin, DynamicFieldsSerializerMixin, serializers.ModelSerializer
+):
     tags = TagSerializer(many=True, read_only=True)
-    tag_ids = serializers.PrimaryKeyRelatedField(
+    tag_ids = BulkPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.all(),
         default=[],
@@ -32,16 +119,16 @@ class ProductTypeSerializer(serializers.ModelSerializer):
         source="tags",
     )
 
-    related_product_types = serializers.PrimaryKeyRelatedField(
+    related_product_types = BulkPrimaryKeyRelatedField(
         many=True, queryset=ProductType.objects.all(), default=[]
     )
 
-    uniform_product_name = serializers.SlugRelatedField(
+    uniform_product_name = BulkSlugRelatedField(
         slug_field="uri", queryset=UniformProductName.objects.all()
     )
 
     conditions = ConditionSerializer(many=True, read_only=True)
-    condition_ids = serializers.PrimaryKeyRelatedField(
+    condition_ids = BulkPrimaryKeyRelatedField(
         many=True,
         write_only=True,
         queryset=Condition.objects.all(),
@@ -50,7 +137,7 @@ class ProductTypeSerializer(serializers.ModelSerializer):
     )
 
     categories = SimpleCategorySerializer(many=True, read_only=True)
-    category_ids = serializers.PrimaryKeyRelatedField(
+    category_ids = BulkPrimaryKeyRelatedField(
         many=True,
         write_only=True,
         queryset=Category.objects.all(),
@@ -62,38 +149,71 @@ class ProductTypeSerializer(serializers.ModelSerializer):
     prices = PriceSerializer(many=True, read_only=True)
     links = LinkSerializer(many=True, read_only=True)
     files = FileSerializer(many=True, read_only=True)
+    breadcrumbs = serializers.SerializerMethodField()
+    inherited_questions = serializers.SerializerMethodField()
+
+    optional_fields = ("breadcrumbs", "inherited_questions")
 
     class Meta:
         model = ProductType
-        fields = "__all__"
+        exclude = ("search_vector",)
+        list_serializer_class = ProductTypeBulkSerializer
+
+    def get_lineage_categories(self, instances):
+        prefetch_related_objects(instances, "categories")
+        return [
+            category for instance in instances for category in instance.categories.all()
+        ]
+
+    def get_breadcrumbs(self, obj):
+        lineage = self.get_lineage()
+        return [
+            CategoryReferenceSerializer(
+                [
+                    lineage[path]
+                    for path in category.get_ancestor_paths(include_self=True)
+                    if path in lineage
+                ],
+                many=True,
+            ).data
+            for category in obj.categories.all()
+        ]
+
+    def get_inherited_questions(self, obj):
+        paths = {
+            path
+            for category in obj.categories.all()
+            for path in category.get_ancestor_paths(include_self=True)
+        }
+        return self.get_lineage_questions(sorted(paths))
 
     def validate_category_ids(self, category_ids):
         if len(category_ids) == 0:
             raise serializers.ValidationError("At least one category is required")
         return category_ids
 
+    def validate(self, attrs):
+        errors = dict()
+        for source, field_name in RELATION_FIELDS.items():
+            if source in attrs:
+                build_array_duplicates_error_message(attrs[source], field_name, errors)
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
     def _handle_relations(
         self, instance, related_product_types, categories, tags, conditions
     ):
-        errors = dict()
         if related_product_types is not None:
-            build_array_duplicates_error_message(
-                related_product_types, "related_product_types", errors
-            )
             instance.related_product_types.set(related_product_types)
         if categories is not None:
-            build_array_duplicates_error_message(categories, "category_ids", errors)
             instance.categories.set(categories)
         if tags is not None:
-            build_array_duplicates_error_message(tags, "tag_ids", errors)
             instance.tags.set(tags)
         if conditions is not None:
-            build_array_duplicates_error_message(conditions, "condition_ids", errors)
             instance.conditions.set(conditions)
 
-        if errors:
-            raise serializers.ValidationError(errors)
-
     @transaction.atomic()
     def create(self, validated_data):
         related_product_types = validated_data.pop("related_product_types")
@@ -127,6 +247,30 @@ class ProductTypeSerializer(serializers.ModelSerializer):
         return instance
 
 
+class SearchParameterSerializer(serializers.Serializer):
+    q = serializers.CharField()
+
+
+class AutocompleteParameterSerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
+
+
+class AutocompleteSuggestionSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    label = serializers.CharField()
+
+
+class AutocompleteSerializer(serializers.Serializer):
+    producttypes = AutocompleteSuggestionSerializer(many=True)
+    tags = AutocompleteSuggestionSerializer(many=True)
+    organisations = AutocompleteSuggestionSerializer(many=True)
+
+
+class CurrentPriceParameterSerializer(serializers.Serializer):
+    as_of = serializers.DateField(required=False)
+
+
 class ProductTypeCurrentPriceSerializer(serializers.ModelSerializer):
     upl_uri = serializers.ReadOnlyField(source="uniform_product_name.uri")
     upl_name = serializers.ReadOnlyField(source="uniform_product_name.name")
@@ -0,0 +1,259 @@
+"""
+Keeps ``updated_on`` of product types and categories in sync with the rows that are
+rendered as part of their API representation, so it can be used as the version
+for conditional requests, and invalidates the cached API responses and category
+tree.
+"""
+
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from open_producten.locations.models import Contact, Location, Organisation
+from open_producten.utils.cache import bump_cache_version
+
+from .category_tree import invalidate_category_tree
+from .models import (
+    Category,
+    Condition,
+    Field,
+    File,
+    Link,
+    Price,
+    PriceOption,
+    ProductType,
+    Question,
+    Tag,
+    TagType,
+    UniformProductName,
+)
+from .models.category import category_moved, category_subtree_published
+from .models.price import price_options_bulk_saved
+from .models.producttype import product_types_bulk_saved
+from .models.upn import upns_bulk_saved
+
+API_CACHE_NAMESPACE = "producttypes"
+
+
+def touch(queryset):
+    queryset.update(updated_on=timezone.now())
+
+
+@receiver(post_save, sender=Price)
+@receiver(post_delete, sender=Price)
+@receiver(post_save, sender=Link)
+@receiver(post_delete, sender=Link)
+@receiver(post_save, sender=Field)
+@receiver(post_delete, sender=Field)
+@receiver(post_save, sender=File)
+@receiver(post_delete, sender=File)
+def touch_product_type(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(pk=instance.product_type_id))
+
+
+@receiver(post_save, sender=PriceOption)
+def touch_price_product_type(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(prices=instance.price_id))
+
+
+def touch_deleted_option_product_types(price_ids: set):
+    if price_ids:
+        touch(ProductType.objects.filter(prices__in=price_ids))
+        price_ids.clear()
+
+
+@receiver(post_delete, sender=PriceOption)
+def touch_deleted_option_price_product_type(sender, instance, **kwargs):
+    # the options of a price are often deleted together, their product types are
+    # touched once on commit. The pending price ids are kept per connection.
+    connection = transaction.get_connection()
+    if not hasattr(connection, "deleted_option_price_ids"):
+        connection.deleted_option_price_ids = set()
+
+    connection.deleted_option_price_ids.add(instance.price_id)
+    transaction.on_commit(
+        partial(touch_deleted_option_product_types, connection.deleted_option_price_ids)
+    )
+
+
+@receiver(price_options_bulk_saved, sender=PriceOption)
+def touch_bulk_saved_price_product_type(sender, price, **kwargs):
+    touch(ProductType.objects.filter(pk=price.product_type_id))
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def touch_question_parent(sender, instance, **kwargs):
+    if instance.product_type_id:
+        touch(ProductType.objects.filter(pk=instance.product_type_id))
+    if instance.category_id:
+        touch(Category.objects.filter(pk=instance.category_id))
+
+
+@receiver(post_save, sender=Tag)
+def touch_tag_product_types(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(tags=instance))
+
+
+@receiver(post_save, sender=TagType)
+def touch_tag_type_product_types(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(tags__type=instance))
+
+
+@receiver(post_save, sender=Condition)
+def touch_condition_product_types(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(conditions=instance))
+
+
+@receiver(post_save, sender=UniformProductName)
+def touch_upn_product_types(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(uniform_product_name=instance))
+
+
+@receiver(upns_bulk_saved, sender=UniformProductName)
+def touch_bulk_saved_upn_product_types(sender, upn_ids, **kwargs):
+    touch(ProductType.objects.filter(uniform_product_name__in=upn_ids))
+
+
+@receiver(post_save, sender=Category)
+def touch_category_product_types(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(categories=instance))
+
+
+@receiver(post_save, sender=ProductType)
+def touch_product_type_categories(sender, instance, **kwargs):
+    touch(Category.objects.filter(product_types=instance))
+
+
+@receiver(pre_delete, sender=ProductType)
+def touch_deleted_product_type_relations(sender, instance, **kwargs):
+    touch(Category.objects.filter(product_types=instance))
+    touch(ProductType.objects.filter(related_product_types=instance))
+
+
+@receiver(category_moved, sender=Category)
+def touch_moved_category(sender, instance, **kwargs):
+    touch(Category.objects.filter(pk=instance.pk))
+
+
+@receiver(category_subtree_published, sender=Category)
+def touch_subtree_product_types(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(categories__path__startswith=instance.path))
+
+
+@receiver(product_types_bulk_saved, sender=ProductType)
+def touch_bulk_saved_relations(sender, product_type_ids, changed_relations, **kwargs):
+    touch(
+        Category.objects.filter(
+            Q(product_types__in=product_type_ids)
+            | Q(pk__in=changed_relations["categories"])
+        )
+    )
+    touch(
+        ProductType.objects.filter(
+            pk__in=changed_relations["related_product_types"]
+        ).exclude(pk__in=product_type_ids)
+    )
+
+
+def touch_product_type_relations(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    field_name = M2M_FIELDS[sender]
+
+    # the cleared relations cannot be retrieved after the clear.
+    if action == "pre_clear":
+        if reverse:
+            related = ProductType.objects.filter(**{field_name: instance})
+        else:
+            related = getattr(instance, field_name).all()
+        pk_set = set(related.values_list("pk", flat=True))
+
+    if reverse:
+        product_type_pks, related_pks = pk_set, {instance.pk}
+    else:
+        product_type_pks, related_pks = {instance.pk}, pk_set
+
+    touch(ProductType.objects.filter(pk__in=product_type_pks))
+    if field_name == "categories":
+        touch(Category.objects.filter(pk__in=related_pks))
+    elif field_name == "related_product_types":
+        touch(ProductType.objects.filter(pk__in=related_pks))
+
+
+M2M_FIELDS = {
+    getattr(ProductType, field_name).through: field_name
+    for field_name in (
+        "tags",
+        "conditions",
+        "categories",
+        "related_product_types",
+        "organisations",
+        "contacts",
+        "locations",
+    )
+}
+
+for through in M2M_FIELDS:
+    m2m_changed.connect(touch_product_type_relations, sender=through)
+
+
+# deleting these removes the m2m rows without sending m2m_changed, the product types
+# are touched before the delete while the relations still exist.
+DELETED_RELATION_FIELDS = {
+    Tag: "tags",
+    Condition: "conditions",
+    Category: "categories",
+    Organisation: "organisations",
+    Contact: "contacts",
+    Location: "locations",
+}
+
+
+def touch_deleted_relation_product_types(sender, instance, **kwargs):
+    touch(ProductType.objects.filter(**{DELETED_RELATION_FIELDS[sender]: instance}))
+
+
+for model in DELETED_RELATION_FIELDS:
+    pre_delete.connect(touch_deleted_relation_product_types, sender=model)
+
+
+def invalidate_api_cache(sender, action=None, **kwargs):
+    # a response of the old rows that is cached before the transaction commits
+    # would otherwise be stored under the new version.
+    if action is None or action.startswith("post_"):
+        transaction.on_commit(partial(bump_cache_version, API_CACHE_NAMESPACE))
+
+
+for model in apps.get_app_config("producttypes").get_models():
+    post_save.connect(invalidate_api_cache, sender=model)
+    post_delete.connect(invalidate_api_cache, sender=model)
+
+# deleting these removes the m2m rows without sending m2m_changed
+for model in (Organisation, Contact, Location):
+    post_delete.connect(invalidate_api_cache, sender=model)
+
+for through in M2M_FIELDS:
+    m2m_changed.connect(invalidate_api_cache, sender=through)
+
+category_moved.connect(invalidate_api_cache, sender=Category)
+category_subtree_published.connect(invalidate_api_cache, sender=Category)
+product_types_bulk_saved.connect(invalidate_api_cache, sender=ProductType)
+price_options_bulk_saved.connect(invalidate_api_cache, sender=PriceOption)
+upns_bulk_saved.connect(invalidate_api_cache, sender=UniformProductName)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(category_moved, sender=Category)
+@receiver(category_subtree_published, sender=Category)
+def invalidate_cached_category_tree(sender, **kwargs):
+    # other workers could rebuild the tree before the transaction is committed.
+    invalidate_category_tree()
+    transaction.on_commit(invalidate_category_tree)
@@ -0,0 +1,61 @@
+from rest_framework.test import APIClient
+
+from open_producten.locations.tests.factories import OrganisationFactory
+from open_producten.producttypes.tests.factories import ProductTypeFactory, TagFactory
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+
+class TestAutocompleteView(BaseApiTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = "/api/v1/autocomplete/"
+
+    def test_autocomplete_without_credentials_returns_error(self):
+        response = APIClient().get(self.path, {"q": "paspoort"})
+        self.assertEqual(response.status_code, 401)
+
+    def test_autocomplete_returns_id_label_pairs(self):
+        product_type = ProductTypeFactory.create(name="Paspoort")
+        tag = TagFactory.create(name="Paspoorten")
+        organisation = OrganisationFactory.create(name="Paspoortbalie")
+
+        response = self.client.get(self.path, {"q": "pas"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {
+                "producttypes": [{"id": product_type.id, "label": "Paspoort"}],
+                "tags": [{"id": tag.id, "label": "Paspoorten"}],
+                "organisations": [{"id": organisation.id, "label": "Paspoortbalie"}],
+            },
+        )
+
+    def test_autocomplete_orders_prefix_matches_before_similar_matches(self):
+        similar = ProductTypeFactory.create(name="Paspoort")
+        prefix = ProductTypeFactory.create(name="Paspot aanvragen")
+        ProductTypeFactory.create(name="Rijbewijs")
+
+        response = self.client.get(self.path, {"q": "PASPOT"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["id"] for result in response.data["producttypes"]],
+            [prefix.id, similar.id],
+        )
+
+    def test_autocomplete_with_limit(self):
+        for name in ("Parkeren", "Parkeervergunning", "Parkeerkaart"):
+            ProductTypeFactory.create(name=name)
+
+        response = self.client.get(self.path, {"q": "park", "limit": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["producttypes"]), 2)
+
+    def test_autocomplete_with_short_query_returns_error(self):
+        response = self.client.get(self.path, {"q": "p"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["q"][0].code, "min_length")
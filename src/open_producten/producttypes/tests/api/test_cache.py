@@ -0,0 +1,157 @@
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from open_producten.accounts.models import User
+from open_producten.producttypes.serializers.children import PriceSerializer
+from open_producten.producttypes.tests.factories import (
+    CategoryFactory,
+    LinkFactory,
+    PriceFactory,
+    PriceOptionFactory,
+    ProductTypeFactory,
+    TagFactory,
+)
+from open_producten.utils.cache import get_cache_version
+from open_producten.utils.tests.cases import BaseApiTestCase
+
+from ...signals import API_CACHE_NAMESPACE
+
+
+class TestCatalogResponseCache(BaseApiTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = "/api/v1/producttypes/"
+
+    def test_cached_response_does_not_query_catalog(self):
+        product_type = ProductTypeFactory.create()
+        response = self.get(product_type.id)
+
+        # oidc config & token
+        with self.assertNumQueries(2):
+            cached_response = self.get(product_type.id)
+
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_response.data, response.data)
+        self.assertEqual(cached_response["ETag"], response["ETag"])
+
+    def test_cache_is_keyed_on_query(self):
+        ProductTypeFactory.create()
+        self.get()
+
+        response = self.client.get(self.path, {"fields": "id"})
+
+        self.assertEqual(set(response.data["results"][0]), {"id"})
+
+    def test_cache_is_not_shared_between_users(self):
+        ProductTypeFactory.create()
+        self.get()
+
+        user = User.objects.create_user(username="other", password="password")
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION="Token " + Token.objects.create(user=user).key
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.path)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            any(
+                'FROM "producttypes_producttype"' in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+
+    def test_cache_is_invalidated_on_save(self):
+        product_type = ProductTypeFactory.create()
+        self.get(product_type.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product_type.name = "updated"
+            product_type.save()
+
+        self.assertEqual(self.get(product_type.id).data["name"], "updated")
+
+    def test_cache_is_invalidated_on_child_delete(self):
+        product_type = ProductTypeFactory.create()
+        link = LinkFactory.create(product_type=product_type)
+        self.assertEqual(len(self.get(product_type.id).data["links"]), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            link.delete()
+
+        self.assertEqual(self.get(product_type.id).data["links"], [])
+
+    def test_cache_is_invalidated_on_m2m_change(self):
+        product_type = ProductTypeFactory.create()
+        self.get(product_type.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product_type.tags.add(TagFactory.create())
+
+        self.assertEqual(len(self.get(product_type.id).data["tags"]), 1)
+
+    def test_cache_is_invalidated_on_category_move(self):
+        parent = CategoryFactory.create()
+        category = CategoryFactory.create()
+        self.path = "/api/v1/categories/"
+        self.assertIsNone(self.get(category.id).data["parent_category"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category.move(parent, "last-child")
+
+        self.assertEqual(self.get(category.id).data["parent_category"], parent.id)
+
+    def test_cache_version_is_bumped_after_commit(self):
+        product_type = ProductTypeFactory.create()
+        version = get_cache_version(API_CACHE_NAMESPACE)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                product_type.name = "updated"
+                product_type.save()
+
+                self.assertEqual(get_cache_version(API_CACHE_NAMESPACE), version)
+
+        self.assertEqual(get_cache_version(API_CACHE_NAMESPACE), version + 1)
+
+    def test_cache_is_invalidated_when_price_options_are_bulk_written(self):
+        price = PriceFactory.create()
+        option = PriceOptionFactory.create(price=price)
+        PriceOptionFactory.create(price=price)
+        updated_on = price.product_type.updated_on
+        version = get_cache_version(API_CACHE_NAMESPACE)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PriceSerializer()._update_options(
+                price,
+                [{"id": option.id, "amount": "20", "description": "updated"}],
+            )
+
+        self.assertEqual(list(price.options.all()), [option])
+        self.assertGreater(get_cache_version(API_CACHE_NAMESPACE), version)
+        price.product_type.refresh_from_db()
+        self.assertGreater(price.product_type.updated_on, updated_on)
+
+    def test_deleted_price_options_touch_product_type_once_on_commit(self):
+        price = PriceFactory.create()
+        PriceOptionFactory.create_batch(3, price=price)
+        updated_on = price.product_type.updated_on
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            price.options.all().delete()
+
+        with CaptureQueriesContext(connection) as context:
+            for callback in callbacks:
+                callback()
+
+        self.assertEqual(
+            len([query for query in context if query["sql"].startswith("UPDATE")]), 1
+        )
+        price.product_type.refresh_from_db()
+        self.assertGreater(price.product_type.updated_on, updated_on)
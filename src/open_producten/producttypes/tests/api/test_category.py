@@ -1,14 +1,20 @@
+from unittest.mock import patch
+
+from django.db import connection
 from django.forms import model_to_dict
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIClient
 
+from open_producten.producttypes.category_tree import get_category_tree
 from open_producten.producttypes.models import Category, Link
 from open_producten.producttypes.tests.factories import (
     CategoryFactory,
     ProductTypeFactory,
     QuestionFactory,
 )
+from open_producten.utils.cache import get_response_cache
 from open_producten.utils.tests.cases import BaseApiTestCase
 
 
@@ -95,6 +101,26 @@ class TestCategoryViewSet(BaseApiTestCase):
             },
         )
 
+    def test_create_category_with_unknown_product_type_returns_error(self):
+        product_type = ProductTypeFactory.create()
+        unknown_id = "4f4b3bbd-e7e6-4b4d-a0b6-0ce5ddfb3b45"
+        data = self.data | {"product_type_ids": [product_type.id, unknown_id]}
+
+        response = self.post(data)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            {
+                "product_type_ids": [
+                    ErrorDetail(
+                        string=f"ProductType id {unknown_id} at index 1 does not exist",
+                        code="does_not_exist",
+                    )
+                ]
+            },
+        )
+
     def test_create_published_child_with_unpublished_parent_returns_error(self):
         parent = CategoryFactory.create(published=False)
 
@@ -327,6 +353,34 @@ class TestCategoryViewSet(BaseApiTestCase):
         self.assertEqual(response.data["count"], 1)
         self.assertEqual(response.data["results"], [category_to_dict(category)])
 
+    def test_read_categories_resolves_category_tree_once(self):
+        root = CategoryFactory.create()
+        child = root.add_child(name="child")
+        child.add_child(name="grandchild")
+
+        with patch(
+            "open_producten.producttypes.serializers.category.get_category_tree",
+            wraps=get_category_tree,
+        ) as mock_get_category_tree:
+            response = self.get()
+
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(
+            {category["parent_category"] for category in response.data["results"]},
+            {None, root.id, child.id},
+        )
+        mock_get_category_tree.assert_called_once()
+
+    def test_read_categories_with_sparse_fields(self):
+        category = CategoryFactory.create()
+
+        response = self.client.get(self.path, {"fields": "id,name"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["results"], [{"id": str(category.id), "name": category.name}]
+        )
+
     def test_read_category(self):
         category = CategoryFactory.create()
 
@@ -335,6 +389,244 @@ class TestCategoryViewSet(BaseApiTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, category_to_dict(category))
 
+    def test_read_category_etag_changes_when_question_changes(self):
+        category = CategoryFactory.create()
+        etag = self.get(category.id)["ETag"]
+
+        response = self.client.get(
+            f"{self.path}{category.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            QuestionFactory.create(category=category)
+
+        response = self.client.get(
+            f"{self.path}{category.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_read_category_etag_changes_when_product_type_is_added(self):
+        category = CategoryFactory.create()
+        etag = self.get(category.id)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category.product_types.add(ProductTypeFactory.create())
+
+        response = self.client.get(
+            f"{self.path}{category.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_read_category_etag_changes_when_product_type_is_deleted(self):
+        category = CategoryFactory.create()
+        product_type = ProductTypeFactory.create()
+        category.product_types.add(product_type)
+        etag = self.get(category.id)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product_type.delete()
+
+        response = self.client.get(
+            f"{self.path}{category.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["product_types"], [])
+
+    def test_read_category_with_ancestors_and_inherited_questions(self):
+        root = CategoryFactory.create(name="root")
+        child = root.add_child(name="child")
+        category = child.add_child(name="category")
+        root_question = QuestionFactory.create(category=root)
+        child_question = QuestionFactory.create(category=child)
+        QuestionFactory.create(category=category)
+
+        response = self.client.get(
+            f"{self.path}{category.id}/",
+            {"include": "ancestors,inherited_questions"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["ancestors"],
+            [
+                {"id": str(root.id), "name": "root"},
+                {"id": str(child.id), "name": "child"},
+            ],
+        )
+        self.assertEqual(
+            [question["id"] for question in response.data["inherited_questions"]],
+            [str(root_question.id), str(child_question.id)],
+        )
+
+    def test_read_category_without_include_excludes_ancestors(self):
+        category = CategoryFactory.create()
+
+        response = self.get(category.id)
+
+        self.assertNotIn("ancestors", response.data)
+        self.assertNotIn("inherited_questions", response.data)
+
+    def test_read_categories_with_ancestors_uses_fixed_number_of_queries(self):
+        query = {"include": "ancestors,inherited_questions"}
+        parent = CategoryFactory.create()
+        parent.add_child(name="child")
+        self.client.get(self.path, query)
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as single_context:
+            self.client.get(self.path, query)
+
+        for _ in range(5):
+            parent = CategoryFactory.create()
+            QuestionFactory.create(category=parent)
+            parent.add_child(name="child").add_child(name="grandchild")
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as multiple_context:
+            response = self.client.get(self.path, query)
+
+        self.assertEqual(response.data["count"], 17)
+        self.assertEqual(len(single_context), len(multiple_context))
+
+    def get_tree(self, query=None):
+        response = self.client.get(self.path + "tree/", query)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def tree_names(self, nodes):
+        return [(node["name"], self.tree_names(node["children"])) for node in nodes]
+
+    def test_read_category_tree(self):
+        parent = CategoryFactory.create(name="parent")
+        child = parent.add_child(name="child")
+        child.add_child(name="grandchild")
+        parent.add_child(name="second child")
+        CategoryFactory.create(name="other")
+
+        tree = self.get_tree()
+
+        self.assertEqual(
+            self.tree_names(tree),
+            [
+                (
+                    "parent",
+                    [("child", [("grandchild", [])]), ("second child", [])],
+                ),
+                ("other", []),
+            ],
+        )
+
+    def test_read_category_tree_with_root_and_depth(self):
+        parent = CategoryFactory.create(name="parent")
+        child = parent.add_child(name="child")
+        child.add_child(name="grandchild").add_child(name="great-grandchild")
+        CategoryFactory.create(name="other")
+
+        tree = self.get_tree({"root": str(child.id), "depth": 2})
+
+        self.assertEqual(self.tree_names(tree), [("child", [("grandchild", [])])])
+
+        tree = self.get_tree({"depth": 1})
+
+        self.assertEqual(self.tree_names(tree), [("parent", []), ("other", [])])
+
+    def test_read_category_tree_includes_product_types_and_questions(self):
+        category = CategoryFactory.create()
+        product_type = ProductTypeFactory.create()
+        category.product_types.add(product_type)
+        question = QuestionFactory.create(category=category)
+
+        tree = self.get_tree()
+
+        self.assertEqual(
+            [node["id"] for node in tree[0]["product_types"]], [str(product_type.id)]
+        )
+        self.assertEqual(
+            [node["id"] for node in tree[0]["questions"]], [str(question.id)]
+        )
+
+    def _create_category_with_relations(self):
+        child = CategoryFactory.create().add_child(name="child")
+        child.product_types.add(ProductTypeFactory.create())
+        QuestionFactory.create(category=child)
+
+    def test_read_category_tree_uses_fixed_number_of_queries(self):
+        self._create_category_with_relations()
+        self.get_tree()
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as single_context:
+            self.get_tree()
+
+        for _ in range(5):
+            self._create_category_with_relations()
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as multiple_context:
+            tree = self.get_tree()
+
+        self.assertEqual(len(tree), 6)
+        self.assertEqual(len(single_context), len(multiple_context))
+
+    def test_read_category_tree_with_unknown_root_returns_error(self):
+        response = self.client.get(
+            self.path + "tree/", {"root": "4f4b3bbd-e7e6-4b4d-a0b6-0ce5ddfb3b45"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_publish_category_publishes_subtree(self):
+        parent = Category.add_root(name="parent", published=False)
+        child = parent.add_child(name="child", published=False)
+        grandchild = child.add_child(name="grandchild", published=False)
+
+        response = self.client.post(f"{self.path}{parent.id}/publish/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["published"])
+        self.assertEqual(
+            Category.objects.filter(
+                id__in=[parent.id, child.id, grandchild.id], published=True
+            ).count(),
+            3,
+        )
+
+    def test_unpublish_category_unpublishes_subtree(self):
+        parent = Category.add_root(name="parent", published=True)
+        child = parent.add_child(name="child", published=True)
+        other = Category.add_root(name="other", published=True)
+
+        response = self.client.post(f"{self.path}{parent.id}/unpublish/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data["published"])
+        child.refresh_from_db()
+        other.refresh_from_db()
+        self.assertFalse(child.published)
+        self.assertTrue(other.published)
+
+    def test_publish_category_with_unpublished_parent_returns_error(self):
+        parent = Category.add_root(name="parent", published=False)
+        child = parent.add_child(name="child", published=False)
+
+        response = self.client.post(f"{self.path}{child.id}/publish/")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            {
+                "published": [
+                    ErrorDetail(
+                        string="Parent nodes have to be published in order to publish a child.",
+                        code="invalid",
+                    )
+                ]
+            },
+        )
+        child.refresh_from_db()
+        self.assertFalse(child.published)
+
     def test_delete_category(self):
         category = CategoryFactory.create()
         QuestionFactory.create(category=category)
@@ -2,7 +2,9 @@ import datetime
 import uuid
 from decimal import Decimal
 
+from django.db import connection
 from django.forms import model_to_dict
+from django.test.utils import CaptureQueriesContext
 
 from freezegun import freeze_time
 from rest_framework.exceptions import ErrorDetail
@@ -14,6 +16,7 @@ from open_producten.producttypes.tests.factories import (
     PriceOptionFactory,
     ProductTypeFactory,
 )
+from open_producten.utils.cache import get_response_cache
 from open_producten.utils.tests.cases import BaseApiTestCase
 from open_producten.utils.tests.helpers import model_to_dict_with_id
 
@@ -140,6 +143,37 @@ class TestProductTypePrice(BaseApiTestCase):
         self.assertEqual(PriceOption.objects.count(), 1)
         self.assertEqual(PriceOption.objects.first().amount, Decimal("20"))
 
+    def test_update_price_options_uses_fixed_number_of_queries(self):
+        def update_options(count):
+            price = PriceFactory.create(
+                product_type=self.product_type,
+                valid_from=datetime.date(2024, 2, 1)
+                + datetime.timedelta(days=Price.objects.count()),
+            )
+            updated = PriceOptionFactory.create_batch(count, price=price)
+            PriceOptionFactory.create_batch(count, price=price)
+            data = {
+                "valid_from": price.valid_from,
+                "options": [
+                    {"id": option.id, "amount": "20", "description": "updated"}
+                    for option in updated
+                ]
+                + [{"amount": "10", "description": "new"}] * count,
+            }
+
+            with CaptureQueriesContext(connection) as context:
+                response = self.put(price.id, data)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(price.options.filter(description="updated").count(), count)
+            self.assertEqual(price.options.filter(description="new").count(), count)
+            self.assertEqual(price.options.count(), 2 * count)
+            return context
+
+        update_options(1)
+
+        self.assertEqual(len(update_options(1)), len(update_options(20)))
+
     def test_update_price_with_option_not_part_of_price_returns_error(self):
         price = self._create_price()
 
@@ -348,7 +382,7 @@ class TestProductTypePrice(BaseApiTestCase):
         response = self.client.get("/api/v1/producttypes/current-prices/")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
-            response.data,
+            response.data["results"],
             [
                 {
                     "id": str(self.product_type.id),
@@ -369,7 +403,7 @@ class TestProductTypePrice(BaseApiTestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
-            response.data,
+            response.data["results"],
             [
                 {
                     "id": str(self.product_type.id),
@@ -393,7 +427,7 @@ class TestProductTypePrice(BaseApiTestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
-            response.data,
+            response.data["results"],
             [
                 {
                     "id": str(self.product_type.id),
@@ -414,3 +448,82 @@ class TestProductTypePrice(BaseApiTestCase):
                 },
             ],
         )
+
+    def test_get_current_prices_returns_latest_valid_price(self):
+        PriceFactory.create(
+            product_type=self.product_type, valid_from=datetime.date(2023, 1, 1)
+        )
+        price = PriceFactory.create(
+            product_type=self.product_type, valid_from=datetime.date(2023, 6, 1)
+        )
+        PriceFactory.create(
+            product_type=self.product_type, valid_from=datetime.date(2024, 2, 2)
+        )
+
+        response = self.client.get("/api/v1/producttypes/current-prices/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(
+            response.data["results"][0]["current_price"]["id"], str(price.id)
+        )
+
+    def test_get_current_prices_as_of_date(self):
+        PriceFactory.create(
+            product_type=self.product_type, valid_from=datetime.date(2024, 1, 1)
+        )
+        future_price = PriceFactory.create(
+            product_type=self.product_type, valid_from=datetime.date(2024, 2, 2)
+        )
+
+        response = self.client.get(
+            "/api/v1/producttypes/current-prices/", {"as_of": "2024-03-01"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["results"][0]["current_price"]["id"], str(future_price.id)
+        )
+
+    def test_get_current_prices_cached_response_is_not_served_the_next_day(self):
+        PriceFactory.create(
+            product_type=self.product_type, valid_from=datetime.date(2024, 1, 1)
+        )
+        next_price = PriceFactory.create(
+            product_type=self.product_type, valid_from=datetime.date(2024, 1, 2)
+        )
+
+        with freeze_time("2024-01-01 23:00"):
+            self.client.get("/api/v1/producttypes/current-prices/")
+
+        with freeze_time("2024-01-02 01:00"):
+            response = self.client.get("/api/v1/producttypes/current-prices/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["results"][0]["current_price"]["id"], str(next_price.id)
+        )
+
+    def test_get_current_prices_with_invalid_as_of_date_returns_error(self):
+        response = self.client.get(
+            "/api/v1/producttypes/current-prices/", {"as_of": "abc"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("as_of", response.data)
+
+    def test_get_current_prices_uses_fixed_number_of_queries(self):
+        for day in range(1, 6):
+            price = PriceFactory.create(
+                product_type=ProductTypeFactory.create(),
+                valid_from=datetime.date(2023, 1, day),
+            )
+            PriceOptionFactory.create(price=price)
+        self.client.get("/api/v1/producttypes/current-prices/")
+        get_response_cache().clear()
+
+        # oidc config, token, count, product types, prices & options
+        with self.assertNumQueries(6):
+            response = self.client.get("/api/v1/producttypes/current-prices/")
+
+        self.assertEqual(response.data["count"], 6)
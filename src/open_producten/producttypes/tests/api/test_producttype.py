@@ -1,17 +1,33 @@
+from base64 import b64encode
+from unittest.mock import patch
+
+from django.db import connection
 from django.forms import model_to_dict
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIClient
 
+from open_producten.locations.tests.factories import (
+    ContactFactory,
+    LocationFactory,
+    OrganisationFactory,
+)
 from open_producten.producttypes.models import Link, ProductType, Tag
+from open_producten.producttypes.serializers.producttype import ProductTypeSerializer
 from open_producten.producttypes.tests.factories import (
     CategoryFactory,
     ConditionFactory,
     LinkFactory,
+    PriceFactory,
+    PriceOptionFactory,
     ProductTypeFactory,
+    QuestionFactory,
     TagFactory,
     UniformProductNameFactory,
 )
+from open_producten.utils.cache import get_response_cache
+from open_producten.utils.pagination import OrderedCursorPagination
 from open_producten.utils.tests.cases import BaseApiTestCase
 from open_producten.utils.tests.helpers import model_to_dict_with_id
 
@@ -200,6 +216,52 @@ class TestProducttypeViewSet(BaseApiTestCase):
             },
         )
 
+    def test_create_product_type_with_unknown_ids_returns_error_per_index(self):
+        tag = TagFactory.create()
+        unknown_ids = [
+            "4f4b3bbd-e7e6-4b4d-a0b6-0ce5ddfb3b45",
+            "0b7b0e5c-4d2e-4a4c-9d4e-8a3c3a0e9c11",
+        ]
+
+        response = self.post(
+            self.data | {"tag_ids": [unknown_ids[0], tag.id, unknown_ids[1]]}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            {
+                "tag_ids": [
+                    ErrorDetail(
+                        string=f"Tag id {unknown_ids[0]} at index 0 does not exist",
+                        code="does_not_exist",
+                    ),
+                    ErrorDetail(
+                        string=f"Tag id {unknown_ids[1]} at index 2 does not exist",
+                        code="does_not_exist",
+                    ),
+                ]
+            },
+        )
+
+    def test_product_type_related_ids_are_resolved_with_one_query_per_field(self):
+        data = self.data | {
+            "tag_ids": [tag.id for tag in TagFactory.create_batch(40)],
+            "condition_ids": [
+                condition.id for condition in ConditionFactory.create_batch(40)
+            ],
+            "related_product_types": [
+                product_type.id for product_type in ProductTypeFactory.create_batch(40)
+            ],
+        }
+        serializer = ProductTypeSerializer(data=data)
+
+        # tags, conditions, related product types, categories & uniform product name
+        with self.assertNumQueries(5):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        self.assertEqual(len(serializer.validated_data["tags"]), 40)
+
     def test_update_minimal_product_type(self):
         product_type = ProductTypeFactory.create()
 
@@ -410,6 +472,666 @@ class TestProducttypeViewSet(BaseApiTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, product_type_to_dict(product_type))
 
+    def _create_product_type_with_relations(self):
+        product_type = ProductTypeFactory.create()
+        product_type.tags.add(TagFactory.create())
+        product_type.conditions.add(ConditionFactory.create())
+        product_type.categories.add(CategoryFactory.create())
+        product_type.related_product_types.add(ProductTypeFactory.create())
+        price = PriceFactory.create(product_type=product_type)
+        PriceOptionFactory.create(price=price)
+        LinkFactory.create(product_type=product_type)
+        QuestionFactory.create(product_type=product_type)
+        return product_type
+
+    def test_read_product_types_uses_fixed_number_of_queries(self):
+        self._create_product_type_with_relations()
+        self.get()
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as single_context:
+            self.get()
+
+        for _ in range(5):
+            self._create_product_type_with_relations()
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as multiple_context:
+            response = self.get()
+
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual(len(single_context), len(multiple_context))
+
+    def test_read_product_type_with_relations(self):
+        product_type = self._create_product_type_with_relations()
+
+        response = self.get(product_type.id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["tags"]), 1)
+        self.assertEqual(len(response.data["prices"][0]["options"]), 1)
+        self.assertEqual(
+            response.data["related_product_types"],
+            [product_type.related_product_types.get().id],
+        )
+
+    def test_read_product_types_with_sparse_fields(self):
+        self._create_product_type_with_relations()
+
+        response = self.client.get(
+            self.path, {"fields": "id,name,summary,uniform_product_name"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {
+                    "id": str(product_type.id),
+                    "name": product_type.name,
+                    "summary": product_type.summary,
+                    "uniform_product_name": product_type.uniform_product_name.uri,
+                }
+                for product_type in ProductType.objects.order_by("id")
+            ],
+        )
+
+    def test_read_product_types_with_expand(self):
+        product_type = self._create_product_type_with_relations()
+
+        response = self.client.get(
+            f"{self.path}{product_type.id}/", {"fields": "id", "expand": "tags"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data), {"id", "tags"})
+        self.assertEqual(len(response.data["tags"]), 1)
+
+    def test_read_product_types_with_empty_expand_excludes_nested_fields(self):
+        product_type = self._create_product_type_with_relations()
+
+        response = self.client.get(f"{self.path}{product_type.id}/", {"expand": ""})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("related_product_types", response.data)
+        for field in ("tags", "conditions", "categories", "prices", "links", "files"):
+            self.assertNotIn(field, response.data)
+
+    def test_read_product_types_with_sparse_fields_skips_queries(self):
+        self._create_product_type_with_relations()
+        self.get()
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as full_context:
+            self.get()
+
+        with CaptureQueriesContext(connection) as sparse_context:
+            response = self.client.get(self.path, {"fields": "id,name"})
+
+        self.assertEqual(response.status_code, 200)
+        # oidc config, token, validators, count & product types
+        self.assertEqual(len(sparse_context), 5)
+        self.assertLess(len(sparse_context), len(full_context))
+        self.assertNotIn('"content"', sparse_context.captured_queries[-1]["sql"])
+
+    def test_read_product_type_returns_validators(self):
+        product_type = ProductTypeFactory.create()
+
+        response = self.get(product_type.id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_read_product_type_with_matching_etag_returns_not_modified(self):
+        product_type = ProductTypeFactory.create()
+        etag = self.get(product_type.id)["ETag"]
+
+        # oidc config & token, the response is cached
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                f"{self.path}{product_type.id}/", HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_read_product_types_with_matching_etag_returns_not_modified(self):
+        ProductTypeFactory.create()
+        etag = self.get()["ETag"]
+
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_read_product_types_with_last_modified_returns_not_modified(self):
+        ProductTypeFactory.create()
+        last_modified = self.get()["Last-Modified"]
+
+        response = self.client.get(self.path, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_read_product_type_etag_changes_when_child_changes(self):
+        product_type = ProductTypeFactory.create()
+        etag = self.get(product_type.id)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            link = LinkFactory.create(product_type=product_type)
+        response = self.client.get(
+            f"{self.path}{product_type.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            link.delete()
+        response = self.client.get(
+            f"{self.path}{product_type.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_read_product_type_etag_changes_when_tag_changes(self):
+        product_type = ProductTypeFactory.create()
+        tag = TagFactory.create()
+        product_type.tags.add(tag)
+        etag = self.get(product_type.id)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.name = "updated"
+            tag.save()
+
+        response = self.client.get(
+            f"{self.path}{product_type.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_read_product_type_etag_changes_when_tag_is_deleted(self):
+        product_type = ProductTypeFactory.create()
+        tag = TagFactory.create()
+        product_type.tags.add(tag)
+        etag = self.get(product_type.id)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.delete()
+
+        response = self.client.get(
+            f"{self.path}{product_type.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["tags"], [])
+
+    def test_read_product_type_etag_changes_when_category_is_deleted(self):
+        product_type = ProductTypeFactory.create()
+        category = CategoryFactory.create()
+        product_type.categories.add(category)
+        etag = self.get(product_type.id)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            category.delete()
+
+        response = self.client.get(
+            f"{self.path}{product_type.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["categories"], [])
+
+    def test_read_product_types_etag_changes_when_product_type_is_deleted(self):
+        ProductTypeFactory.create()
+        product_type = ProductTypeFactory.create()
+        etag = self.get()["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductType.objects.filter(id=product_type.id).delete()
+
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    @patch.object(OrderedCursorPagination, "page_size", 2)
+    def test_read_product_types_with_cursor_pagination(self):
+        product_types = [ProductTypeFactory.create() for _ in range(3)]
+
+        response = self.client.get(self.path, {"pagination": "cursor"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [product_type["id"] for product_type in response.data["results"]],
+            [str(product_type.id) for product_type in product_types[:2]],
+        )
+        self.assertIsNone(response.data["previous"])
+
+        response = self.client.get(response.data["next"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [product_type["id"] for product_type in response.data["results"]],
+            [str(product_types[2].id)],
+        )
+        self.assertIsNone(response.data["next"])
+
+    @patch.object(OrderedCursorPagination, "page_size", 2)
+    def test_read_product_types_with_cursor_pagination_and_equal_created_on(self):
+        product_types = sorted(
+            (ProductTypeFactory.create() for _ in range(5)),
+            key=lambda product_type: product_type.id,
+        )
+        ProductType.objects.update(created_on=product_types[0].created_on)
+
+        pages = []
+        response = self.client.get(self.path, {"pagination": "cursor"})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            pages.append(
+                [product_type["id"] for product_type in response.data["results"]]
+            )
+            if response.data["next"] is None:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(
+            pages,
+            [
+                [str(product_type.id) for product_type in product_types[:2]],
+                [str(product_type.id) for product_type in product_types[2:4]],
+                [str(product_types[4].id)],
+            ],
+        )
+
+        response = self.client.get(response.data["previous"])
+
+        self.assertEqual(
+            [product_type["id"] for product_type in response.data["results"]],
+            pages[1],
+        )
+
+    def test_read_product_types_with_invalid_cursor_position_returns_not_found(self):
+        cursor = b64encode(b"p=not-a-date%7Cnot-an-id").decode()
+
+        response = self.client.get(
+            self.path, {"pagination": "cursor", "cursor": cursor}
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_search_product_types_orders_by_rank(self):
+        content_match = ProductTypeFactory.create(
+            name="parkeren", content="aanvraag voor een vergunning"
+        )
+        name_match = ProductTypeFactory.create(
+            name="vergunning", content="aanvraag voor parkeren"
+        )
+        ProductTypeFactory.create(name="paspoort", content="reisdocument")
+
+        response = self.client.get(self.path + "search/", {"q": "vergunning"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(
+            [product_type["id"] for product_type in response.data["results"]],
+            [str(name_match.id), str(content_match.id)],
+        )
+
+    def test_search_product_types_matches_keywords(self):
+        product_type = ProductTypeFactory.create(keywords=["afval"])
+        ProductTypeFactory.create()
+
+        response = self.client.get(self.path + "search/", {"q": "afval"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [product_type["id"] for product_type in response.data["results"]],
+            [str(product_type.id)],
+        )
+
+    def test_search_product_types_without_query_returns_error(self):
+        response = self.client.get(self.path + "search/")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["q"][0].code, "required")
+
+    def test_read_product_type_with_breadcrumbs_and_inherited_questions(self):
+        root = CategoryFactory.create(name="root")
+        child = root.add_child(name="child")
+        other = CategoryFactory.create(name="other")
+        product_type = ProductTypeFactory.create()
+        product_type.categories.add(child, other)
+        root_question = QuestionFactory.create(category=root)
+        child_question = QuestionFactory.create(category=child)
+        QuestionFactory.create(product_type=product_type)
+
+        response = self.client.get(
+            f"{self.path}{product_type.id}/",
+            {"include": "breadcrumbs,inherited_questions"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(
+            response.data["breadcrumbs"],
+            [
+                [
+                    {"id": str(root.id), "name": "root"},
+                    {"id": str(child.id), "name": "child"},
+                ],
+                [{"id": str(other.id), "name": "other"}],
+            ],
+        )
+        self.assertEqual(
+            [question["id"] for question in response.data["inherited_questions"]],
+            [str(root_question.id), str(child_question.id)],
+        )
+
+    def test_read_product_type_with_include_renders_nested_fields(self):
+        product_type = ProductTypeFactory.create()
+        product_type.tags.add(TagFactory.create())
+        PriceFactory.create(product_type=product_type)
+
+        response = self.client.get(
+            f"{self.path}{product_type.id}/", {"include": "breadcrumbs"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("breadcrumbs", response.data)
+        self.assertNotIn("inherited_questions", response.data)
+        self.assertEqual(len(response.data["tags"]), 1)
+        self.assertEqual(len(response.data["prices"]), 1)
+
+    def test_read_product_type_with_include_and_expand(self):
+        product_type = ProductTypeFactory.create()
+
+        response = self.client.get(
+            f"{self.path}{product_type.id}/",
+            {"fields": "id", "expand": "tags", "include": "breadcrumbs"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data), {"id", "tags", "breadcrumbs"})
+
+    def test_read_product_types_with_breadcrumbs_uses_fixed_number_of_queries(self):
+        query = {"include": "breadcrumbs,inherited_questions"}
+        ProductTypeFactory.create().categories.add(
+            CategoryFactory.create().add_child(name="child")
+        )
+        self.client.get(self.path, query)
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as single_context:
+            self.client.get(self.path, query)
+
+        for _ in range(5):
+            parent = CategoryFactory.create()
+            QuestionFactory.create(category=parent)
+            ProductTypeFactory.create().categories.add(
+                parent.add_child(name="child"), CategoryFactory.create()
+            )
+        get_response_cache().clear()
+
+        with CaptureQueriesContext(connection) as multiple_context:
+            response = self.client.get(self.path, query)
+
+        self.assertEqual(response.data["count"], 6)
+        self.assertEqual(len(single_context), len(multiple_context))
+
+    def assert_filtered(self, query, product_types):
+        response = self.client.get(self.path, query)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {product_type["id"] for product_type in response.data["results"]},
+            {str(product_type.id) for product_type in product_types},
+        )
+
+    def test_filter_product_types_on_tags(self):
+        tag, other_tag = TagFactory.create_batch(2)
+        product_type = ProductTypeFactory.create()
+        product_type.tags.add(tag, other_tag)
+        other_product_type = ProductTypeFactory.create()
+        other_product_type.tags.add(other_tag)
+        ProductTypeFactory.create()
+
+        self.assert_filtered({"tags": str(tag.id)}, [product_type])
+        self.assert_filtered(
+            {"tags": f"{tag.id},{other_tag.id}"}, [product_type, other_product_type]
+        )
+
+    def test_filter_product_types_on_tag_types(self):
+        tag = TagFactory.create()
+        product_type = ProductTypeFactory.create()
+        product_type.tags.add(tag, TagFactory.create(type=tag.type))
+        ProductTypeFactory.create().tags.add(TagFactory.create())
+
+        self.assert_filtered({"tag_types": str(tag.type.id)}, [product_type])
+
+    def test_filter_product_types_on_category_includes_subcategories(self):
+        parent = CategoryFactory.create()
+        child = parent.add_child(name="child")
+        product_type = ProductTypeFactory.create()
+        product_type.categories.add(parent)
+        child_product_type = ProductTypeFactory.create()
+        child_product_type.categories.add(child)
+        ProductTypeFactory.create().categories.add(CategoryFactory.create())
+
+        self.assert_filtered(
+            {"category": str(parent.id)}, [product_type, child_product_type]
+        )
+        self.assert_filtered({"category": str(child.id)}, [child_product_type])
+
+    def test_filter_product_types_on_uniform_product_name(self):
+        product_type = ProductTypeFactory.create()
+        ProductTypeFactory.create()
+
+        self.assert_filtered(
+            {"uniform_product_name": product_type.uniform_product_name.uri},
+            [product_type],
+        )
+
+    def test_filter_product_types_on_organisations_and_locations(self):
+        organisation = OrganisationFactory.create()
+        location = LocationFactory.create()
+        organisation_product_type = ProductTypeFactory.create()
+        organisation_product_type.organisations.add(organisation)
+        location_product_type = ProductTypeFactory.create()
+        location_product_type.locations.add(location)
+
+        self.assert_filtered(
+            {"organisations": str(organisation.id)}, [organisation_product_type]
+        )
+        self.assert_filtered({"locations": str(location.id)}, [location_product_type])
+
+    def test_filter_product_types_on_published(self):
+        product_type = ProductTypeFactory.create(published=False)
+        ProductTypeFactory.create(published=True)
+
+        self.assert_filtered({"published": "false"}, [product_type])
+
+    def test_filter_product_types_on_keywords(self):
+        product_type = ProductTypeFactory.create(keywords=["afval", "container"])
+        ProductTypeFactory.create(keywords=["afval"])
+
+        self.assert_filtered({"keywords": "container,afval"}, [product_type])
+
+    def test_filter_product_types_with_invalid_id_returns_error(self):
+        response = self.client.get(self.path, {"tags": "not-a-uuid"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def bulk(self, data):
+        return self.client.post(self.path + "bulk/", data, format="json")
+
+    def test_bulk_create_product_types(self):
+        tag = TagFactory.create()
+        condition = ConditionFactory.create()
+        related_product_type = ProductTypeFactory.create()
+
+        response = self.bulk(
+            [
+                self.data | {"name": "first"},
+                self.data
+                | {
+                    "name": "second",
+                    "tag_ids": [tag.id],
+                    "condition_ids": [condition.id],
+                    "related_product_types": [related_product_type.id],
+                },
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [product_type["name"] for product_type in response.data],
+            ["first", "second"],
+        )
+        first = ProductType.objects.get(name="first")
+        second = ProductType.objects.get(name="second")
+        self.assertEqual(response.data[0], product_type_to_dict(first))
+        self.assertEqual(list(second.tags.all()), [tag])
+        self.assertEqual(list(second.conditions.all()), [condition])
+        self.assertEqual(
+            list(second.related_product_types.all()), [related_product_type]
+        )
+        self.assertEqual(
+            ProductType.objects.filter(search_vector="second").get(), second
+        )
+
+    def test_bulk_update_and_create_product_types(self):
+        old_tag, new_tag = TagFactory.create_batch(2)
+        product_type = ProductTypeFactory.create()
+        product_type.tags.add(old_tag)
+
+        response = self.bulk(
+            [
+                self.data
+                | {"id": product_type.id, "name": "updated", "tag_ids": [new_tag.id]},
+                self.data | {"name": "created"},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(ProductType.objects.count(), 2)
+        product_type.refresh_from_db()
+        self.assertEqual(product_type.name, "updated")
+        self.assertEqual(list(product_type.tags.all()), [new_tag])
+        self.assertEqual(response.data[0]["id"], str(product_type.id))
+        self.assertEqual(
+            response.data[0]["updated_on"],
+            product_type.updated_on.astimezone().isoformat(),
+        )
+
+    def test_bulk_product_types_with_organisations_contacts_and_locations(self):
+        organisation = OrganisationFactory.create()
+        contact = ContactFactory.create()
+        location = LocationFactory.create()
+        product_type = ProductTypeFactory.create()
+        product_type.organisations.add(organisation)
+
+        response = self.bulk(
+            [
+                self.data
+                | {
+                    "name": "created",
+                    "organisations": [organisation.id],
+                    "contacts": [contact.id],
+                    "locations": [location.id],
+                },
+                self.data
+                | {"id": product_type.id, "name": "updated", "contacts": [contact.id]},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        created = ProductType.objects.get(name="created")
+        self.assertEqual(list(created.organisations.all()), [organisation])
+        self.assertEqual(list(created.contacts.all()), [contact])
+        self.assertEqual(list(created.locations.all()), [location])
+
+        # omitted relations of an existing product type are left unchanged.
+        product_type.refresh_from_db()
+        self.assertEqual(list(product_type.organisations.all()), [organisation])
+        self.assertEqual(list(product_type.contacts.all()), [contact])
+
+    def test_bulk_with_invalid_item_returns_errors_per_item(self):
+        response = self.bulk(
+            [
+                self.data,
+                self.data | {"category_ids": []},
+                self.data | {"id": "4f4b3bbd-e7e6-4b4d-a0b6-0ce5ddfb3b45"},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(response.data[1]["category_ids"][0].code, "invalid")
+        self.assertEqual(response.data[2]["id"][0].code, "does_not_exist")
+        self.assertEqual(ProductType.objects.count(), 0)
+
+    def test_bulk_with_unknown_relation_returns_error(self):
+        response = self.bulk(
+            [self.data | {"tag_ids": ["4f4b3bbd-e7e6-4b4d-a0b6-0ce5ddfb3b45"]}]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0]["tag_ids"][0].code, "does_not_exist")
+
+    def test_bulk_with_duplicate_ids_returns_error(self):
+        tag = TagFactory.create()
+
+        response = self.bulk([self.data | {"tag_ids": [tag.id, tag.id]}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            [
+                {
+                    "tag_ids": [
+                        ErrorDetail(
+                            string=f"Duplicate Tag id: {tag.id} at index 1",
+                            code="invalid",
+                        )
+                    ]
+                }
+            ],
+        )
+
+    def test_bulk_changes_etag_of_related_product_type(self):
+        related_product_type = ProductTypeFactory.create()
+        etag = self.get(related_product_type.id)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bulk(
+                [self.data | {"related_product_types": [related_product_type.id]}]
+            )
+
+        self.assertNotEqual(self.get(related_product_type.id)["ETag"], etag)
+
+    def test_bulk_uses_fixed_number_of_queries(self):
+        def create_items(count):
+            items = []
+            for _ in range(count):
+                product_type = ProductTypeFactory.create()
+                items.append(
+                    self.data
+                    | {
+                        "id": product_type.id,
+                        "tag_ids": [TagFactory.create().id],
+                        "condition_ids": [ConditionFactory.create().id],
+                        "related_product_types": [ProductTypeFactory.create().id],
+                    }
+                )
+                items.append(self.data | {"tag_ids": [TagFactory.create().id]})
+            return items
+
+        self.bulk(create_items(1))
+
+        items = create_items(1)
+        with CaptureQueriesContext(connection) as single_context:
+            self.bulk(items)
+
+        items = create_items(10)
+        with CaptureQueriesContext(connection) as multiple_context:
+            response = self.bulk(items)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 20)
+        self.assertEqual(len(single_context), len(multiple_context))
+
     def test_delete_product_type(self):
         tag = TagFactory.create()
         product_type = ProductTypeFactory.create()
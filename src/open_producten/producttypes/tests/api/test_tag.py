@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 from rest_framework.test import APIClient
 
 from open_producten.producttypes.models import Tag
+from open_producten.utils.pagination import OrderedCursorPagination
 from open_producten.utils.tests.cases import BaseApiTestCase
 from open_producten.utils.tests.helpers import model_to_dict_with_id
 
@@ -61,6 +64,26 @@ class TestProductTypeTag(BaseApiTestCase):
         self.assertEqual(response.data["count"], 1)
         self.assertEqual(response.data["results"], [tag_to_dict(tag)])
 
+    @patch.object(OrderedCursorPagination, "page_size", 2)
+    def test_read_tags_with_cursor_pagination(self):
+        tags = sorted((TagFactory.create() for _ in range(3)), key=lambda tag: tag.id)
+
+        response = self.client.get(self.path, {"pagination": "cursor"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [tag["id"] for tag in response.data["results"]],
+            [str(tag.id) for tag in tags[:2]],
+        )
+
+        response = self.client.get(response.data["next"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [tag["id"] for tag in response.data["results"]], [str(tags[2].id)]
+        )
+        self.assertIsNone(response.data["next"])
+
     def test_read_tag(self):
         tag = TagFactory.create()
 
@@ -18,7 +18,7 @@ from ..models import (
 
 class UniformProductNameFactory(factory.django.DjangoModelFactory):
     name = factory.Sequence(lambda n: f"upn {n}")
-    uri = factory.Faker("url")
+    uri = factory.Sequence(lambda n: f"https://example.com/upn/{n}")
 
     class Meta:
         model = UniformProductName
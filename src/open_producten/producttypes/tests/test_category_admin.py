@@ -1,6 +1,8 @@
+from django.contrib.admin import AdminSite
+from django.contrib.messages.storage.cookie import CookieStorage
 from django.core.exceptions import ValidationError
 from django.forms import modelformset_factory
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 
 from open_producten.utils.tests.helpers import build_formset_data
 
@@ -82,3 +84,76 @@ class TestCategoryAdminFormSet(TestCase):
 
         with self.assertRaises(ValidationError):
             object_formset.clean()
+
+    def test_parent_nodes_cannot_be_unpublished_with_published_children_on_other_page(
+        self,
+    ):
+        self.parent.published = True
+        self.parent.save()
+        data = build_formset_data("form", {"id": self.parent.id})
+
+        object_formset = self.formset(data)
+
+        with self.assertRaises(ValidationError):
+            object_formset.clean()
+
+    def test_parent_and_children_can_be_published_together(self):
+        self.child.published = False
+        self.child.save()
+        data = build_formset_data(
+            "form",
+            {"id": self.parent.id, "published": "on"},
+            {"id": self.child.id, "published": "on"},
+        )
+
+        object_formset = self.formset(data)
+
+        self.assertTrue(object_formset.is_valid())
+
+    def test_published_states_are_validated_with_fixed_number_of_queries(self):
+        categories = [self.parent, self.child]
+        for i in range(10):
+            categories.append(self.child.add_child(name=f"child {i}", published=True))
+        data = build_formset_data(
+            "form",
+            {"id": self.parent.id},
+            *[{"id": category.id, "published": "on"} for category in categories[1:]],
+        )
+        data["form-INITIAL_FORMS"] = len(categories)
+
+        object_formset = self.formset(data, queryset=Category.objects.order_by("path"))
+
+        # the rows are validated without querying the parent or children
+        with self.assertNumQueries(len(categories) + 1):
+            for form in object_formset.forms:
+                form.full_clean()
+
+        with self.assertNumQueries(1):
+            self.assertFalse(object_formset.is_valid())
+
+
+class TestCategoryAdminActions(TestCase):
+
+    def setUp(self):
+        self.admin = CategoryAdmin(Category, AdminSite())
+        self.request = RequestFactory().post("/")
+        self.request.user = None
+        self.request._messages = CookieStorage(self.request)
+
+        self.parent = Category.add_root(name="parent", published=False)
+        self.child = self.parent.add_child(name="child", published=False)
+        self.grandchild = self.child.add_child(name="grandchild", published=False)
+
+    def test_publish_subtree(self):
+        self.admin.publish_subtree(
+            self.request, Category.objects.filter(id=self.parent.id)
+        )
+
+        self.assertEqual(Category.objects.filter(published=True).count(), 3)
+
+    def test_publish_subtree_with_unpublished_parent_is_not_updated(self):
+        self.admin.publish_subtree(
+            self.request, Category.objects.filter(id=self.child.id)
+        )
+
+        self.assertEqual(Category.objects.filter(published=True).count(), 0)
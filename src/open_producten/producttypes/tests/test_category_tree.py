@@ -0,0 +1,98 @@
+from django.core.cache import caches
+from django.test import TestCase
+
+from ..category_tree import get_category_tree, invalidate_category_tree
+from ..models import Category
+from .factories import CategoryFactory
+
+
+class TestCategoryTree(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+
+        self.root = CategoryFactory.create(name="root")
+        self.child = self.root.add_child(name="child", published=True)
+        self.grandchild = self.child.add_child(name="grandchild", published=True)
+        self.second_child = self.root.add_child(name="second child", published=True)
+        self.other_root = CategoryFactory.create(name="other root")
+
+    def test_get_parent(self):
+        tree = get_category_tree()
+
+        self.assertEqual(tree.get_parent(self.grandchild.id), self.child)
+        self.assertEqual(tree.get_parent(self.child.id), self.root)
+        self.assertIsNone(tree.get_parent(self.root.id))
+
+    def test_get_children(self):
+        tree = get_category_tree()
+
+        self.assertEqual(
+            tree.get_children(self.root.id), [self.child, self.second_child]
+        )
+        self.assertEqual(tree.get_children(self.grandchild.id), [])
+
+    def test_get_ancestors(self):
+        tree = get_category_tree()
+
+        self.assertEqual(
+            tree.get_ancestors(self.grandchild.id), [self.root, self.child]
+        )
+        self.assertEqual(tree.get_ancestors(self.root.id), [])
+
+    def test_get_descendants(self):
+        tree = get_category_tree()
+
+        self.assertEqual(
+            tree.get_descendants(self.root.id),
+            [self.child, self.grandchild, self.second_child],
+        )
+        self.assertEqual(
+            tree.get_descendants(self.child.id, include_self=True),
+            [self.child, self.grandchild],
+        )
+        self.assertEqual(tree.get_descendants(self.other_root.id), [])
+
+    def test_tree_is_cached(self):
+        tree = get_category_tree()
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_category_tree(), tree)
+
+    def test_tree_is_invalidated_on_save(self):
+        get_category_tree()
+
+        category = self.other_root.add_child(name="new")
+
+        self.assertEqual(get_category_tree().get_parent(category.id), self.other_root)
+
+    def test_tree_is_invalidated_on_move(self):
+        get_category_tree()
+
+        self.grandchild.move(self.other_root, "last-child")
+
+        self.assertEqual(
+            get_category_tree().get_parent(self.grandchild.id), self.other_root
+        )
+
+    def test_tree_is_invalidated_on_delete(self):
+        get_category_tree()
+
+        Category.objects.get(id=self.child.id).delete()
+
+        tree = get_category_tree()
+        self.assertNotIn(self.child.id, tree)
+        self.assertNotIn(self.grandchild.id, tree)
+
+    def test_tree_is_invalidated_by_other_worker(self):
+        tree = get_category_tree()
+
+        invalidate_category_tree()
+
+        self.assertIsNot(get_category_tree(), tree)
+
+    def test_tree_is_invalidated_when_shared_cache_is_cleared(self):
+        tree = get_category_tree()
+
+        caches["default"].clear()
+
+        self.assertIsNot(get_category_tree(), tree)
@@ -0,0 +1,51 @@
+from django.db import connection
+from django.test import TestCase
+
+from ..filters import ProductTypeFilterSet
+from ..models import ProductType
+from .factories import CategoryFactory, ProductTypeFactory
+
+
+class TestProductTypeFilterSetQueryPlans(TestCase):
+    """
+    The filters should be resolved with indexes, checked by disabling sequential
+    scans so the planner falls back to them only when no index can be used.
+    """
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        self.product_type = ProductTypeFactory.create()
+        self.category = CategoryFactory.create()
+
+    def get_plan(self, data):
+        filterset = ProductTypeFilterSet(data, queryset=ProductType.objects.all())
+        self.assertTrue(filterset.is_valid(), filterset.errors)
+        return filterset.qs.order_by("id").explain()
+
+    def test_filters_do_not_scan_tables(self):
+        id = str(self.product_type.id)
+        queries = {
+            "tags": {"tags": id},
+            "tag_types": {"tag_types": id},
+            "category": {"category": str(self.category.id)},
+            "uniform_product_name": {
+                "uniform_product_name": self.product_type.uniform_product_name.uri
+            },
+            "organisations": {"organisations": id},
+            "locations": {"locations": id},
+            "published": {"published": "true"},
+            "keywords": {"keywords": "afval"},
+        }
+
+        for name, data in queries.items():
+            with self.subTest(name):
+                self.assertNotIn("Seq Scan", self.get_plan(data))
+
+    def test_keywords_filter_uses_gin_index(self):
+        # a full scan of the primary key index also avoids the sort on id
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_indexscan = off")
+
+        self.assertIn("producttype_keywords_idx", self.get_plan({"keywords": "afval"}))
@@ -1,12 +1,24 @@
+import hashlib
 import os
+import tempfile
 from io import StringIO
 from unittest.mock import patch
 
 from django.core.management import CommandError, call_command
 from django.test import SimpleTestCase, TestCase
 
+from open_producten.producttypes.management.commands.load_upl import (
+    Command,
+    LoadCounts,
+    UniformProductName as UPN,
+)
 from open_producten.producttypes.management.parsers import CsvParser
-from open_producten.producttypes.models import UniformProductName
+from open_producten.producttypes.models import (
+    UniformProductListImport,
+    UniformProductName,
+)
+
+from .factories import ProductTypeFactory, UniformProductNameFactory
 
 
 class TestLoadUPNCommand(TestCase):
@@ -26,7 +38,10 @@ class TestLoadUPNCommand(TestCase):
         file_name = "data/upl.csv"
         path = os.path.join(os.path.dirname(__file__), file_name)
         result = self.call_command(path)
-        self.assertEqual(result, f"Importing upn from {path}...\nDone (1 objects).\n")
+        self.assertEqual(
+            result,
+            f"Importing upn from {path}...\nDone (1 created, 0 updated, 0 deleted).\n",
+        )
         self.assertEqual(UniformProductName.objects.count(), 1)
         self.assertEqual(
             UniformProductName.objects.first().name, "aangifte vertrek buitenland"
@@ -36,6 +51,104 @@ class TestLoadUPNCommand(TestCase):
             "http://standaarden.overheid.nl/owms/terms/AangifteVertrekBuitenland",
         )
 
+    def test_load_upl_updates_and_deletes_upns(self):
+        unchanged = UniformProductNameFactory.create(name="unchanged", uri="http://a")
+        renamed = UniformProductNameFactory.create(name="old name", uri="http://b")
+        restored = UniformProductNameFactory.create(
+            name="restored", uri="http://c", is_deleted=True
+        )
+        removed = UniformProductNameFactory.create(name="removed", uri="http://d")
+        product_type = ProductTypeFactory.create(uniform_product_name=renamed)
+        updated_on = product_type.updated_on
+
+        command = Command()
+        command.batch_size = 2
+        counts = command.load_upl(
+            [
+                UPN(name="unchanged", uri="http://a"),
+                UPN(name="new name", uri="http://b"),
+                UPN(name="created", uri="http://e"),
+                UPN(name="created again", uri="http://e"),
+                UPN(name="restored", uri="http://c"),
+            ]
+        )
+
+        self.assertEqual(counts, LoadCounts(created=1, updated=2, deleted=1))
+        self.assertEqual(
+            set(UniformProductName.objects.values_list("uri", "name", "is_deleted")),
+            {
+                ("http://a", "unchanged", False),
+                ("http://b", "new name", False),
+                ("http://c", "restored", False),
+                ("http://d", "removed", True),
+                ("http://e", "created again", False),
+            },
+        )
+        self.assertEqual(
+            UniformProductName.objects.get(uri="http://a").id, unchanged.id
+        )
+        self.assertEqual(UniformProductName.objects.get(uri="http://c").id, restored.id)
+        self.assertEqual(UniformProductName.objects.get(uri="http://d").id, removed.id)
+        product_type.refresh_from_db()
+        self.assertGreater(product_type.updated_on, updated_on)
+
+    def test_load_upl_uses_queries_per_batch(self):
+        command = Command()
+        command.batch_size = 10
+        data = [UPN(name=f"upn {i}", uri=f"http://upn/{i}") for i in range(25)]
+
+        # the temporary table, three batches of three queries, the deletion and
+        # dropping the table within a savepoint.
+        with self.assertNumQueries(1 + 3 * 3 + 2 + 2):
+            command.load_upl(data)
+
+        self.assertEqual(UniformProductName.objects.count(), 25)
+
+    def test_load_unchanged_csv_is_skipped(self):
+        path = os.path.join(os.path.dirname(__file__), "data/upl.csv")
+        self.call_command(path)
+        UniformProductName.objects.update(name="changed")
+
+        result = self.call_command(path)
+
+        self.assertEqual(
+            result,
+            f"Importing upn from {path}...\nUnchanged since the last import.\n",
+        )
+        self.assertEqual(UniformProductName.objects.get().name, "changed")
+
+        result = self.call_command(path, "--force")
+
+        self.assertEqual(
+            result,
+            f"Importing upn from {path}...\nDone (0 created, 1 updated, 0 deleted).\n",
+        )
+        self.assertEqual(
+            UniformProductName.objects.get().name, "aangifte vertrek buitenland"
+        )
+
+    def test_load_changed_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "upl.csv")
+            with open(path, "w") as f:
+                f.write("UniformeProductnaam,URI\na,http://a\nb,http://b\n")
+            self.call_command(path)
+
+            with open(path, "w") as f:
+                f.write("UniformeProductnaam,URI\na,http://a\nc,http://c\n")
+            result = self.call_command(path)
+
+        self.assertEqual(
+            result,
+            f"Importing upn from {path}...\nDone (1 created, 0 updated, 1 deleted).\n",
+        )
+        self.assertEqual(
+            UniformProductListImport.objects.get(source=path).content_hash,
+            hashlib.sha256(
+                b"UniformeProductnaam,URI\na,http://a\nc,http://c\n"
+            ).hexdigest(),
+        )
+
     def test_load_csv_with_incorrect_columns(self):
         file_name = "data/wrong-upl.csv"
         path = os.path.join(os.path.dirname(__file__), file_name)
@@ -51,28 +164,57 @@ class TestCSVParser(SimpleTestCase):
 
     def test_parser_returns_error_when_format_is_not_csv(self):
         with self.assertRaisesMessage(Exception, "File format is not csv"):
-            self.parser.parse("abc.txt")
-
-    @patch("open_producten.producttypes.management.parsers.NamedTemporaryFile")
-    @patch("open_producten.producttypes.management.parsers.CsvParser.process_csv")
-    def test_parser_with_url(self, mock_process_csv, mock_NamedTemporaryFile):
-        self.parser.parse("https://www.abc.com/abc.csv")
+            with self.parser.open_csv("abc.txt"):
+                pass
+
+    @patch("open_producten.producttypes.management.parsers.requests.get")
+    def test_open_csv_with_url(self, mock_get):
+        content = "\ufeffURI,Naam\nhttp://a,a\n".encode()
+        response = mock_get.return_value.__enter__.return_value
+        response.status_code = 200
+        response.iter_content.return_value = [content[:5], content[5:]]
+        response.headers = {"ETag": '"abc"', "Last-Modified": "yesterday"}
+
+        with self.parser.open_csv("https://www.abc.com/abc.csv") as csv_file:
+            rows = list(csv_file.rows())
+
+        self.assertEqual(rows, [{"URI": "http://a", "Naam": "a"}])
+        self.assertEqual(csv_file.content_hash, hashlib.sha256(content).hexdigest())
+        self.assertEqual(
+            (csv_file.etag, csv_file.last_modified), ('"abc"', "yesterday")
+        )
+        mock_get.assert_called_once_with(
+            "https://www.abc.com/abc.csv", headers={}, stream=True
+        )
 
-        self.assertEqual(mock_NamedTemporaryFile.call_count, 1)
-        self.assertEqual(mock_process_csv.call_count, 1)
+    @patch("open_producten.producttypes.management.parsers.requests.get")
+    def test_open_csv_with_url_not_modified(self, mock_get):
+        response = mock_get.return_value.__enter__.return_value
+        response.status_code = 304
 
-    @patch("tempfile.NamedTemporaryFile")
-    @patch("open_producten.producttypes.management.parsers.CsvParser.process_csv")
-    def test_parser_with_file(self, mock_process_csv, mock_NamedTemporaryFile):
-        self.parser.parse("abc.csv")
+        with self.parser.open_csv(
+            "https://www.abc.com/abc.csv", etag='"abc"', last_modified="yesterday"
+        ) as csv_file:
+            self.assertIsNone(csv_file)
 
-        self.assertEqual(mock_NamedTemporaryFile.call_count, 0)
-        self.assertEqual(mock_process_csv.call_count, 1)
+        mock_get.assert_called_once_with(
+            "https://www.abc.com/abc.csv",
+            headers={"If-None-Match": '"abc"', "If-Modified-Since": "yesterday"},
+            stream=True,
+        )
 
-    def test_process_csv(self):
+    @patch("open_producten.producttypes.management.parsers.requests.get")
+    def test_open_csv_with_file(self, mock_get):
         file_name = "data/upl.csv"
         path = os.path.join(os.path.dirname(__file__), file_name)
-        result = self.parser.process_csv(path)
+        with self.parser.open_csv(path) as csv_file:
+            result = list(csv_file.rows())
+
+        self.assertEqual(mock_get.call_count, 0)
+        with open(path, "rb") as f:
+            self.assertEqual(
+                csv_file.content_hash, hashlib.sha256(f.read()).hexdigest()
+            )
         self.assertEqual(
             result,
             [
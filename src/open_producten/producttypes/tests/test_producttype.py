@@ -1,9 +1,12 @@
 from datetime import date
 
+from django.contrib.postgres.search import SearchQuery
 from django.test import TestCase
 
 from freezegun import freeze_time
 
+from ..models import ProductType
+from ..models.producttype import SEARCH_CONFIG
 from .factories import PriceFactory, ProductTypeFactory
 
 
@@ -28,3 +31,14 @@ class TestProductType(TestCase):
     def test_current_price_without_prices(self):
         self.product_type = ProductTypeFactory.create()
         self.assertIsNone(self.product_type.current_price)
+
+    def test_search_vector_is_updated_on_save(self):
+        self.product_type.name = "rijbewijs"
+        self.product_type.save()
+
+        self.assertTrue(
+            ProductType.objects.filter(
+                pk=self.product_type.pk,
+                search_vector=SearchQuery("rijbewijs", config=SEARCH_CONFIG),
+            ).exists()
+        )
@@ -1,8 +1,20 @@
+from datetime import date
+from functools import partial
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Prefetch
 from django.shortcuts import get_object_or_404
 
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from open_producten.locations.models import Organisation
+from open_producten.producttypes.filters import ProductTypeFilterSet
 from open_producten.producttypes.models import (
     Category,
     Condition,
@@ -14,7 +26,12 @@ from open_producten.producttypes.models import (
     Tag,
     TagType,
 )
-from open_producten.producttypes.serializers.category import CategorySerializer
+from open_producten.producttypes.models.producttype import SEARCH_CONFIG
+from open_producten.producttypes.serializers.category import (
+    CategorySerializer,
+    CategoryTreeParameterSerializer,
+    CategoryTreeSerializer,
+)
 from open_producten.producttypes.serializers.children import (
     ConditionSerializer,
     FieldSerializer,
@@ -25,29 +42,120 @@ from open_producten.producttypes.serializers.children import (
     TagTypeSerializer,
 )
 from open_producten.producttypes.serializers.producttype import (
+    AutocompleteParameterSerializer,
+    AutocompleteSerializer,
+    CurrentPriceParameterSerializer,
     ProductTypeCurrentPriceSerializer,
     ProductTypeSerializer,
+    SearchParameterSerializer,
 )
-from open_producten.utils.views import OrderedModelViewSet
+from open_producten.utils.prefetch import eager_load
+from open_producten.utils.search import autocomplete
+from open_producten.utils.views import (
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    OrderedModelViewSet,
+)
+
+from .signals import API_CACHE_NAMESPACE
 
 
-class ProductTypeViewSet(OrderedModelViewSet):
+class CatalogCacheMixin(CachedResponseMixin):
+    cache_namespace = API_CACHE_NAMESPACE
+
+
+class ProductTypeViewSet(CatalogCacheMixin, ConditionalGetMixin, OrderedModelViewSet):
     queryset = ProductType.objects.all()
     serializer_class = ProductTypeSerializer
     lookup_url_kwarg = "id"
+    filter_backends = (DjangoFilterBackend,)
+    filterset_class = ProductTypeFilterSet
 
+    @extend_schema(
+        request=ProductTypeSerializer(many=True),
+        responses=ProductTypeSerializer(many=True),
+    )
+    @action(detail=False, methods=["post"], pagination_class=None, filter_backends=())
+    def bulk(self, request):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        product_types = serializer.save()
+
+        # the saved product types are fetched again to load their relations in bulk.
+        fetched = eager_load(self.queryset, serializer.child).in_bulk(
+            [product_type.pk for product_type in product_types]
+        )
+        serializer = self.get_serializer(
+            [fetched[product_type.pk] for product_type in product_types], many=True
+        )
+        return Response(serializer.data)
+
+    @extend_schema(
+        parameters=[CurrentPriceParameterSerializer],
+        responses=ProductTypeCurrentPriceSerializer(many=True),
+    )
     @action(
         detail=False,
         serializer_class=ProductTypeCurrentPriceSerializer,
         url_path="current-prices",
     )
     def current_prices(self, request):
-        product_types = ProductType.objects.all()
-        serializer = ProductTypeCurrentPriceSerializer(product_types, many=True)
-        return Response(serializer.data)
+        parameters = CurrentPriceParameterSerializer(data=request.query_params)
+        parameters.is_valid(raise_exception=True)
+        as_of = parameters.validated_data.get("as_of") or date.today()
+
+        # the date is part of the key, as the response without as_of changes daily.
+        return self.cached_response(
+            partial(self.get_current_prices, as_of), as_of.isoformat()
+        )
+
+    def get_current_prices(self, as_of: date):
+        # DISTINCT ON resolves the latest valid price of every product type on the
+        # page in a single query using the (product_type, valid_from) index.
+        prices = (
+            Price.objects.filter(valid_from__lte=as_of)
+            .order_by("product_type", "-valid_from")
+            .distinct("product_type")
+            .prefetch_related("options")
+        )
+        product_types = self.filter_queryset(self.get_queryset()).prefetch_related(
+            Prefetch("prices", queryset=prices, to_attr="prefetched_current_prices")
+        )
+
+        page = self.paginate_queryset(product_types)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @extend_schema(
+        parameters=[SearchParameterSerializer],
+        responses=ProductTypeSerializer(many=True),
+    )
+    @action(detail=False)
+    def search(self, request):
+        return self.cached_response(partial(self.get_search_results, request))
+
+    def get_search_results(self, request):
+        parameters = SearchParameterSerializer(data=request.query_params)
+        parameters.is_valid(raise_exception=True)
+
+        query = SearchQuery(
+            parameters.validated_data["q"],
+            config=SEARCH_CONFIG,
+            search_type="websearch",
+        )
+        product_types = (
+            self.filter_queryset(self.get_queryset())
+            .filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "id")
+        )
+
+        page = self.paginate_queryset(product_types)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
-class ProductTypeChildViewSet(OrderedModelViewSet):
+class ProductTypeChildViewSet(CatalogCacheMixin, OrderedModelViewSet):
 
     def get_product_type(self):
         return get_object_or_404(ProductType, id=self.kwargs["product_type_id"])
@@ -83,13 +191,61 @@ class ProductTypeQuestionViewSet(ProductTypeChildViewSet):
     lookup_url_kwarg = "question_id"
 
 
-class CategoryViewSet(OrderedModelViewSet):
+class CategoryViewSet(CatalogCacheMixin, ConditionalGetMixin, OrderedModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     lookup_url_kwarg = "id"
 
+    def set_subtree_published(self, published: bool):
+        category = self.get_object()
+        try:
+            category.set_subtree_published(published)
+        except DjangoValidationError as err:
+            raise ValidationError({"published": err.messages})
 
-class CategoryChildViewSet(OrderedModelViewSet):
+        return Response(self.get_serializer(category).data)
+
+    @extend_schema(request=None)
+    @action(detail=True, methods=["post"])
+    def publish(self, request, id=None):
+        return self.set_subtree_published(True)
+
+    @extend_schema(request=None)
+    @action(detail=True, methods=["post"])
+    def unpublish(self, request, id=None):
+        return self.set_subtree_published(False)
+
+    @extend_schema(
+        parameters=[CategoryTreeParameterSerializer],
+        responses=CategoryTreeSerializer(many=True),
+    )
+    @action(
+        detail=False,
+        serializer_class=CategoryTreeSerializer,
+        pagination_class=None,
+        filter_backends=(),
+    )
+    def tree(self, request):
+        return self.cached_response(partial(self.get_tree, request))
+
+    def get_tree(self, request):
+        parameters = CategoryTreeParameterSerializer(data=request.query_params)
+        parameters.is_valid(raise_exception=True)
+        root = parameters.validated_data.get("root")
+        depth = parameters.validated_data.get("depth")
+
+        # the tree is nested from a single path ordered query.
+        categories = Category.get_tree(root)
+        if depth is not None:
+            root_depth = root.depth if root else 1
+            categories = categories.filter(depth__lt=root_depth + depth)
+        categories = eager_load(categories, self.get_serializer())
+
+        serializer = self.get_serializer(Category.build_tree(categories), many=True)
+        return Response(serializer.data)
+
+
+class CategoryChildViewSet(CatalogCacheMixin, OrderedModelViewSet):
 
     def get_category(self):
         return get_object_or_404(Category, id=self.kwargs["category_id"])
@@ -107,19 +263,49 @@ class CategoryQuestionViewSet(CategoryChildViewSet):
     lookup_url_kwarg = "question_id"
 
 
-class ConditionViewSet(OrderedModelViewSet):
+class ConditionViewSet(CatalogCacheMixin, OrderedModelViewSet):
     queryset = Condition.objects.all()
     serializer_class = ConditionSerializer
     lookup_url_kwarg = "id"
 
 
-class TagViewSet(OrderedModelViewSet):
+class TagViewSet(CatalogCacheMixin, OrderedModelViewSet):
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     lookup_field = "id"
 
 
-class TagTypeViewSet(OrderedModelViewSet):
+class TagTypeViewSet(CatalogCacheMixin, OrderedModelViewSet):
     queryset = TagType.objects.all()
     serializer_class = TagTypeSerializer
     lookup_field = "id"
+
+
+class AutocompleteView(APIView):
+    """
+    Id/label suggestions for the product types, tags and organisations whose name
+    starts with or resembles the search term.
+    """
+
+    querysets = {
+        "producttypes": ProductType.objects.all(),
+        "tags": Tag.objects.all(),
+        "organisations": Organisation.objects.all(),
+    }
+
+    @extend_schema(
+        parameters=[AutocompleteParameterSerializer],
+        responses=AutocompleteSerializer,
+    )
+    def get(self, request):
+        parameters = AutocompleteParameterSerializer(data=request.query_params)
+        parameters.is_valid(raise_exception=True)
+        term = parameters.validated_data["q"]
+        limit = parameters.validated_data["limit"]
+
+        return Response(
+            {
+                key: autocomplete(queryset, term, limit=limit)
+                for key, queryset in self.querysets.items()
+            }
+        )
@@ -0,0 +1,57 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+def get_response_cache():
+    return caches[settings.API_CACHE]
+
+
+def _version_key(namespace: str) -> str:
+    return f"api_cache_version_{namespace}"
+
+
+def get_cache_version(namespace: str) -> int:
+    cache = get_response_cache()
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        cache.add(_version_key(namespace), 1, None)
+        version = cache.get(_version_key(namespace), 1)
+    return version
+
+
+def bump_cache_version(namespace: str):
+    """
+    Invalidates all cached responses of a namespace by moving to a new version,
+    the old entries expire on their own.
+    """
+    cache = get_response_cache()
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        cache.add(_version_key(namespace), 2, None)
+
+
+def _token_key(namespace: str) -> str:
+    return f"cache_token_{namespace}"
+
+
+def get_cache_token(namespace: str) -> str | None:
+    """
+    Returns the random token of a namespace, used to validate data cached outside
+    of the shared cache (e.g. in process memory). Unlike a version counter a token
+    never repeats after the shared cache is flushed.
+
+    ``None`` is returned when the shared cache is unavailable.
+    """
+    cache = get_response_cache()
+    token = cache.get(_token_key(namespace))
+    if token is None:
+        cache.add(_token_key(namespace), uuid.uuid4().hex, None)
+        token = cache.get(_token_key(namespace))
+    return token
+
+
+def reset_cache_token(namespace: str):
+    get_response_cache().set(_token_key(namespace), uuid.uuid4().hex, None)
@@ -0,0 +1,36 @@
+from django_filters import rest_framework as filters
+
+
+class CharInFilter(filters.BaseInFilter, filters.CharFilter):
+    pass
+
+
+class UUIDInFilter(filters.BaseInFilter, filters.UUIDFilter):
+    pass
+
+
+class ManyToManyFilter(UUIDInFilter):
+    """
+    Filters on the ids of the objects of a many-to-many field, or on a foreign key of
+    these objects with ``related_lookup``.
+
+    The objects are filtered with a subquery on the through table, as a join would
+    return a row for every matching relation.
+    """
+
+    def __init__(self, *args, related_lookup: str = "", **kwargs):
+        self.related_lookup = related_lookup
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+
+        field = qs.model._meta.get_field(self.field_name)
+        lookup = "__".join(
+            part
+            for part in (field.m2m_reverse_field_name(), self.related_lookup, "in")
+            if part
+        )
+        relations = field.remote_field.through.objects.filter(**{lookup: value})
+        return qs.filter(pk__in=relations.values(field.m2m_field_name()))
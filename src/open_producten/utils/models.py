@@ -1,11 +1,32 @@
-from uuid import uuid4
+import json
+import os
+import time
+from io import StringIO
+from uuid import UUID
 
-from django.db import models
+from django.db import connection, models
 from django.utils.translation import gettext_lazy as _
 
 
+def uuid7() -> UUID:
+    """
+    Generates a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits contain the unix timestamp in milliseconds, so new ids are
+    appended to the end of the primary key index instead of a random position.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+
+    # version 7 & RFC 4122 variant
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return UUID(int=value)
+
+
 class BaseModel(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     class Meta:
         abstract = True
@@ -30,3 +51,100 @@ class BasePublishableModel(BaseModel):
 
     class Meta:
         abstract = True
+
+
+def bulk_set_many_to_many(
+    field: models.ManyToManyField, values: dict
+) -> tuple[set, set]:
+    """
+    Sets the related objects of many objects at once, like calling ``set()`` on the
+    many-to-many field of every object. ``values`` maps the pks of the objects to
+    the pks of their related objects.
+
+    The current relations are read with a single query and the differences are
+    written with one delete and one insert on the through table. Returns the pks of
+    the related objects that were added and removed.
+    """
+    through = field.remote_field.through
+    source = through._meta.get_field(field.m2m_field_name())
+    target = through._meta.get_field(field.m2m_reverse_field_name())
+
+    current = {
+        (source_pk, target_pk): pk
+        for pk, source_pk, target_pk in through._default_manager.filter(
+            **{f"{source.name}__in": values}
+        ).values_list("pk", source.attname, target.attname)
+    }
+    desired = {
+        (source_pk, target_pk)
+        for source_pk, target_pks in values.items()
+        for target_pk in target_pks
+    }
+
+    removed = [relation for relation in current if relation not in desired]
+    added = [relation for relation in desired if relation not in current]
+
+    if removed:
+        through._default_manager.filter(
+            pk__in=[current[relation] for relation in removed]
+        ).delete()
+    if added:
+        through._default_manager.bulk_create(
+            [
+                through(**{source.attname: source_pk, target.attname: target_pk})
+                for source_pk, target_pk in added
+            ]
+        )
+
+    return (
+        {target_pk for _, target_pk in added},
+        {target_pk for _, target_pk in removed},
+    )
+
+
+def _copy_value(value) -> str:
+    """
+    Formats a value for the text format of ``COPY``.
+    """
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_insert(model: type[models.Model], objects: list, fields: tuple[str, ...]):
+    """
+    Inserts the objects with a single postgres ``COPY``, which is much faster than
+    an ``INSERT`` for large amounts of rows. Like ``bulk_create`` no signals are
+    sent and the values of the fields are used as is, so defaults like ``auto_now``
+    should be set on the objects.
+    """
+    if not objects:
+        return
+
+    model_fields = [model._meta.get_field(name) for name in fields]
+    buffer = StringIO()
+    for obj in objects:
+        buffer.write(
+            "\t".join(
+                _copy_value(getattr(obj, field.attname)) for field in model_fields
+            )
+        )
+        buffer.write("\n")
+    buffer.seek(0)
+
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(quote_name(field.column) for field in model_fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {quote_name(model._meta.db_table)} ({columns}) FROM STDIN", buffer
+        )
@@ -0,0 +1,120 @@
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+from .models import BasePublishableModel
+
+POSITION_SEPARATOR = "|"
+
+
+class OrderedCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the creation order of publishable models and on the id of
+    all other models. Deep pages cost the same as the first page because the
+    cursor position is looked up using the (created_on, id) or primary key index.
+
+    The position of the cursor holds the value of every ordering field, so rows
+    with the same creation time are told apart by their id instead of by an offset.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        if issubclass(queryset.model, BasePublishableModel):
+            return ("created_on", "id")
+        return ("id",)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, current_position = 0, False, None
+        else:
+            offset, reverse, current_position = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*(f"-{field}" for field in self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = queryset.filter(
+                self.get_position_filter(queryset.model, current_position, reverse)
+            )
+
+        # an extra item is fetched to determine if there is a following page.
+        end = offset + self.page_size + 1
+        results = list(queryset[offset:end])
+        self.page = results[: self.page_size]
+
+        following_position = None
+        if len(results) > len(self.page):
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = following_position is not None
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = current_position is not None or offset > 0
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_position_filter(self, model, position: str, reverse: bool) -> Q:
+        """
+        Compares the ordering fields with the position as a row, e.g.
+        ``created_on > x OR (created_on = x AND id > y)``. The range on the first
+        field is repeated on its own so it can be used as the index condition.
+        """
+        values = position.split(POSITION_SEPARATOR)
+        if len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            values = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+
+        lookup = "lt" if reverse else "gt"
+        condition = None
+        for field, value in reversed(list(zip(self.ordering, values))):
+            beyond = Q(**{f"{field}__{lookup}": value})
+            condition = (
+                beyond
+                if condition is None
+                else beyond | Q(**{field: value}) & condition
+            )
+        return Q(**{f"{self.ordering[0]}__{lookup}e": values[0]}) & condition
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for field in ordering:
+            value = (
+                instance[field]
+                if isinstance(instance, dict)
+                else getattr(instance, field)
+            )
+            values.append(
+                value.isoformat() if hasattr(value, "isoformat") else str(value)
+            )
+        return POSITION_SEPARATOR.join(values)
@@ -0,0 +1,119 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Prefetch
+
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+
+
+def _get_relation_path(model, source_attrs: list[str]):
+    """
+    Walks the source attrs of a serializer field over the model relations.
+
+    Returns the chain of single valued relations, the model the chain ends at and
+    the (attr, model) of the to-many relation that terminates the chain (if any).
+    """
+    path = []
+    for attr in source_attrs:
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+
+        if not model_field.is_relation:
+            break
+
+        if model_field.many_to_many or model_field.one_to_many:
+            return path, model, (attr, model_field.related_model)
+
+        path.append(attr)
+        model = model_field.related_model
+
+    return path, model, None
+
+
+def _build_plan(model, serializer, prefix: str, select: list, prefetch: list):
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+
+        if field.source == "*":
+            if isinstance(field, serializers.Serializer):
+                _build_plan(model, field, prefix, select, prefetch)
+            continue
+
+        path, related_model, to_many = _get_relation_path(model, field.source_attrs)
+
+        if to_many is not None:
+            attr, to_many_model = to_many
+            lookup = prefix + "__".join(path + [attr])
+            queryset = to_many_model._default_manager.all()
+
+            if isinstance(field, serializers.ListSerializer):
+                queryset = eager_load(queryset, field.child)
+            elif isinstance(field, ManyRelatedField) and isinstance(
+                field.child_relation, PrimaryKeyRelatedField
+            ):
+                queryset = queryset.only("pk")
+
+            prefetch.append(Prefetch(lookup, queryset=queryset))
+            continue
+
+        if not path:
+            continue
+
+        # PrimaryKeyRelatedField only reads the foreign key column.
+        if isinstance(field, PrimaryKeyRelatedField) and len(field.source_attrs) == 1:
+            continue
+
+        select.append(prefix + "__".join(path))
+
+        if isinstance(field, serializers.Serializer) and len(path) == len(
+            field.source_attrs
+        ):
+            _build_plan(
+                related_model, field, prefix + "__".join(path) + "__", select, prefetch
+            )
+
+
+def eager_load(queryset: models.QuerySet, serializer) -> models.QuerySet:
+    """
+    Adds the select_related & prefetch_related calls that are needed to render the
+    (nested) fields of a serializer to the queryset.
+    """
+    select, prefetch = [], []
+    _build_plan(queryset.model, serializer, "", select, prefetch)
+
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+def only_serialized_fields(queryset: models.QuerySet, serializer) -> models.QuerySet:
+    """
+    Limits the selected columns to the model fields rendered by the serializer.
+
+    The queryset is returned unchanged when a field is not backed by a model field
+    (e.g. a property), as it is unknown which columns it depends on.
+    """
+    model = queryset.model
+    only = {model._meta.pk.name}
+
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+
+        if field.source == "*":
+            return queryset
+
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            return queryset
+
+        if model_field.concrete:
+            only.add(model_field.name)
+
+    return queryset.only(*only)
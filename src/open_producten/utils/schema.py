@@ -0,0 +1,20 @@
+from drf_spectacular import plumbing
+
+
+def get_lib_doc_excludes():
+    """
+    Excludes the docstrings of the mixins from the descriptions of the schema, they
+    describe the implementation instead of the api.
+    """
+    from open_producten.producttypes.serializers.category import CategoryLineageMixin
+
+    from .serializers import DynamicFieldsSerializerMixin
+    from .views import CachedResponseMixin, ConditionalGetMixin
+
+    return [
+        *plumbing.get_lib_doc_excludes(),
+        CachedResponseMixin,
+        ConditionalGetMixin,
+        CategoryLineageMixin,
+        DynamicFieldsSerializerMixin,
+    ]
@@ -0,0 +1,41 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import models
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Upper
+
+
+def trigram_index(field: str, name: str) -> GinIndex:
+    """
+    Trigram index on the upper cased value of a field.
+
+    Indexing ``UPPER(field)`` lets the index be used for the ``icontains`` &
+    ``istartswith`` lookups (e.g. the admin search fields) as well as for trigram
+    similarity queries.
+    """
+    return GinIndex(OpClass(Upper(field), name="gin_trgm_ops"), name=name)
+
+
+def autocomplete(
+    queryset: models.QuerySet, term: str, field: str = "name", limit: int = 10
+) -> list[dict]:
+    """
+    Returns the id & label of the objects whose field starts with or is similar to
+    the term. Prefix matches are ordered before fuzzy matches, which are ordered by
+    their similarity.
+    """
+    term = term.upper()
+    prefix_match = Q(search_label__startswith=term)
+
+    return list(
+        queryset.alias(search_label=Upper(field))
+        .filter(prefix_match | Q(search_label__trigram_similar=term))
+        .annotate(
+            is_prefix_match=Case(
+                When(prefix_match, then=Value(True)), default=Value(False)
+            ),
+            similarity=TrigramSimilarity("search_label", term),
+        )
+        .order_by("-is_prefix_match", "-similarity", field, "id")
+        .values("id", label=F(field))[:limit]
+    )
@@ -1,6 +1,13 @@
+from collections.abc import Mapping
 from uuid import UUID
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.forms.models import model_to_dict
+from django.utils.encoding import smart_str
+
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.relations import MANY_RELATION_KWARGS, ManyRelatedField
 
 from .models import BaseModel
 
@@ -29,3 +36,319 @@ def model_to_dict_with_related_ids(model: BaseModel) -> dict:
             model_dict[f"{k}_id"] = model_dict.pop(k)
 
     return model_dict
+
+
+def _get_query_param_set(request, name: str) -> set[str] | None:
+    if name not in request.query_params:
+        return None
+    return {value for value in request.query_params[name].split(",") if value}
+
+
+class DynamicFieldsSerializerMixin:
+    """
+    Limits the fields of the top level serializer of a GET request with the
+    ``fields`` query parameter, and the nested serializers with ``expand``.
+    The ``optional_fields`` are only rendered when they are requested with
+    ``include``, which does not limit the other fields.
+
+    Fields that are not rendered are also left out of the queryset by
+    ``OrderedModelViewSet``.
+    """
+
+    optional_fields: tuple[str, ...] = ()
+
+    @property
+    def is_root_serializer(self) -> bool:
+        if isinstance(self.parent, serializers.ListSerializer):
+            return self.parent.parent is None
+        return self.parent is None
+
+    @property
+    def requested_fields(self) -> set[str] | None:
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        return _get_query_param_set(request, "fields")
+
+    @property
+    def expanded_fields(self) -> set[str] | None:
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        return _get_query_param_set(request, "expand")
+
+    @property
+    def included_fields(self) -> set[str]:
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return set()
+        return _get_query_param_set(request, "include") or set()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        included_fields = self.included_fields
+
+        for name in self.optional_fields:
+            if not self.is_root_serializer or name not in included_fields:
+                fields.pop(name)
+
+        if not self.is_root_serializer:
+            return fields
+
+        requested_fields = self.requested_fields
+        expanded_fields = self.expanded_fields
+
+        for name, field in list(fields.items()):
+            if name in self.optional_fields:
+                continue
+
+            expanded = expanded_fields is None or name in expanded_fields
+
+            if isinstance(field, serializers.BaseSerializer) and not expanded:
+                fields.pop(name)
+            elif requested_fields is not None and name not in requested_fields:
+                if expanded_fields is None or name not in expanded_fields:
+                    fields.pop(name)
+
+        return fields
+
+
+class BulkRelatedFieldMixin:
+    """
+    Resolves related objects in bulk: a list of values (``many=True``) is resolved
+    with a single query and ``PrefetchRelatedListSerializer`` resolves the values of
+    all of its items at once into ``prefetched_objects``. A single value is
+    resolved with its own query otherwise.
+    """
+
+    lookup_field = "pk"
+    prefetched_objects: dict | None = None
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
+
+    def get_lookup_name(self) -> str:
+        return self.lookup_field
+
+    def get_lookup_value(self, data):
+        if isinstance(data, bool):
+            raise TypeError
+        opts = self.get_queryset().model._meta
+        model_field = (
+            opts.pk if self.lookup_field == "pk" else opts.get_field(self.lookup_field)
+        )
+        return model_field.to_python(data)
+
+    def resolve(self, values) -> dict:
+        """
+        Fetches the objects of the valid values with one query, by lookup value.
+        """
+        lookup_values = set()
+        for value in values:
+            try:
+                lookup_values.add(self.get_lookup_value(value))
+            except (TypeError, ValueError, DjangoValidationError):
+                continue
+
+        if not lookup_values:
+            return {}
+
+        return {
+            getattr(obj, self.lookup_field): obj
+            for obj in self.get_queryset().filter(
+                **{f"{self.lookup_field}__in": lookup_values}
+            )
+        }
+
+    def prefetch(self, values):
+        self.prefetched_objects = self.resolve(values)
+
+    def to_internal_value(self, data):
+        if self.prefetched_objects is None:
+            return super().to_internal_value(data)
+
+        try:
+            return self.prefetched_objects[self.get_lookup_value(data)]
+        except KeyError:
+            self.fail_does_not_exist(data)
+        except (TypeError, ValueError):
+            self.fail_invalid(data)
+
+
+class BulkManyRelatedField(ManyRelatedField):
+    """
+    Resolves all values of the list with one query and reports every missing
+    object with its index.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        relation = self.child_relation
+        objects = relation.prefetched_objects
+        if objects is None:
+            objects = relation.resolve(data)
+
+        model_name = relation.get_queryset().model.__name__
+        resolved, errors = [], []
+        for index, value in enumerate(data):
+            try:
+                resolved.append(objects[relation.get_lookup_value(value)])
+            except KeyError:
+                errors.append(
+                    serializers.ErrorDetail(
+                        f"{model_name} {relation.get_lookup_name()} {value} "
+                        f"at index {index} does not exist",
+                        code="does_not_exist",
+                    )
+                )
+            except (TypeError, ValueError):
+                try:
+                    relation.fail_invalid(value)
+                except serializers.ValidationError as exc:
+                    errors.extend(exc.detail)
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return resolved
+
+
+class BulkPrimaryKeyRelatedField(
+    BulkRelatedFieldMixin, serializers.PrimaryKeyRelatedField
+):
+    def get_lookup_name(self) -> str:
+        return "id"
+
+    def fail_does_not_exist(self, data):
+        self.fail("does_not_exist", pk_value=data)
+
+    def fail_invalid(self, data):
+        self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+class BulkSlugRelatedField(BulkRelatedFieldMixin, serializers.SlugRelatedField):
+    def __init__(self, slug_field=None, **kwargs):
+        super().__init__(slug_field, **kwargs)
+        self.lookup_field = self.slug_field
+
+    def fail_does_not_exist(self, data):
+        self.fail("does_not_exist", slug_name=self.slug_field, value=smart_str(data))
+
+    def fail_invalid(self, data):
+        self.fail("invalid")
+
+
+class PrefetchRelatedListSerializer(serializers.ListSerializer):
+    """
+    Validates a list of objects, the related objects of the ``Bulk*RelatedField``
+    fields are fetched with one query per field for all items. The related objects
+    of nested lists of this class are fetched for the items of all parents at once.
+    """
+
+    related_objects_prefetched = False
+
+    def to_internal_value(self, data):
+        if isinstance(data, list) and not self.related_objects_prefetched:
+            self.prefetch_related_objects(
+                [item for item in data if isinstance(item, Mapping)]
+            )
+        return super().to_internal_value(data)
+
+    def prefetch_related_objects(self, items: list[Mapping]):
+        for field in self.child.fields.values():
+            if field.read_only:
+                continue
+
+            if isinstance(field, PrefetchRelatedListSerializer):
+                field.prefetch_related_objects(
+                    [
+                        nested_item
+                        for item in items
+                        if isinstance(item.get(field.field_name), list)
+                        for nested_item in item[field.field_name]
+                        if isinstance(nested_item, Mapping)
+                    ]
+                )
+                field.related_objects_prefetched = True
+                continue
+
+            many = isinstance(field, ManyRelatedField)
+            relation = field.child_relation if many else field
+            if not isinstance(relation, BulkRelatedFieldMixin):
+                continue
+
+            values = []
+            for item in items:
+                value = item.get(field.field_name)
+                if many and isinstance(value, list):
+                    values.extend(value)
+                elif not many and value is not None:
+                    values.append(value)
+            relation.prefetch(values)
+
+
+class BulkListSerializer(PrefetchRelatedListSerializer):
+    """
+    Validates a list of objects for a bulk create or update. Items with an ``id``
+    update the existing object, which is added to their validated data as
+    ``instance``. The existing objects are fetched with a single query.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            self.prefetch_instances(
+                [item for item in data if isinstance(item, Mapping)]
+            )
+        return super().to_internal_value(data)
+
+    def prefetch_instances(self, items: list[Mapping]):
+        model = self.child.Meta.model
+        ids = set()
+        for item in items:
+            try:
+                ids.add(model._meta.pk.to_python(item["id"]))
+            except (KeyError, TypeError, ValueError, DjangoValidationError):
+                continue
+
+        self.instances = model._default_manager.in_bulk(ids)
+
+    def get_instance(self, data):
+        if not isinstance(data, Mapping) or data.get("id") is None:
+            return None
+
+        try:
+            instance = self.instances.get(
+                self.child.Meta.model._meta.pk.to_python(data["id"])
+            )
+        except (TypeError, ValueError, DjangoValidationError):
+            instance = None
+
+        if instance is None:
+            message = serializers.PrimaryKeyRelatedField.default_error_messages[
+                "does_not_exist"
+            ].format(pk_value=data["id"])
+            raise serializers.ValidationError(
+                {"id": [serializers.ErrorDetail(message, code="does_not_exist")]}
+            )
+        return instance
+
+    def run_child_validation(self, data):
+        instance = self.get_instance(data)
+
+        self.child.instance = instance
+        self.child.initial_data = data
+        try:
+            validated_data = super().run_child_validation(data)
+        finally:
+            self.child.instance = None
+
+        validated_data["instance"] = instance
+        return validated_data
@@ -1,3 +1,5 @@
+from django.core.cache import caches
+
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
@@ -8,6 +10,7 @@ class BaseApiTestCase(APITestCase):
     path: str
 
     def setUp(self):
+        caches["default"].clear()
         user = User.objects.create_user(username="testuser", password="testpassword")
         token = Token.objects.create(user=user)
         self.client.credentials(HTTP_AUTHORIZATION="Token " + token.key)
@@ -0,0 +1,30 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from ..models import uuid7
+
+
+class TestUUID7(TestCase):
+
+    def test_uuid7_has_version_and_variant(self):
+        value = uuid7()
+
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, "specified in RFC 4122")
+
+    def test_uuid7_starts_with_timestamp(self):
+        with patch("open_producten.utils.models.time.time_ns") as mock_time:
+            mock_time.return_value = 1_700_000_000_123_000_000
+            value = uuid7()
+
+        self.assertEqual(value.int >> 80, 1_700_000_000_123)
+
+    def test_uuid7_is_ordered_by_time(self):
+        with patch("open_producten.utils.models.time.time_ns") as mock_time:
+            ids = []
+            for ms in range(10):
+                mock_time.return_value = (1_700_000_000_000 + ms) * 1_000_000
+                ids.append(uuid7())
+
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), 10)
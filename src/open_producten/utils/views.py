@@ -1,10 +1,24 @@
+import hashlib
+from functools import partial
+
 from django import http
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Count, F, Max
 from django.template import TemplateDoesNotExist, loader
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME
 
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from .cache import get_cache_version, get_response_cache
+from .pagination import OrderedCursorPagination
+from .prefetch import eager_load, only_serialized_fields
+
 
 @requires_csrf_token
 def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
@@ -28,5 +42,158 @@ def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
 
 
 class OrderedModelViewSet(ModelViewSet):
+    cursor_pagination_class = OrderedCursorPagination
+
+    @property
+    def paginator(self):
+        """
+        Uses cursor pagination when the client requests ``?pagination=cursor``.
+        """
+        if not hasattr(self, "_paginator"):
+            if (
+                self.request is not None
+                and self.request.query_params.get("pagination") == "cursor"
+            ):
+                self._paginator = self.cursor_pagination_class()
+            else:
+                return super().paginator
+        return self._paginator
+
     def get_queryset(self):
-        return self.queryset.order_by("id")
+        queryset = self.queryset.order_by("id")
+
+        if self.request is not None and self.request.method in SAFE_METHODS:
+            serializer = self.get_serializer()
+            queryset = eager_load(queryset, serializer)
+
+            if getattr(serializer, "requested_fields", None) is not None:
+                queryset = only_serialized_fields(queryset, serializer)
+        return queryset
+
+
+class ConditionalGetMixin:
+    """
+    Adds ETag & Last-Modified headers to list and detail responses and answers
+    conditional requests with a 304 before the queryset is serialized.
+
+    The version of an object is given by ``last_modified_expression``, the version
+    of a list by the latest version and the number of objects in the queryset.
+    """
+
+    last_modified_expression = F("updated_on")
+
+    def get_validators(self, queryset) -> tuple[str | None, int | None]:
+        try:
+            validators = queryset.order_by().aggregate(
+                last_modified=Max(self.last_modified_expression), count=Count("pk")
+            )
+        except (TypeError, ValueError, ValidationError):
+            return None, None
+
+        if validators["last_modified"] is None:
+            return None, None
+
+        last_modified = validators["last_modified"]
+        version = "{}:{}:{}".format(
+            last_modified.isoformat(),
+            validators["count"],
+            self.request.get_full_path(),
+        )
+        etag = '"{}"'.format(hashlib.md5(version.encode()).hexdigest())
+        return etag, int(last_modified.timestamp())
+
+    def get_not_modified_response(self, etag, last_modified):
+        if etag is None:
+            return None
+        return get_conditional_response(
+            self.request, etag=etag, last_modified=last_modified
+        )
+
+    def add_validators(self, response, etag, last_modified):
+        if etag is not None and response.status_code == 200:
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        validators = self.get_validators(self.filter_queryset(self.get_queryset()))
+
+        if not_modified := self.get_not_modified_response(*validators):
+            return not_modified
+        return self.add_validators(super().list(request, *args, **kwargs), *validators)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        validators = self.get_validators(queryset)
+
+        if not_modified := self.get_not_modified_response(*validators):
+            return not_modified
+        return self.add_validators(
+            super().retrieve(request, *args, **kwargs), *validators
+        )
+
+
+class CachedResponseMixin:
+    """
+    Caches the data of list and detail responses per path, query and user in the
+    ``API_CACHE``. All responses of ``cache_namespace`` are invalidated at once
+    with ``bump_cache_version``.
+    """
+
+    cache_namespace: str
+    cached_headers = ("ETag", "Last-Modified")
+
+    def get_cache_scope(self) -> str:
+        return str(self.request.user.pk)
+
+    def get_cache_key(self, *key_parts: str) -> str:
+        """
+        The ``key_parts`` are the values besides the request that the response
+        depends on, e.g. the current date.
+        """
+        path = hashlib.md5(
+            "|".join((self.request.get_full_path(), *key_parts)).encode()
+        ).hexdigest()
+        return "api_response_{}_{}_{}_{}".format(
+            self.cache_namespace,
+            get_cache_version(self.cache_namespace),
+            self.get_cache_scope(),
+            path,
+        )
+
+    def cached_response(self, get_response, *key_parts: str):
+        cache = get_response_cache()
+        key = self.get_cache_key(*key_parts)
+
+        if cached := cache.get(key):
+            data, headers = cached
+
+            if etag := headers.get("ETag"):
+                not_modified = get_conditional_response(
+                    self.request,
+                    etag=etag,
+                    last_modified=parse_http_date_safe(headers.get("Last-Modified")),
+                )
+                if not_modified is not None:
+                    return not_modified
+
+            return Response(data, headers=headers)
+
+        response = get_response()
+        if response.status_code == 200:
+            headers = {
+                header: response[header]
+                for header in self.cached_headers
+                if header in response
+            }
+            cache.set(key, (response.data, headers), settings.API_CACHE_TIMEOUT)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(partial(super().list, request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(partial(super().retrieve, request, *args, **kwargs))